@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ai_writing.openai_client import OpenAIWritingClient
+from local_crypto import KEY_SIZE, load_or_create_key, seal, unseal
+
+CACHE_MAGIC = b"MYDEMANDS_AI_CACHE_V1"
+DEFAULT_MEMORY_ENTRIES = 128
+DEFAULT_TTL_SECONDS = 24 * 3600
+
+
+class SuggestionCache:
+    """Cache de sugestões da IA: LRU em memória e, opcionalmente, SQLite criptografado com validade.
+
+    A chave é um HMAC de (modelo, temperatura, instrução, texto saneado, contexto), então o
+    texto de entrada nunca vira chave legível. Fora do modo privacidade o texto de entrada
+    também é gravado (criptografado) no disco; no modo privacidade só o hash é guardado.
+    """
+
+    def __init__(
+        self,
+        base_dir: Optional[str] = None,
+        *,
+        persistent: bool = False,
+        privacy_mode: bool = True,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ):
+        self.privacy_mode = privacy_mode
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_entries = max(1, int(max_entries))
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._con: Optional[sqlite3.Connection] = None
+        if persistent and base_dir:
+            self.db_path = os.path.join(base_dir, "ai_writing_cache.sqlite3")
+            self.key_path = os.path.join(base_dir, ".ai_writing_cache.key")
+            self._key = load_or_create_key(self.key_path)
+            self._con = self._open_connection()
+        else:
+            # Só memória: a chave vive enquanto o processo viver.
+            self._key = os.urandom(KEY_SIZE)
+
+    def key_for(self, model: str, temperature: float, instruction: str, text: str, context: Optional[Dict[str, Any]]) -> str:
+        canonical = json.dumps(
+            [model, float(temperature), instruction, OpenAIWritingClient.sanitize_text(text), context or {}],
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hmac.new(self._key, canonical.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    return entry[1]
+                del self._memory[key]
+            if self._con is None:
+                return None
+            row = self._con.execute(
+                "SELECT suggestion, expires_at FROM suggestions WHERE key_hash = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                with self._con:
+                    self._con.execute("DELETE FROM suggestions WHERE key_hash = ?", (key,))
+                return None
+            try:
+                suggestion = self._decrypt(row[0]).decode("utf-8")
+            except ValueError:
+                return None
+            self._remember(key, row[1], suggestion)
+            return suggestion
+
+    def put(self, key: str, suggestion: str, input_text: str = "") -> None:
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._remember(key, expires_at, suggestion)
+            if self._con is None:
+                return
+            source = None if self.privacy_mode else self._encrypt(input_text.encode("utf-8"))
+            with self._con:
+                self._con.execute(
+                    """
+                    INSERT INTO suggestions (key_hash, input_text, suggestion, expires_at) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(key_hash) DO UPDATE SET
+                        input_text = excluded.input_text,
+                        suggestion = excluded.suggestion,
+                        expires_at = excluded.expires_at
+                    """,
+                    (key, source, self._encrypt(suggestion.encode("utf-8")), expires_at),
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._con is not None:
+                with self._con:
+                    self._con.execute("DELETE FROM suggestions")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
+
+    def _remember(self, key: str, expires_at: float, suggestion: str) -> None:
+        self._memory[key] = (expires_at, suggestion)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _open_connection(self) -> sqlite3.Connection:
+        con = sqlite3.connect(self.db_path, check_same_thread=False)
+        with con:
+            con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS suggestions (
+                    key_hash TEXT PRIMARY KEY,
+                    input_text TEXT,
+                    suggestion TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+            con.execute("CREATE INDEX IF NOT EXISTS idx_suggestions_expires_at ON suggestions (expires_at)")
+            con.execute("DELETE FROM suggestions WHERE expires_at <= ?", (time.time(),))
+            if self.privacy_mode:
+                con.execute("UPDATE suggestions SET input_text = NULL WHERE input_text IS NOT NULL")
+        return con
+
+    def _encrypt(self, plain: bytes) -> str:
+        return seal(self._key, CACHE_MAGIC, plain).decode("ascii")
+
+    def _decrypt(self, record: str) -> bytes:
+        return unseal(self._key, CACHE_MAGIC, record.encode("ascii"), "Falha de integridade no cache da IA")
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional
 
 PANEL_CLASS = None
 
 
 class AIFieldBinding:
-    def __init__(self, text_widget: Any, context_provider: Callable[[], Dict[str, Any]], generate_handler):
+    def __init__(
+        self,
+        text_widget: Any,
+        context_provider: Callable[[], Dict[str, Any]],
+        generate_handler,
+        panel_options: Optional[Callable[[], Dict[str, Any]]] = None,
+    ):
         self.text_widget = text_widget
         self.context_provider = context_provider
         self.generate_handler = generate_handler
+        # Lido a cada abertura, para refletir as configurações atuais da IA.
+        self.panel_options = panel_options
         self._last_original = ""
 
     def open_panel(self, parent=None):
@@ -22,7 +30,8 @@ class AIFieldBinding:
             from ai_writing.ui_panel import AIWritingPanel
             PANEL_CLASS = AIWritingPanel
 
-        panel = PANEL_CLASS(source, self.generate_handler, self.context_provider(), parent=parent)
+        options = self.panel_options() if self.panel_options is not None else {}
+        panel = PANEL_CLASS(source, self.generate_handler, self.context_provider(), parent=parent, **options)
         if panel.exec() != panel.Accepted:
             return
 
@@ -39,10 +48,15 @@ class AIFieldBinding:
             self.text_widget.setPlainText(self._last_original)
 
 
-def attach_ai_writing(text_widget: Any, context_provider: Callable[[], Dict[str, Any]], generate_handler):
+def attach_ai_writing(
+    text_widget: Any,
+    context_provider: Callable[[], Dict[str, Any]],
+    generate_handler,
+    panel_options: Optional[Callable[[], Dict[str, Any]]] = None,
+):
     from PySide6.QtWidgets import QHBoxLayout, QPushButton, QWidget
 
-    binding = AIFieldBinding(text_widget, context_provider, generate_handler)
+    binding = AIFieldBinding(text_widget, context_provider, generate_handler, panel_options)
     wrapper = QWidget()
     layout = QHBoxLayout(wrapper)
     layout.setContentsMargins(0, 0, 0, 0)
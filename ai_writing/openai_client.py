@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import os
 import random
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 try:
     from openai import OpenAI
 except ModuleNotFoundError:  # pragma: no cover - depende do ambiente da máquina
     OpenAI = None
 
+# Eventos que encerram uma resposta em streaming; só o primeiro indica sucesso.
+STREAM_TERMINAL_EVENTS = ("response.completed", "response.failed", "response.incomplete", "error")
+
 
 class AIWritingError(RuntimeError):
     pass
@@ -23,6 +27,10 @@ class MissingOpenAIDependencyError(AIWritingError):
     pass
 
 
+class AIWritingCancelled(AIWritingError):
+    pass
+
+
 class OpenAIWritingClient:
     def __init__(
         self,
@@ -31,6 +39,7 @@ class OpenAIWritingClient:
         temperature: float = 0.3,
         timeout: float = 30.0,
         max_retries: int = 5,
+        base_url: Optional[str] = None,
     ):
         self.model = model
         self.temperature = float(temperature)
@@ -41,14 +50,21 @@ class OpenAIWritingClient:
             self.client = None
             return
 
-        self.client = OpenAI(api_key=self._api_key) if self._api_key else OpenAI()
+        options: Dict[str, Any] = {"base_url": base_url} if base_url else {}
+        self.client = OpenAI(api_key=self._api_key, **options) if self._api_key else OpenAI(**options)
+
+    def close(self) -> None:
+        """Fecha o pool de conexões HTTP do cliente."""
+        close = getattr(self.client, "close", None)
+        if callable(close):
+            close()
 
     @staticmethod
     def sanitize_text(text: str) -> str:
         cleaned = (text or "").replace("\x00", " ").strip()
         return cleaned[:4000]
 
-    def suggest(self, input_text: str, instruction: str, context: Optional[Dict[str, Any]] = None) -> str:
+    def _prepare(self, input_text: str, instruction: str, context: Optional[Dict[str, Any]]) -> List[Dict[str, str]]:
         if self.client is None:
             raise MissingOpenAIDependencyError(
                 "Dependência 'openai' não encontrada. Instale com: pip install openai"
@@ -61,7 +77,7 @@ class OpenAIWritingClient:
         if not sanitized:
             raise AIWritingError("Texto vazio para sugestão.")
 
-        payload = [
+        return [
             {"role": "system", "content": instruction},
             {
                 "role": "user",
@@ -69,6 +85,35 @@ class OpenAIWritingClient:
             },
         ]
 
+    def _retry_or_raise(self, exc: Exception, attempt: int) -> None:
+        """Espera para uma nova tentativa quando o erro é transitório; senão levanta o erro traduzido."""
+        message = str(exc).lower()
+        status_code = getattr(exc, "status_code", None)
+
+        if "api key" in message and ("missing" in message or "not set" in message or "401" in message):
+            raise MissingAPIKeyError("Chave não configurada") from exc
+
+        should_retry = False
+        if status_code == 429 or "429" in message or "rate limit" in message:
+            should_retry = True
+        elif status_code and int(status_code) >= 500:
+            should_retry = True
+        elif any(token in message for token in ["timeout", "temporar", "connection reset", "service unavailable"]):
+            should_retry = True
+
+        if should_retry and attempt < self.max_retries:
+            base = min(2 ** attempt, 16)
+            jitter = random.uniform(0, 0.25)
+            time.sleep(base + jitter)
+            return
+
+        if status_code and int(status_code) < 500 and int(status_code) != 429:
+            raise AIWritingError("Falha ao gerar sugestão (erro de requisição).") from exc
+        raise AIWritingError("Falha ao gerar sugestão (ver logs)") from exc
+
+    def suggest(self, input_text: str, instruction: str, context: Optional[Dict[str, Any]] = None) -> str:
+        payload = self._prepare(input_text, instruction, context)
+
         attempt = 0
         while True:
             try:
@@ -83,27 +128,100 @@ class OpenAIWritingClient:
                     return output_text
                 raise AIWritingError("Resposta sem conteúdo textual.")
             except Exception as exc:
-                message = str(exc).lower()
-                status_code = getattr(exc, "status_code", None)
                 attempt += 1
+                self._retry_or_raise(exc, attempt)
 
-                if "api key" in message and ("missing" in message or "not set" in message or "401" in message):
-                    raise MissingAPIKeyError("Chave não configurada") from exc
-
-                should_retry = False
-                if status_code == 429 or "429" in message or "rate limit" in message:
-                    should_retry = True
-                elif status_code and int(status_code) >= 500:
-                    should_retry = True
-                elif any(token in message for token in ["timeout", "temporar", "connection reset", "service unavailable"]):
-                    should_retry = True
-
-                if should_retry and attempt < self.max_retries:
-                    base = min(2 ** attempt, 16)
-                    jitter = random.uniform(0, 0.25)
-                    time.sleep(base + jitter)
-                    continue
-
-                if status_code and int(status_code) < 500 and int(status_code) != 429:
-                    raise AIWritingError("Falha ao gerar sugestão (erro de requisição).") from exc
-                raise AIWritingError("Falha ao gerar sugestão (ver logs)") from exc
+    def suggest_stream(
+        self,
+        input_text: str,
+        instruction: str,
+        context: Optional[Dict[str, Any]] = None,
+        *,
+        on_delta: Callable[[str], None],
+        on_final: Optional[Callable[[str], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> str:
+        """Como suggest(), mas repassa cada trecho a on_delta assim que chega.
+
+        on_final recebe o texto completo quando a resposta termina. Se cancel_event for
+        sinalizado, a conexão é fechada e AIWritingCancelled é levantado. Só há nova
+        tentativa enquanto nenhum trecho tiver sido entregue.
+        """
+        payload = self._prepare(input_text, instruction, context)
+
+        attempt = 0
+        while True:
+            parts: List[str] = []
+            try:
+                stream = self.client.responses.create(
+                    model=self.model,
+                    input=payload,
+                    temperature=self.temperature,
+                    timeout=self.timeout,
+                    stream=True,
+                )
+                terminal = ""
+                try:
+                    for event in stream:
+                        if cancel_event is not None and cancel_event.is_set():
+                            raise AIWritingCancelled("Geração cancelada.")
+                        event_type = getattr(event, "type", "")
+                        if event_type == "response.output_text.delta":
+                            delta = getattr(event, "delta", "") or ""
+                            if delta:
+                                parts.append(delta)
+                                on_delta(delta)
+                        elif event_type in STREAM_TERMINAL_EVENTS:
+                            terminal = event_type
+                            break
+                finally:
+                    stream.close()
+                if terminal != "response.completed":
+                    # Resposta truncada ou com erro: não vira sugestão (nem entra no cache).
+                    raise AIWritingError(f"Resposta incompleta da IA ({terminal or 'stream encerrado sem conclusão'}).")
+                output_text = "".join(parts).strip()
+                if not output_text:
+                    raise AIWritingError("Resposta sem conteúdo textual.")
+                if on_final is not None:
+                    on_final(output_text)
+                return output_text
+            except AIWritingError:
+                raise
+            except Exception as exc:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise AIWritingCancelled("Geração cancelada.") from exc
+                if parts:
+                    raise AIWritingError("Falha ao gerar sugestão (ver logs)") from exc
+                attempt += 1
+                self._retry_or_raise(exc, attempt)
+
+
+class WritingClientPool:
+    """Um OpenAIWritingClient por configuração (modelo, temperatura), reaproveitado entre gerações.
+
+    O cliente HTTP do SDK mantém as conexões abertas (keep-alive), então gerações seguidas
+    não repetem conexão e handshake TLS. reset() descarta tudo, por exemplo quando as
+    configurações da IA são salvas.
+    """
+
+    def __init__(self, factory=OpenAIWritingClient, **client_options: Any):
+        self._factory = factory
+        self._client_options = client_options
+        self._clients: Dict[Tuple[str, float], OpenAIWritingClient] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model: str, temperature: float) -> OpenAIWritingClient:
+        key = (model, float(temperature))
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._factory(model=model, temperature=float(temperature), **self._client_options)
+                self._clients[key] = client
+            return client
+
+    def reset(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
@@ -13,6 +13,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QMessageBox,
     QPushButton,
+    QSpinBox,
     QVBoxLayout,
     QDoubleSpinBox,
 )
@@ -25,11 +26,15 @@ from ai_writing.openai_client import OpenAIWritingClient
 class AISettings:
     enabled: bool = True
     show_chips: bool = True
+    prefetch_actions: bool = False
     model: str = "gpt-5.2"
     temperature: float = 0.3
     log_channel: str = "sqlite"
     privacy_mode: bool = True
     debug_log_text: bool = False
+    cache_enabled: bool = True
+    cache_persistent: bool = False
+    cache_ttl_hours: int = 24
 
 
 class AISettingsStore:
@@ -66,19 +71,28 @@ class AISettingsDialog(QDialog):
         self.show_chips = QCheckBox("Mostrar chips de ação")
         self.show_chips.setChecked(self._settings.show_chips)
 
+        self.prefetch_actions = QCheckBox("Pré-gerar todas as ações ao abrir o painel (mais requisições)")
+        self.prefetch_actions.setChecked(self._settings.prefetch_actions)
+
         self.privacy_mode = QCheckBox("Modo privacidade (não registrar texto completo)")
         self.privacy_mode.setChecked(self._settings.privacy_mode)
 
         self.debug_log_text = QCheckBox("Modo debug de auditoria (registrar texto)")
         self.debug_log_text.setChecked(self._settings.debug_log_text)
 
+        self.cache_enabled = QCheckBox("Reaproveitar sugestões já geradas (cache)")
+        self.cache_enabled.setChecked(self._settings.cache_enabled)
+
+        self.cache_persistent = QCheckBox("Manter cache em disco (criptografado)")
+        self.cache_persistent.setChecked(self._settings.cache_persistent)
+
         checkbox_checked_style = """
             QCheckBox::indicator:checked {
                 background-color: #000000;
                 border: 1px solid #000000;
             }
         """
-        for checkbox in (self.enabled, self.show_chips, self.privacy_mode, self.debug_log_text):
+        for checkbox in (self.enabled, self.show_chips, self.prefetch_actions, self.privacy_mode, self.debug_log_text, self.cache_enabled, self.cache_persistent):
             checkbox.setStyleSheet(checkbox_checked_style)
 
         self.model = QComboBox()
@@ -90,6 +104,11 @@ class AISettingsDialog(QDialog):
         self.temperature.setSingleStep(0.1)
         self.temperature.setValue(float(self._settings.temperature))
 
+        self.cache_ttl_hours = QSpinBox()
+        self.cache_ttl_hours.setRange(1, 24 * 30)
+        self.cache_ttl_hours.setSuffix(" h")
+        self.cache_ttl_hours.setValue(int(self._settings.cache_ttl_hours))
+
         self.key_status = QLabel(self._key_status_text())
 
         test_btn = QPushButton("Testar conexão")
@@ -104,6 +123,7 @@ class AISettingsDialog(QDialog):
         form.addRow("Status da chave", self.key_status)
         form.addRow("Modelo", self.model)
         form.addRow("Temperatura", self.temperature)
+        form.addRow("Validade do cache", self.cache_ttl_hours)
 
         buttons = QHBoxLayout()
         buttons.addStretch()
@@ -114,8 +134,11 @@ class AISettingsDialog(QDialog):
         layout = QVBoxLayout(self)
         layout.addWidget(self.enabled)
         layout.addWidget(self.show_chips)
+        layout.addWidget(self.prefetch_actions)
         layout.addWidget(self.privacy_mode)
         layout.addWidget(self.debug_log_text)
+        layout.addWidget(self.cache_enabled)
+        layout.addWidget(self.cache_persistent)
         layout.addLayout(form)
         layout.addLayout(buttons)
 
@@ -137,10 +160,14 @@ class AISettingsDialog(QDialog):
         settings = AISettings(
             enabled=self.enabled.isChecked(),
             show_chips=self.show_chips.isChecked(),
+            prefetch_actions=self.prefetch_actions.isChecked(),
             model=self.model.currentText(),
             temperature=float(self.temperature.value()),
             privacy_mode=self.privacy_mode.isChecked(),
             debug_log_text=self.debug_log_text.isChecked(),
+            cache_enabled=self.cache_enabled.isChecked(),
+            cache_persistent=self.cache_persistent.isChecked(),
+            cache_ttl_hours=int(self.cache_ttl_hours.value()),
         )
         self.store.save(settings)
         self.accept()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Optional
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, Signal
 from PySide6.QtWidgets import (
+    QButtonGroup,
     QComboBox,
     QDialog,
     QHBoxLayout,
@@ -15,34 +17,118 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from ai_writing.openai_client import AIWritingCancelled
 from ai_writing.prompts import ACTIONS, build_instruction
 
+# Threads de gerações canceladas que ainda não terminaram; mantidas vivas até o fim.
+_DETACHED_THREADS: Dict[QThread, "_Worker"] = {}
+
+# Gerações antecipadas de todos os painéis dividem um pool limitado.
+PREFETCH_WORKERS = 3
+_prefetch_pool: Optional[QThreadPool] = None
+
+
+def _get_prefetch_pool() -> QThreadPool:
+    global _prefetch_pool
+    if _prefetch_pool is None:
+        _prefetch_pool = QThreadPool()
+        _prefetch_pool.setMaxThreadCount(PREFETCH_WORKERS)
+    return _prefetch_pool
+
 
 class _Worker(QObject):
     finished = Signal(str)
     failed = Signal(str)
+    partial = Signal(str)
+    cancelled = Signal()
 
-    def __init__(self, fn: Callable[..., str], kwargs: Dict[str, Any]):
+    def __init__(self, fn: Callable[..., str], kwargs: Dict[str, Any], streaming: bool = False):
         super().__init__()
         self.fn = fn
         self.kwargs = kwargs
+        self.cancel_event = threading.Event()
+        if streaming:
+            self.kwargs = {**kwargs, "on_delta": self.partial.emit, "cancel_event": self.cancel_event}
 
     def run(self):
         try:
-            self.finished.emit(self.fn(**self.kwargs))
+            text = self.fn(**self.kwargs)
+        except AIWritingCancelled:
+            self.cancelled.emit()
+            return
+        except Exception as exc:
+            if self.cancel_event.is_set():
+                self.cancelled.emit()
+            else:
+                self.failed.emit(str(exc))
+            return
+        if self.cancel_event.is_set():
+            self.cancelled.emit()
+        else:
+            self.finished.emit(text)
+
+
+class _PrefetchSignals(QObject):
+    finished = Signal(str, str)
+    failed = Signal(str, str)
+
+
+class _PrefetchTask(QRunnable):
+    def __init__(self, action: str, fn: Callable[..., str], kwargs: Dict[str, Any], signals: _PrefetchSignals, streaming: bool):
+        super().__init__()
+        self.action = action
+        self.fn = fn
+        self.signals = signals
+        self.cancel_event = threading.Event()
+        self.kwargs = kwargs
+        if streaming:
+            # Sem exibição parcial; o streaming aqui só serve para poder interromper a requisição.
+            self.kwargs = {**kwargs, "on_delta": lambda delta: None, "cancel_event": self.cancel_event}
+
+    def run(self) -> None:
+        if self.cancel_event.is_set():
+            return
+        try:
+            text = self.fn(**self.kwargs)
+        except AIWritingCancelled:
+            return
         except Exception as exc:
-            self.failed.emit(str(exc))
+            if not self.cancel_event.is_set():
+                self.signals.failed.emit(self.action, str(exc))
+            return
+        if not self.cancel_event.is_set():
+            self.signals.finished.emit(self.action, text)
 
 
 class AIWritingPanel(QDialog):
-    def __init__(self, source_text: str, on_generate: Callable[..., str], context: Dict[str, Any], parent: Optional[QWidget] = None):
+    def __init__(
+        self,
+        source_text: str,
+        on_generate: Callable[..., str],
+        context: Dict[str, Any],
+        parent: Optional[QWidget] = None,
+        streaming: bool = True,
+        show_chips: bool = False,
+        prefetch: bool = False,
+    ):
         super().__init__(parent)
         self.setWindowTitle("✨ Redigir com IA")
         self.source_text = source_text
         self.context = context
         self.on_generate = on_generate
+        # No modo streaming o on_generate recebe on_delta/cancel_event e o "Depois" é preenchido aos poucos.
+        self.streaming = streaming
         self.suggestion_text = ""
         self._previous_applied = ""
+        self._thread: Optional[QThread] = None
+        self._worker: Optional[_Worker] = None
+        # Pré-geração: uma sugestão por ação, válida só para o tom/tamanho com que foi pedida.
+        self._prefetched: Dict[str, str] = {}
+        self._prefetch_tasks: Dict[str, _PrefetchTask] = {}
+        self._prefetch_variant: Optional[Tuple[str, str]] = None
+        self._prefetch_signals = _PrefetchSignals()
+        self._prefetch_signals.finished.connect(self._on_prefetched)
+        self._prefetch_signals.failed.connect(self._on_prefetch_failed)
 
         self.before = QTextEdit()
         self.before.setReadOnly(True)
@@ -55,6 +141,20 @@ class AIWritingPanel(QDialog):
         self.action_combo = QComboBox()
         for key, label in ACTIONS.items():
             self.action_combo.addItem(label, key)
+        self.action_combo.currentIndexChanged.connect(self._on_action_changed)
+
+        self.chips = QButtonGroup(self)
+        self.chips.setExclusive(True)
+        chips_row = QHBoxLayout()
+        if show_chips:
+            for index, label in enumerate(ACTIONS.values()):
+                chip = QPushButton(label)
+                chip.setCheckable(True)
+                chip.setChecked(index == self.action_combo.currentIndex())
+                self.chips.addButton(chip, index)
+                chips_row.addWidget(chip)
+            chips_row.addStretch()
+            self.chips.idClicked.connect(self.action_combo.setCurrentIndex)
 
         self.tone = QComboBox()
         self.tone.addItems(["Neutro", "Objetivo", "Formal"])
@@ -68,7 +168,7 @@ class AIWritingPanel(QDialog):
         undo_btn = QPushButton("Desfazer")
 
         generate_btn.clicked.connect(self.generate)
-        regenerate_btn.clicked.connect(self.generate)
+        regenerate_btn.clicked.connect(self.regenerate)
         apply_btn.clicked.connect(self._apply)
         copy_btn.clicked.connect(self._copy)
         undo_btn.clicked.connect(self._undo)
@@ -87,6 +187,7 @@ class AIWritingPanel(QDialog):
 
         layout = QVBoxLayout(self)
         layout.addLayout(top)
+        layout.addLayout(chips_row)
         layout.addWidget(QLabel("Antes"))
         layout.addWidget(self.before)
         layout.addWidget(QLabel("Depois"))
@@ -94,7 +195,25 @@ class AIWritingPanel(QDialog):
         layout.addWidget(self.status)
         layout.addLayout(actions)
 
-    def generate(self):
+        if show_chips and prefetch:
+            self.prefetch_actions()
+
+    def regenerate(self):
+        """Pede uma nova variação, ignorando sugestões em cache."""
+        self.generate(bypass_cache=True)
+
+    def generate(self, bypass_cache: bool = False):
+        action = self.action_combo.currentData()
+        if not bypass_cache and self._prefetch_matches():
+            if action in self._prefetched:
+                self.cancel_generation()
+                self._show_suggestion(self._prefetched[action])
+                return
+            if action in self._prefetch_tasks:
+                # Já está sendo gerada em segundo plano; _on_prefetched exibe quando chegar.
+                self.cancel_generation()
+                self.status.setText("loading")
+                return
         self.status.setText("loading")
         instruction = build_instruction(
             self.action_combo.currentData(),
@@ -105,23 +224,119 @@ class AIWritingPanel(QDialog):
             "input_text": self.source_text,
             "instruction": instruction,
             "context": self.context,
+            "bypass_cache": bypass_cache,
         }
+        self.cancel_generation()
+        if self.streaming:
+            self.after.clear()
         self._thread = QThread(self)
-        self._worker = _Worker(self.on_generate, kwargs)
+        self._worker = _Worker(self.on_generate, kwargs, streaming=self.streaming)
         self._worker.moveToThread(self._thread)
         self._thread.started.connect(self._worker.run)
+        self._worker.partial.connect(self._on_partial)
         self._worker.finished.connect(self._on_success)
         self._worker.failed.connect(self._on_error)
         self._worker.finished.connect(self._thread.quit)
         self._worker.failed.connect(self._thread.quit)
+        self._worker.cancelled.connect(self._thread.quit)
         self._thread.start()
 
-    def _on_success(self, text: str):
+    def cancel_generation(self) -> None:
+        """Cancela a geração em andamento sem bloquear a interface."""
+        thread, worker = self._thread, self._worker
+        self._thread = None
+        self._worker = None
+        if worker is None or thread is None:
+            return
+        worker.cancel_event.set()
+        worker.partial.disconnect(self._on_partial)
+        worker.finished.disconnect(self._on_success)
+        worker.failed.disconnect(self._on_error)
+        if thread.isRunning():
+            # A thread termina sozinha no próximo trecho recebido; até lá fica fora do painel.
+            thread.setParent(None)
+            _DETACHED_THREADS[thread] = worker
+            thread.finished.connect(lambda: _DETACHED_THREADS.pop(thread, None))
+
+    def prefetch_actions(self) -> None:
+        """Gera em paralelo as sugestões de todas as ações, para a troca de chip ser imediata."""
+        self.cancel_prefetch()
+        tone, length = self.tone.currentText(), self.length.currentText()
+        self._prefetch_variant = (tone, length)
+        pool = _get_prefetch_pool()
+        for action in ACTIONS:
+            kwargs = {
+                "input_text": self.source_text,
+                "instruction": build_instruction(action, tone=tone, length=length),
+                "context": self.context,
+            }
+            task = _PrefetchTask(action, self.on_generate, kwargs, self._prefetch_signals, self.streaming)
+            self._prefetch_tasks[action] = task
+            pool.start(task)
+
+    def cancel_prefetch(self) -> None:
+        """Descarta as pré-gerações pendentes; as que já estão rodando são interrompidas."""
+        for task in self._prefetch_tasks.values():
+            # As que ainda estão na fila saem sem fazer requisição.
+            task.cancel_event.set()
+        self._prefetch_tasks.clear()
+        self._prefetched.clear()
+        self._prefetch_variant = None
+
+    def done(self, result: int) -> None:
+        self.cancel_generation()
+        self.cancel_prefetch()
+        super().done(result)
+
+    def _prefetch_matches(self) -> bool:
+        return self._prefetch_variant == (self.tone.currentText(), self.length.currentText())
+
+    def _on_prefetched(self, action: str, text: str) -> None:
+        if self._prefetch_tasks.pop(action, None) is None:
+            return
+        self._prefetched[action] = text
+        if self._worker is None and action == self.action_combo.currentData() and self._prefetch_matches():
+            self._show_suggestion(text)
+
+    def _on_prefetch_failed(self, action: str, message: str) -> None:
+        if self._prefetch_tasks.pop(action, None) is None:
+            return
+        if self._worker is None and action == self.action_combo.currentData() and self._prefetch_matches():
+            # Sem sugestão antecipada para esta ação; o usuário pode pedir com "Gerar".
+            self.status.setText("idle")
+
+    def _on_action_changed(self, index: int) -> None:
+        chip = self.chips.button(index)
+        if chip is not None:
+            chip.setChecked(True)
+        if self._prefetch_variant is None:
+            return
+        action = self.action_combo.itemData(index)
+        if action in self._prefetched and self._prefetch_matches():
+            self.cancel_generation()
+            self._show_suggestion(self._prefetched[action])
+        elif action in self._prefetch_tasks and self._prefetch_matches():
+            self.cancel_generation()
+            self.after.clear()
+            self.status.setText("loading")
+
+    def _show_suggestion(self, text: str) -> None:
         self.suggestion_text = text
         self.after.setPlainText(text)
         self.status.setText("success")
 
+    def _on_partial(self, delta: str):
+        self.status.setText("streaming")
+        cursor = self.after.textCursor()
+        cursor.movePosition(cursor.MoveOperation.End)
+        cursor.insertText(delta)
+
+    def _on_success(self, text: str):
+        self._thread, self._worker = None, None
+        self._show_suggestion(text)
+
     def _on_error(self, message: str):
+        self._thread, self._worker = None, None
         if "Chave" in message:
             QMessageBox.warning(self, "IA", "Chave não configurada")
         elif "rate" in message.lower() or "429" in message:
@@ -5,11 +5,12 @@ import os
 import re
 import shutil
 import sys
+import threading
 from datetime import date, datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 from PySide6.QtCore import Qt, QDate, QSize, QTimer, QUrl
-from PySide6.QtGui import QColor, QIcon, QKeyEvent, QDesktopServices, QPixmap, QPainter, QFont
+from PySide6.QtGui import QColor, QIcon, QKeyEvent, QKeySequence, QDesktopServices, QPixmap, QPainter, QFont
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget,
     QVBoxLayout, QHBoxLayout, QTabWidget,
@@ -26,11 +27,25 @@ from PySide6.QtWidgets import QStyledItemDelegate
 from PySide6.QtWidgets import QHeaderView, QStyle
 from PySide6.QtWidgets import QSizePolicy
 
-from csv_store import CsvStore, parse_prazos_list
-from team_control import TeamControlStore, month_days, participation_for_date, STATUS_COLORS, WEEKDAY_LABELS, build_team_control_report_rows, monthly_k_count, split_member_names
+from csv_store import CsvStore, is_open_demand, parse_prazos_list
+from team_control import TeamControlStore, TeamMember, TeamSection, daily_participation, month_days, participation_for_date, STATUS_COLORS, WEEKDAY_LABELS, build_team_control_report_rows, monthly_k_count, split_member_names, write_team_analytics_csv
 from validation import ValidationError, normalize_prazo_text, validate_payload
 from bootstrap import resolve_storage_root, ensure_storage_root
-from ui_theme import APP_STYLESHEET, status_color, timing_color
+from ui_theme import APP_STYLESHEET
+from ui_style_cache import (
+    bold_font,
+    prazo_today_brush,
+    priority_brush,
+    progress_fill_color,
+    status_brush,
+    team_code_brushes,
+    team_footer_brush,
+    team_participation_brush,
+    team_today_header_brush,
+    team_total_fg_brush,
+    team_weekend_brush,
+    timing_brush,
+)
 from ui_filters import filter_rows, summary_counts
 from ui_prefs import load_prefs, save_prefs
 from form_rules import required_fields
@@ -40,15 +55,15 @@ from notifications.inapp_toast import InAppToastNotifier
 from notifications.scheduler import DeadlineScheduler
 from notifications.settings_view import NotificationSettingsDialog
 from notifications.system_notifier import SystemNotifier
-from ai_writing.openai_client import OpenAIWritingClient, AIWritingError, MissingAPIKeyError
+from ai_writing.openai_client import WritingClientPool, AIWritingError, MissingAPIKeyError
 from ai_writing.settings import AISettingsStore, AISettingsDialog
+from ai_writing.cache import SuggestionCache
 from ai_writing.audit import AIAuditLogger
 from ai_writing.integration import attach_ai_writing
 
 EXEC_NAME = os.path.basename(sys.argv[0]).lower()
 DEBUG_MODE = "debug" in EXEC_NAME
 DATE_FMT_QT = "dd/MM/yyyy"
-PRAZO_TODAY_BG = (255, 249, 196)  # amarelo claro
 BACKUP_DIRNAME = "bkp"
 BACKUP_PREFIX = "BKP_RAD"
 def debug_msg(title: str, text: str):
@@ -142,6 +157,11 @@ TAB4_EDITABLE_COLUMNS = {
 }
 DESC_COLUMN_MAX_CHARS = 45
 
+# Modos de altura das linhas das tabelas de demandas
+ROW_MODE_WRAP = "wrap"
+ROW_MODE_ELIDED = "elided"
+ELIDED_TOOLTIP_MIN_CHARS = 30
+
 STATUS_EDIT_OPTIONS = [
     "Não iniciada",
     "Em andamento",
@@ -183,13 +203,6 @@ PERCENT_QUICK_PICK = [
 
 PERCENT_LABEL_OPTIONS = [label for label, _ in PERCENT_OPTIONS if label]
 
-PRIORIDADE_TEXT_COLORS: Dict[str, Tuple[int, int, int]] = {
-    "alta": (220, 38, 38),   # vermelho
-    "média": (202, 138, 4),  # amarelo
-    "media": (202, 138, 4),  # fallback sem acento
-    "baixa": (22, 163, 74),  # verde
-}
-
 PRIORIDADE_SORT_ORDER = {
     "alta": 0,
     "média": 1,
@@ -197,7 +210,6 @@ PRIORIDADE_SORT_ORDER = {
     "baixa": 2,
 }
 
-PROGRESS_FILL_COLOR = (3, 141, 220)
 def _try_parse_date_br(text: str) -> Optional[date]:
     raw = (text or "").strip().replace("*", "")
     if not raw:
@@ -208,50 +220,51 @@ def _try_parse_date_br(text: str) -> Optional[date]:
         return None
 
 
-def _column_sort_key(col_name: str, text: str):
-    raw = (text or "").strip()
-    if not raw:
-        return (1, "")
+# Coluna oculta usada pela ordenação nativa do Qt: recebe a chave tipada da coluna clicada.
+SORT_KEY_COLUMN = len(VISIBLE_COLUMNS)
+SORT_KEYS_ROLE = Qt.UserRole + 20
+NUMERIC_SORT_COLUMNS = {"ID", "Data de Registro", "Prazo", "Data Conclusão", "% Conclusão", "Prioridade"}
+_SORT_LAST_NUMBER = float("inf")
+_SORT_LAST_TEXT = "\uffff"
 
+
+def _numeric_sort_key(col_name: str, raw: str, row: Dict[str, Any]) -> float:
     if col_name == "ID":
-        try:
-            return (0, int(raw))
-        except Exception:
-            return (0, raw.lower())
+        return float(raw) if raw.isdigit() else _SORT_LAST_NUMBER
 
     if col_name in {"Data de Registro", "Data Conclusão"}:
-        parsed = _try_parse_date_br(raw)
-        return (0, parsed.toordinal()) if parsed else (0, raw.lower())
+        parsed_field = "_data_registro_date" if col_name == "Data de Registro" else "_conclusao_date"
+        parsed = row[parsed_field] if parsed_field in row else _try_parse_date_br(raw)
+        return float(parsed.toordinal()) if parsed else _SORT_LAST_NUMBER
 
     if col_name == "Prazo":
-        prazos = parse_prazos_list(raw.replace("\n", ","))
-        if prazos:
-            return (0, min(p.toordinal() for p in prazos))
-        return (0, raw.lower())
+        prazos = row["_prazos_dates"] if "_prazos_dates" in row else parse_prazos_list(raw.replace("\n", ","))
+        return float(min(prazos).toordinal()) if prazos else _SORT_LAST_NUMBER
 
     if col_name == "% Conclusão":
         pct = _percent_to_fraction(raw)
-        if pct is not None:
-            return (0, pct)
-
-    if col_name == "Prioridade":
-        mapped = PRIORIDADE_SORT_ORDER.get(raw.lower())
-        if mapped is not None:
-            return (0, mapped)
+        return float(pct) if pct is not None else _SORT_LAST_NUMBER
 
-    return (0, raw.lower())
+    mapped = PRIORIDADE_SORT_ORDER.get(raw.lower())
+    return float(mapped) if mapped is not None else _SORT_LAST_NUMBER
 
 
-class SortableTableItem(QTableWidgetItem):
-    SORT_ROLE = Qt.UserRole + 20
-
-    def __lt__(self, other):
-        if isinstance(other, QTableWidgetItem):
-            left_key = self.data(self.SORT_ROLE)
-            right_key = other.data(self.SORT_ROLE)
-            if left_key is not None and right_key is not None:
-                return left_key < right_key
-        return super().__lt__(other)
+def _row_sort_keys(row: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Chaves de ordenação de uma linha, uma por coluna visível.
+    Datas e números viram float (ordinal/fração) usando os campos já parseados
+    por build_view(); texto vira str minúscula. Vazios vão para o fim.
+    """
+    keys: List[Any] = []
+    for col_name in VISIBLE_COLUMNS:
+        raw = str(row.get(col_name, "") or "").strip()
+        if not raw:
+            keys.append(_SORT_LAST_NUMBER if col_name in NUMERIC_SORT_COLUMNS else _SORT_LAST_TEXT)
+        elif col_name in NUMERIC_SORT_COLUMNS:
+            keys.append(_numeric_sort_key(col_name, raw, row))
+        else:
+            keys.append(raw.lower())
+    return tuple(keys)
 
 
 def _app_icon_path() -> str:
@@ -391,11 +404,10 @@ class ColumnComboDelegate(QStyledItemDelegate):
             return
 
         fill_rect.setWidth(fill_width)
-        rr, gg, bb = PROGRESS_FILL_COLOR
 
         painter.save()
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(rr, gg, bb, 190))
+        painter.setBrush(progress_fill_color())
         painter.drawRect(fill_rect)
         painter.restore()
 
@@ -405,10 +417,14 @@ class TeamSectionTable(QTableWidget):
         super().__init__(parent)
         self._bulk_edit_handler = None
         self._delete_members_handler = None
+        self._paste_handler = None
 
     def set_bulk_edit_handler(self, handler):
         self._bulk_edit_handler = handler
 
+    def set_paste_handler(self, handler):
+        self._paste_handler = handler
+
     def set_delete_members_handler(self, handler):
         self._delete_members_handler = handler
 
@@ -421,6 +437,11 @@ class TeamSectionTable(QTableWidget):
         }
 
     def keyPressEvent(self, event: QKeyEvent):
+        if event.matches(QKeySequence.Paste) and callable(self._paste_handler):
+            if self._paste_handler(self, QApplication.clipboard().text()):
+                event.accept()
+                return
+
         if event.key() == Qt.Key_Delete and callable(self._delete_members_handler):
             if self._selected_name_rows() and self._delete_members_handler(self):
                 event.accept()
@@ -1249,6 +1270,9 @@ class MainWindow(QMainWindow):
 
         self._filling = False
         self._restoring_prefs = False
+        self._row_mode = ROW_MODE_WRAP
+        # Por tabela: _id -> ((larguras das colunas, hash do texto), altura medida)
+        self._row_height_cache: Dict[str, Dict[str, Tuple[Tuple[Tuple[int, ...], int], int]]] = {}
         self._table_sort_state: Dict[str, Optional[Tuple[int, Qt.SortOrder]]] = {
             "t1": None,
             "t3": None,
@@ -1272,8 +1296,13 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(central)
 
         self._prefs = load_prefs(self.store.base_dir)
+        if self._prefs.get("table_row_mode") == ROW_MODE_ELIDED:
+            self._row_mode = ROW_MODE_ELIDED
+            self._apply_row_mode(self.t1_table)
         self.ai_settings_store = AISettingsStore(self.store.base_dir)
         self.ai_settings = self.ai_settings_store.load()
+        self.ai_clients = WritingClientPool()
+        self.ai_cache = self._build_ai_cache()
         self.ai_audit = AIAuditLogger(self.store.base_dir)
         self.team_store = TeamControlStore(self.store.base_dir)
         self._ensure_backup_dir()
@@ -1326,11 +1355,20 @@ class MainWindow(QMainWindow):
         self.deadline_scheduler = DeadlineScheduler(
             repo=self,
             emitter=self._emit_notification,
+            batch_emitter=self._emit_notifications,
         )
+        # A retenção só roda depois da primeira varredura completa, que renova as
+        # ocorrências ainda atuais; assim elas não são apagadas e reanunciadas.
+        self.deadline_scheduler.full_scan_applied.connect(self._prune_notifications_once)
         interval = self.notification_store.load_preferences().scheduler_interval_minutes
         self.deadline_scheduler.start(interval)
+        self.store.change_listeners.append(self._on_store_changed)
         self._on_notifications_changed()
 
+    def _prune_notifications_once(self) -> None:
+        self.deadline_scheduler.full_scan_applied.disconnect(self._prune_notifications_once)
+        self.notification_store.prune_in_background()
+
     def _is_app_focused(self) -> bool:
         return bool(self.isVisible() and not self.isMinimized() and self.isActiveWindow())
 
@@ -1340,8 +1378,15 @@ class MainWindow(QMainWindow):
         self.activateWindow()
 
     def list_open_demands(self) -> List[Dict[str, Any]]:
-        self.store.load()
-        return self.store.tab_pending_all()
+        # Só o necessário para o agendador de prazos; evita montar a visão completa.
+        return [
+            {"ID": dr.data.get("ID", ""), "Prazo": dr.data.get("Prazo", "")}
+            for dr in self.store.rows
+            if is_open_demand(dr.data)
+        ]
+
+    def _on_store_changed(self) -> None:
+        self.deadline_scheduler.request_sync(self.list_open_demands())
 
     def open_notification_center(self) -> None:
         if self.notification_center_dialog is None:
@@ -1369,8 +1414,14 @@ class MainWindow(QMainWindow):
             self._on_notifications_changed()
         return notification_id
 
+    def _emit_notifications(self, notifications: List[Notification]) -> List[int]:
+        notification_ids = self.notification_dispatcher.dispatch_many(notifications)
+        if notification_ids:
+            self._on_notifications_changed()
+        return notification_ids
+
     def refresh_pending_notifications(self) -> None:
-        self.deadline_scheduler.check_now()
+        self.deadline_scheduler.request_sync(self.list_open_demands(), full=True)
         self._on_notifications_changed()
 
     def _handle_notification_click(self, notif: Notification) -> None:
@@ -1474,18 +1525,7 @@ class MainWindow(QMainWindow):
         return backup_name
 
     def _apply_restored_team_control(self, payload: Dict[str, Any]) -> None:
-        data = payload if isinstance(payload, dict) else {}
-        periods = data.get("periods") if isinstance(data, dict) else None
-        if not isinstance(periods, dict):
-            periods = {}
-
-        self.team_store._period_sections = {
-            str(period): self.team_store._parse_sections((entry or {}).get("sections", []))
-            for period, entry in periods.items()
-            if isinstance(entry, dict)
-        }
-        self.team_store.sections = self.team_store._period_sections.get(self.team_store._active_period, [])
-        self.team_store.save()
+        self.team_store.restore_payload(payload if isinstance(payload, dict) else {})
 
     def _validate_today_backup_on_startup(self) -> None:
         if self._today_backup_exists():
@@ -1533,8 +1573,9 @@ class MainWindow(QMainWindow):
         QMessageBox.information(self, "Restauração concluída", "Backup restaurado com sucesso.")
 
     def _make_table(self, table_key: str) -> QTableWidget:
-        table = DemandTable(0, len(VISIBLE_COLUMNS))
+        table = DemandTable(0, len(VISIBLE_COLUMNS) + 1)
         table.setHorizontalHeaderLabels(VISIBLE_COLUMNS)
+        table.setColumnHidden(SORT_KEY_COLUMN, True)
         if table_key in {"t3", "t4", "t4_cancelled"}:
             first_header_item = table.horizontalHeaderItem(0)
             if first_header_item is not None:
@@ -1565,7 +1606,7 @@ class MainWindow(QMainWindow):
         table.setSelectionBehavior(QTableWidget.SelectRows)
         table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         table.verticalHeader().setVisible(False)
-        table.setWordWrap(True)
+        self._apply_row_mode(table)
         table.set_delete_demand_handler(self._delete_selected_demands_from_table)
 
         header = table.horizontalHeader()
@@ -1584,6 +1625,71 @@ class MainWindow(QMainWindow):
 
         return table
 
+    def _apply_row_mode(self, table: QTableWidget):
+        vheader = table.verticalHeader()
+        if self._row_mode == ROW_MODE_ELIDED:
+            table.setWordWrap(False)
+            table.setTextElideMode(Qt.ElideRight)
+            vheader.setDefaultSectionSize(table.fontMetrics().height() + 10)
+            vheader.setSectionResizeMode(QHeaderView.Fixed)
+        else:
+            table.setWordWrap(True)
+            vheader.setSectionResizeMode(QHeaderView.Interactive)
+
+    def _set_row_mode(self, mode: str):
+        if mode not in {ROW_MODE_WRAP, ROW_MODE_ELIDED} or mode == self._row_mode:
+            return
+        self._row_mode = mode
+        for table in (self.t1_table, self.t3_table, self.t4_table, self.t4_cancelled_table):
+            self._apply_row_mode(table)
+            self._refresh_row_presentation(table)
+        self._save_preferences()
+
+    def _refresh_row_presentation(self, table: QTableWidget):
+        """Atualiza dicas e alturas das linhas já preenchidas para o modo de linha atual."""
+        elided = self._row_mode == ROW_MODE_ELIDED
+        default_height = table.verticalHeader().defaultSectionSize()
+        text_hashes: Dict[str, int] = {}
+        for r in range(table.rowCount()):
+            texts = []
+            for c in range(len(VISIBLE_COLUMNS)):
+                it = table.item(r, c)
+                text = it.text() if it is not None else ""
+                texts.append(text)
+                if it is not None:
+                    long_text = bool(text) and ("\n" in text or len(text) > ELIDED_TOOLTIP_MIN_CHARS)
+                    it.setToolTip(text if elided and long_text else "")
+            id_item = table.item(r, 0)
+            _id = str(id_item.data(Qt.UserRole) or "") if id_item else ""
+            text_hashes[_id] = hash(tuple(texts))
+            if elided:
+                table.setRowHeight(r, default_height)
+        self._apply_row_heights(table, text_hashes)
+
+    def _apply_row_heights(self, table: QTableWidget, text_hashes: Dict[str, int]):
+        """Mede só as linhas cujo texto ou larguras de coluna mudaram desde a última medição."""
+        if self._row_mode == ROW_MODE_ELIDED:
+            return
+
+        table_key = str(table.property("tableSortKey") or "")
+        # Recriado a cada preenchimento: só as linhas exibidas ficam no cache.
+        previous = self._row_height_cache.get(table_key, {})
+        cache: Dict[str, Tuple[Tuple[Tuple[int, ...], int], int]] = {}
+        self._row_height_cache[table_key] = cache
+        widths = tuple(table.columnWidth(c) for c in range(table.columnCount()))
+        for r in range(table.rowCount()):
+            id_item = table.item(r, 0)
+            _id = str(id_item.data(Qt.UserRole) or "") if id_item else ""
+            signature = (widths, text_hashes.get(_id, 0))
+            cached = previous.get(_id)
+            if cached is not None and cached[0] == signature:
+                table.setRowHeight(r, cached[1])
+                cache[_id] = cached
+                continue
+            table.resizeRowToContents(r)
+            if _id:
+                cache[_id] = (signature, table.rowHeight(r))
+
     def _setup_sortable_header(self, table: QTableWidget):
         header = table.horizontalHeader()
         header.setSectionsClickable(True)
@@ -1603,19 +1709,40 @@ class MainWindow(QMainWindow):
         if not table_key:
             return
         self._table_sort_state[table_key] = (col, order)
-        table.sortItems(col, order)
+        self._sort_table(table, col, order)
+
+    def _sort_table(self, table: QTableWidget, col: int, order: Qt.SortOrder):
+        """Copia a chave tipada da coluna para a coluna oculta e deixa o Qt ordenar sem callbacks Python."""
+        model = table.model()
+        self._filling = True
+        model.blockSignals(True)
+        try:
+            item_at = table.item
+            display_role = Qt.DisplayRole
+            keys_role = SORT_KEYS_ROLE
+            for r in range(table.rowCount()):
+                key_item = item_at(r, SORT_KEY_COLUMN)
+                if key_item is not None:
+                    key_item.setData(display_role, key_item.data(keys_role)[col])
+        finally:
+            model.blockSignals(False)
+            self._filling = False
+        table.sortItems(SORT_KEY_COLUMN, order)
+        table.horizontalHeader().setSortIndicator(col, order)
 
-    def _set_item(self, table: QTableWidget, r: int, c: int, text: str, _id: str):
-        it = SortableTableItem(text or "")
+    def _set_item(self, table: QTableWidget, r: int, c: int, text: str, _id: str, prazo_today: Optional[bool] = None):
+        it = QTableWidgetItem(text or "")
         colname = VISIBLE_COLUMNS[c]
         table_key = str(table.property("tableSortKey") or "")
-        it.setData(SortableTableItem.SORT_ROLE, _column_sort_key(colname, text or ""))
 
         if colname == "Descrição":
             it.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         else:
             it.setTextAlignment(Qt.AlignCenter)
 
+        if self._row_mode == ROW_MODE_ELIDED and text and ("\n" in text or len(text) > ELIDED_TOOLTIP_MIN_CHARS):
+            it.setToolTip(text)
+
         is_editable = colname not in NON_EDITABLE
         if table_key in {"t4", "t4_cancelled"}:
             is_editable = is_editable and colname in TAB4_EDITABLE_COLUMNS
@@ -1630,40 +1757,54 @@ class MainWindow(QMainWindow):
             it.setData(Qt.UserRole + 1, text or "")
 
         if colname == "Status":
-            rr, gg, bb = status_color(text)
-            it.setBackground(QColor(rr, gg, bb))
+            it.setBackground(status_brush(text or ""))
         if colname == "Prioridade":
-            color = PRIORIDADE_TEXT_COLORS.get((text or "").strip().lower())
-            if color:
-                rr, gg, bb = color
-                it.setForeground(QColor(rr, gg, bb))
+            brush = priority_brush(text or "")
+            if brush is not None:
+                it.setForeground(brush)
         if colname == "Timing":
-            rr, gg, bb = timing_color(text)
-            it.setBackground(QColor(rr, gg, bb))
-        if colname == "Prazo" and prazo_contains_today(text):
-            rr, gg, bb = PRAZO_TODAY_BG
-            it.setBackground(QColor(rr, gg, bb))
+            it.setBackground(timing_brush(text or ""))
+        if colname == "Prazo":
+            if prazo_today is None:
+                prazo_today = prazo_contains_today(text)
+            if prazo_today:
+                it.setBackground(prazo_today_brush())
         table.setItem(r, c, it)
 
     def _fill(self, table: QTableWidget, rows: List[Dict[str, Any]]):
+        table_key = str(table.property("tableSortKey") or "")
+        active_sort = self._table_sort_state.get(table_key)
+        keyed_rows = [(row, _row_sort_keys(row)) for row in rows]
+        if active_sort:
+            sort_col, sort_order = active_sort
+            keyed_rows.sort(key=lambda pair: pair[1][sort_col], reverse=sort_order == Qt.DescendingOrder)
+
+        today = date.today()
         self._filling = True
         try:
             table.setRowCount(0)
-            for row in rows:
+            text_hashes: Dict[str, int] = {}
+            for row, sort_keys in keyed_rows:
                 r = table.rowCount()
                 table.insertRow(r)
                 _id = row["_id"]
-                for c, col in enumerate(VISIBLE_COLUMNS):
-                    self._set_item(table, r, c, str(row.get(col, "") or ""), _id)
+                texts = [str(row.get(col, "") or "") for col in VISIBLE_COLUMNS]
+                prazo_today = today in row["_prazos_dates"] if "_prazos_dates" in row else None
+                for c, text in enumerate(texts):
+                    self._set_item(table, r, c, text, _id, prazo_today)
+                key_item = QTableWidgetItem()
+                key_item.setData(SORT_KEYS_ROLE, sort_keys)
+                if active_sort:
+                    key_item.setData(Qt.DisplayRole, sort_keys[active_sort[0]])
+                table.setItem(r, SORT_KEY_COLUMN, key_item)
+                text_hashes[_id] = hash(tuple(texts))
         finally:
             self._filling = False
 
-        table_key = str(table.property("tableSortKey") or "")
-        active_sort = self._table_sort_state.get(table_key)
         if active_sort:
-            table.sortItems(active_sort[0], active_sort[1])
+            table.horizontalHeader().setSortIndicator(active_sort[0], active_sort[1])
 
-        table.resizeRowsToContents()
+        self._apply_row_heights(table, text_hashes)
 
     def _clear_sort(self, table_key: str):
         self._table_sort_state[table_key] = None
@@ -1808,7 +1949,6 @@ class MainWindow(QMainWindow):
                 return
             try:
                 self.store.update(_id, {"Prazo": dlg.prazo_str()})
-                self.deadline_scheduler.check_now()
             except ValidationError as ve:
                 QMessageBox.warning(self, "Validação", str(ve))
             self.refresh_all()
@@ -1990,6 +2130,7 @@ class MainWindow(QMainWindow):
             "t3_responsavel": self.t3_responsavel.text(),
             "tab_order": [self.tabs.tabText(i) for i in range(self.tabs.count())],
             "table_column_widths": self._collect_table_column_widths(),
+            "table_row_mode": self._row_mode,
         }
         save_prefs(self.store.base_dir, data)
 
@@ -2086,10 +2227,7 @@ class MainWindow(QMainWindow):
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing, True)
 
-        font = QFont()
-        font.setBold(True)
-        font.setPixelSize(int(size * 0.8))
-        painter.setFont(font)
+        painter.setFont(bold_font(int(size * 0.8)))
         painter.setPen(QColor("#374151"))
         painter.drawText(pixmap.rect().adjusted(0, -1, 0, 0), Qt.AlignCenter, "🔔")
 
@@ -2100,10 +2238,7 @@ class MainWindow(QMainWindow):
             painter.setPen(Qt.NoPen)
             painter.drawEllipse(badge_rect)
 
-            badge_font = QFont()
-            badge_font.setBold(True)
-            badge_font.setPixelSize(max(9, int(size * 0.28)))
-            painter.setFont(badge_font)
+            painter.setFont(bold_font(max(9, int(size * 0.28))))
             painter.setPen(QColor("#ffffff"))
             label = "99+" if unread_count > 99 else str(unread_count)
             painter.drawText(badge_rect, Qt.AlignCenter, label)
@@ -2219,6 +2354,10 @@ class MainWindow(QMainWindow):
         dialog = AISettingsDialog(self.ai_settings_store, self)
         if dialog.exec() == QDialog.Accepted:
             self.ai_settings = self.ai_settings_store.load()
+            self.ai_clients.reset()
+            if self.ai_cache is not None:
+                self.ai_cache.close()
+            self.ai_cache = self._build_ai_cache()
             self._refresh_ai_button_visibility()
 
     def _refresh_ai_button_visibility(self) -> None:
@@ -2240,21 +2379,69 @@ class MainWindow(QMainWindow):
     def _ai_context_provider(self, demand_id: str, field_name: str) -> Dict[str, Any]:
         return {"demand_id": str(demand_id or ""), "field": field_name}
 
-    def _generate_ai_suggestion(self, input_text: str, instruction: str, context: Dict[str, Any]) -> str:
-        self.ai_settings = self.ai_settings_store.load()
+    def _build_ai_cache(self) -> Optional[SuggestionCache]:
+        if not self.ai_settings.cache_enabled:
+            return None
+        return SuggestionCache(
+            self.store.base_dir,
+            persistent=self.ai_settings.cache_persistent,
+            privacy_mode=self.ai_settings.privacy_mode,
+            ttl_seconds=self.ai_settings.cache_ttl_hours * 3600,
+        )
+
+    def _generate_ai_suggestion(
+        self,
+        input_text: str,
+        instruction: str,
+        context: Dict[str, Any],
+        bypass_cache: bool = False,
+        on_delta: Optional[Callable[[str], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> str:
         if not self.ai_settings.enabled:
             raise AIWritingError("IA desabilitada")
+        cache = self.ai_cache
+        cache_key = ""
+        if cache is not None:
+            cache_key = cache.key_for(self.ai_settings.model, self.ai_settings.temperature, instruction, input_text, context)
+            cached = None if bypass_cache else cache.get(cache_key)
+            if cached is not None:
+                self.ai_audit.log_event("generate_cached", str(context.get("demand_id", "")), str(context.get("field", "")), input_text, True, privacy_mode=self.ai_settings.privacy_mode, debug_mode=self.ai_settings.debug_log_text)
+                if on_delta is not None:
+                    on_delta(cached)
+                return cached
+
+        def _finish(suggestion: str) -> None:
+            if cache is not None:
+                cache.put(cache_key, suggestion, input_text)
+            self.ai_audit.log_event("generate", str(context.get("demand_id", "")), str(context.get("field", "")), input_text, True, privacy_mode=self.ai_settings.privacy_mode, debug_mode=self.ai_settings.debug_log_text)
+
         try:
-            client = OpenAIWritingClient(model=self.ai_settings.model, temperature=self.ai_settings.temperature)
+            client = self.ai_clients.get(self.ai_settings.model, self.ai_settings.temperature)
+            if on_delta is not None:
+                return client.suggest_stream(
+                    input_text=input_text,
+                    instruction=instruction,
+                    context=context,
+                    on_delta=on_delta,
+                    on_final=_finish,
+                    cancel_event=cancel_event,
+                )
             suggestion = client.suggest(input_text=input_text, instruction=instruction, context=context)
-            self.ai_audit.log_event("generate", str(context.get("demand_id", "")), str(context.get("field", "")), input_text, True, privacy_mode=self.ai_settings.privacy_mode, debug_mode=self.ai_settings.debug_log_text)
+            _finish(suggestion)
             return suggestion
         except MissingAPIKeyError:
             self.ai_audit.log_event("generate", str(context.get("demand_id", "")), str(context.get("field", "")), input_text, False, error_message="missing_key", privacy_mode=self.ai_settings.privacy_mode, debug_mode=self.ai_settings.debug_log_text)
             raise
 
+    def _ai_panel_options(self) -> Dict[str, Any]:
+        return {
+            "show_chips": self.ai_settings.show_chips,
+            "prefetch": self.ai_settings.show_chips and self.ai_settings.prefetch_actions,
+        }
+
     def _attach_ai_widget(self, text_widget: QTextEdit, context_provider):
-        wrapper = attach_ai_writing(text_widget, context_provider, self._generate_ai_suggestion)
+        wrapper = attach_ai_writing(text_widget, context_provider, self._generate_ai_suggestion, self._ai_panel_options)
         btn = getattr(text_widget, "_ai_button", None)
         if btn is not None:
             if not self.ai_settings.enabled:
@@ -2331,6 +2518,9 @@ class MainWindow(QMainWindow):
         export_team_btn = QPushButton("Baixar relatório")
         export_team_btn.clicked.connect(self.export_team_control_csv)
 
+        export_year_btn = QPushButton("Relatório anual")
+        export_year_btn.clicked.connect(self.export_team_analytics_csv)
+
         top = QHBoxLayout()
         top.addWidget(QLabel("Ano:"))
         top.addWidget(self.tc_year)
@@ -2342,6 +2532,7 @@ class MainWindow(QMainWindow):
         top.addWidget(del_section_btn)
         top.addWidget(add_member_btn)
         top.addWidget(export_team_btn)
+        top.addWidget(export_year_btn)
         top.addStretch()
 
         self.tc_scroll = QScrollArea()
@@ -2351,6 +2542,12 @@ class MainWindow(QMainWindow):
         self.tc_sections_layout.setContentsMargins(0, 0, 0, 0)
         self.tc_sections_layout.setSpacing(14)
         self.tc_scroll.setWidget(self.tc_scroll_host)
+        # Tabelas dos times são reaproveitadas entre atualizações e trocas de período.
+        self._team_section_pool: List[Tuple[QGroupBox, TeamSectionTable]] = []
+        self._team_empty_label = QLabel("Nenhum time criado. Clique em 'Novo time'.")
+        self._team_empty_label.setVisible(False)
+        self.tc_sections_layout.addWidget(self._team_empty_label)
+        self.tc_sections_layout.addStretch()
 
         layout = QVBoxLayout()
         legend = QLabel("Use: P - Presente, A - Ausente, K - Com demanda, F - Férias, D - Day-off, H - Feriado e R - Recesso")
@@ -2363,145 +2560,209 @@ class MainWindow(QMainWindow):
     def _selected_year_month(self) -> tuple[int, int]:
         return int(self.tc_year.currentText()), int(self.tc_month.currentText())
 
-    def _clear_layout(self, layout: QVBoxLayout):
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            child_layout = item.layout()
-            if widget:
-                widget.deleteLater()
-            if child_layout:
-                self._clear_layout(child_layout)
-
     def refresh_team_control(self):
-        year, month = self._selected_year_month()
         self.team_store.load()
+        self._render_team_control()
+
+    def _render_team_control(self):
+        """Redesenha a grade a partir do estado em memória, reaproveitando as tabelas já criadas."""
+        year, month = self._selected_year_month()
         self.team_store.set_period(year, month)
-        self._clear_layout(self.tc_sections_layout)
-        if not self.team_store.sections:
-            self.tc_sections_layout.addWidget(QLabel("Nenhum time criado. Clique em 'Novo time'."))
-            self.tc_sections_layout.addStretch()
-            return
+        sections = self.team_store.sections
 
+        while len(self._team_section_pool) < len(sections):
+            box, table = self._create_team_section_widgets()
+            self.tc_sections_layout.insertWidget(len(self._team_section_pool), box)
+            self._team_section_pool.append((box, table))
+
+        for idx, (box, table) in enumerate(self._team_section_pool):
+            if idx >= len(sections):
+                box.setVisible(False)
+                continue
+            section = sections[idx]
+            box.setTitle(section.name)
+            self._populate_team_table(table, section, year, month)
+            box.setVisible(True)
+
+        self._team_empty_label.setVisible(not sections)
+
+    def _create_team_section_widgets(self) -> Tuple[QGroupBox, "TeamSectionTable"]:
+        box = QGroupBox()
+        box_layout = QVBoxLayout(box)
+
+        table = TeamSectionTable()
+        table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        table.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed | QAbstractItemView.AnyKeyPressed)
+        table.setSelectionBehavior(QAbstractItemView.SelectItems)
+        table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        table.setContextMenuPolicy(Qt.CustomContextMenu)
+        table.set_bulk_edit_handler(self._bulk_fill_team_cells)
+        table.set_delete_members_handler(self._delete_selected_team_members)
+        table.set_paste_handler(self._paste_team_cells)
+        table.customContextMenuRequested.connect(self._open_member_context_menu)
+        table.horizontalHeader().setDefaultAlignment(Qt.AlignCenter)
+        table.horizontalHeader().setMinimumSectionSize(48)
+        table.horizontalHeader().setFixedHeight(42)
+        table.verticalHeader().setVisible(False)
+        table.itemChanged.connect(self._on_team_table_item_changed)
+
+        box_layout.addWidget(table)
+        return box, table
+
+    def _populate_team_table(self, table: "TeamSectionTable", section: TeamSection, year: int, month: int) -> None:
         total_days = month_days(year, month)
+        month_part_col = total_days + 1
         today = date.today()
+        header_key = (year, month, section.name, today)
+        rows_key = (year, month, tuple(m.id for m in section.members))
 
-        for section in self.team_store.sections:
-            box = QGroupBox(section.name)
-            box_layout = QVBoxLayout(box)
-
-            table = TeamSectionTable()
-            table.setColumnCount(total_days + 2)
-            table.setObjectName(f"teamSectionTable::{section.id}")
-            table.setProperty("sectionId", section.id)
-            table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-            table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            table.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed | QAbstractItemView.AnyKeyPressed)
-            table.setSelectionBehavior(QAbstractItemView.SelectItems)
-            table.setSelectionMode(QAbstractItemView.ExtendedSelection)
-            table.setContextMenuPolicy(Qt.CustomContextMenu)
-            table.set_bulk_edit_handler(self._bulk_fill_team_cells)
-            table.set_delete_members_handler(self._delete_selected_team_members)
-            table.customContextMenuRequested.connect(self._open_member_context_menu)
-            table.horizontalHeader().setDefaultAlignment(Qt.AlignCenter)
-            table.horizontalHeader().setMinimumSectionSize(48)
-            table.horizontalHeader().setFixedHeight(42)
-            table.verticalHeader().setVisible(False)
-
-            month_part_col = total_days + 1
-            headers_top = [section.name]
-            headers_bottom = ["Nomes"]
-            for d in range(1, total_days + 1):
-                curr = date(year, month, d)
-                headers_top.append(WEEKDAY_LABELS[curr.weekday()])
-                headers_bottom.append(curr.strftime("%d/%m"))
-            headers_top.append("Participação")
-            headers_bottom.append("Mês")
-            table.setHorizontalHeaderLabels(headers_bottom)
-
-            for c, text in enumerate(headers_top):
-                item = table.horizontalHeaderItem(c)
-                if not item:
-                    item = QTableWidgetItem()
-                    table.setHorizontalHeaderItem(c, item)
-                item.setText(f"{text}\n{headers_bottom[c] if c > 0 else ""}".strip())
-                curr_date = date(year, month, c) if 0 < c <= total_days else None
-                curr_is_today = curr_date == today
-                if curr_is_today:
-                    item.setBackground(QColor(220, 38, 38))
-                    item.setForeground(QColor(0, 0, 0))
-                elif curr_date and curr_date.weekday() >= 5:
-                    item.setBackground(QColor(229, 231, 235))
-
-            table.setColumnWidth(0, 170)
-            for d in range(1, total_days + 1):
-                table.setColumnWidth(d, 52)
-            table.setColumnWidth(month_part_col, 90)
-
-            weekend_bg = QColor(229, 231, 235)
-            month_participation_bg = QColor(229, 231, 235)
-
-            for member in section.members:
-                r = table.rowCount()
-                table.insertRow(r)
-                name_item = QTableWidgetItem(member.name)
+        table.setObjectName(f"teamSectionTable::{section.id}")
+        table.setProperty("sectionId", section.id)
+        table.blockSignals(True)
+        try:
+            if table.property("teamHeaderKey") != repr(header_key):
+                self._fill_team_headers(table, section, year, month, today)
+                table.setProperty("teamHeaderKey", repr(header_key))
+
+            rebuild_rows = table.property("teamRowsKey") != repr(rows_key)
+            if rebuild_rows:
+                table.clearContents()
+                table.setRowCount(len(section.members) + 1)
+
+            weekend_days = {d for d in range(1, total_days + 1) if date(year, month, d).weekday() >= 5}
+            for r, member in enumerate(section.members):
+                name_item = self._team_item(table, r, 0)
+                if name_item.text() != member.name:
+                    name_item.setText(member.name)
                 name_item.setData(Qt.UserRole, member.id)
-                table.setItem(r, 0, name_item)
-                for d in range(1, total_days + 1):
-                    curr = date(year, month, d)
-                    key = curr.isoformat()
-                    value = member.entries.get(key, "")
-                    it = QTableWidgetItem(value)
-                    it.setTextAlignment(Qt.AlignCenter)
-                    if value in STATUS_COLORS:
-                        br, bg, bb, fr, fg, fb = STATUS_COLORS[value]
-                        it.setBackground(QColor(br, bg, bb))
-                        it.setForeground(QColor(fr, fg, fb))
-                    elif curr.weekday() >= 5:
-                        it.setBackground(weekend_bg)
-                    table.setItem(r, d, it)
-
-                month_total = QTableWidgetItem(str(monthly_k_count(member, year, month)))
-                month_total.setTextAlignment(Qt.AlignCenter)
-                month_total.setFlags(month_total.flags() & ~Qt.ItemIsEditable)
-                month_total.setBackground(month_participation_bg)
-                month_total.setForeground(QColor(0, 0, 0))
-                table.setItem(r, month_part_col, month_total)
-
-            footer_row = table.rowCount()
-            table.insertRow(footer_row)
-            part = QTableWidgetItem("Participação Dia")
-            part.setFlags(part.flags() & ~Qt.ItemIsEditable)
-            part.setTextAlignment(Qt.AlignCenter)
-            part.setBackground(QColor(255, 255, 255))
-            table.setItem(footer_row, 0, part)
-            for d in range(1, total_days + 1):
-                curr = date(year, month, d)
-                col_entries = []
-                for member in section.members:
-                    col_entries.append(member.entries.get(curr.isoformat(), ""))
-                total = participation_for_date(col_entries)
-                text = str(total) if total > 0 else ""
-                pit = QTableWidgetItem(text)
-                pit.setTextAlignment(Qt.AlignCenter)
-                pit.setFlags(pit.flags() & ~Qt.ItemIsEditable)
-                pit.setBackground(QColor(255, 255, 255) if text else weekend_bg)
-                table.setItem(footer_row, d, pit)
-
-            footer_month = QTableWidgetItem("")
-            footer_month.setTextAlignment(Qt.AlignCenter)
-            footer_month.setFlags(footer_month.flags() & ~Qt.ItemIsEditable)
-            footer_month.setBackground(month_participation_bg)
-            footer_month.setForeground(QColor(0, 0, 0))
-            table.setItem(footer_row, month_part_col, footer_month)
+                for d, value in enumerate(member.entries.month_codes(year, month), start=1):
+                    self._style_team_day_item(self._team_item(table, r, d), value, d in weekend_days)
+                self._update_team_month_total(table, r, member, year, month)
+
+            footer_row = len(section.members)
+            if rebuild_rows:
+                part = QTableWidgetItem("Participação Dia")
+                part.setFlags(part.flags() & ~Qt.ItemIsEditable)
+                part.setTextAlignment(Qt.AlignCenter)
+                part.setBackground(team_footer_brush())
+                table.setItem(footer_row, 0, part)
+
+                footer_month = QTableWidgetItem("")
+                footer_month.setTextAlignment(Qt.AlignCenter)
+                footer_month.setFlags(footer_month.flags() & ~Qt.ItemIsEditable)
+                footer_month.setBackground(team_participation_brush())
+                footer_month.setForeground(team_total_fg_brush())
+                table.setItem(footer_row, month_part_col, footer_month)
+            for d, total in enumerate(daily_participation(section.members, year, month), start=1):
+                self._set_team_day_footer(table, footer_row, d, total)
+        finally:
+            table.blockSignals(False)
 
+        if rebuild_rows:
+            table.setProperty("teamRowsKey", repr(rows_key))
             table.fit_height_to_rows()
 
-            table.itemChanged.connect(self._on_team_table_item_changed)
-            box_layout.addWidget(table)
-            self.tc_sections_layout.addWidget(box)
-
-        self.tc_sections_layout.addStretch()
+    def _fill_team_headers(self, table: QTableWidget, section: TeamSection, year: int, month: int, today: date) -> None:
+        total_days = month_days(year, month)
+        month_part_col = total_days + 1
+        table.setColumnCount(total_days + 2)
+
+        headers_top = [section.name]
+        headers_bottom = ["Nomes"]
+        for d in range(1, total_days + 1):
+            curr = date(year, month, d)
+            headers_top.append(WEEKDAY_LABELS[curr.weekday()])
+            headers_bottom.append(curr.strftime("%d/%m"))
+        headers_top.append("Participação")
+        headers_bottom.append("Mês")
+
+        for c, text in enumerate(headers_top):
+            item = QTableWidgetItem(f"{text}\n{headers_bottom[c] if c > 0 else ""}".strip())
+            curr_date = date(year, month, c) if 0 < c <= total_days else None
+            if curr_date == today:
+                item.setBackground(team_today_header_brush())
+                item.setForeground(team_total_fg_brush())
+            elif curr_date and curr_date.weekday() >= 5:
+                item.setBackground(team_weekend_brush())
+            table.setHorizontalHeaderItem(c, item)
+
+        table.setColumnWidth(0, 170)
+        for d in range(1, total_days + 1):
+            table.setColumnWidth(d, 52)
+        table.setColumnWidth(month_part_col, 90)
+
+    def _team_item(self, table: QTableWidget, row: int, col: int) -> QTableWidgetItem:
+        item = table.item(row, col)
+        if item is None:
+            item = QTableWidgetItem("")
+            if col > 0:
+                item.setTextAlignment(Qt.AlignCenter)
+            table.setItem(row, col, item)
+        return item
+
+    def _style_team_day_item(self, item: QTableWidgetItem, value: str, weekend: bool) -> None:
+        if item.text() != value:
+            item.setText(value)
+        code_brushes = team_code_brushes(value)
+        if code_brushes is not None:
+            item.setBackground(code_brushes[0])
+            item.setForeground(code_brushes[1])
+            return
+        if weekend:
+            item.setBackground(team_weekend_brush())
+        else:
+            item.setData(Qt.BackgroundRole, None)
+        item.setData(Qt.ForegroundRole, None)
+
+    def _update_team_month_total(self, table: QTableWidget, row: int, member: TeamMember, year: int, month: int) -> None:
+        month_part_col = month_days(year, month) + 1
+        month_total = table.item(row, month_part_col)
+        if month_total is None:
+            month_total = QTableWidgetItem("")
+            month_total.setTextAlignment(Qt.AlignCenter)
+            month_total.setFlags(month_total.flags() & ~Qt.ItemIsEditable)
+            month_total.setBackground(team_participation_brush())
+            month_total.setForeground(team_total_fg_brush())
+            table.setItem(row, month_part_col, month_total)
+        month_total.setText(str(monthly_k_count(member, year, month)))
+
+    def _update_team_day_footer(self, table: QTableWidget, section: TeamSection, year: int, month: int, day: int) -> None:
+        key = date(year, month, day).isoformat()
+        total = participation_for_date([member.entries.get(key, "") for member in section.members])
+        self._set_team_day_footer(table, len(section.members), day, total)
+
+    def _set_team_day_footer(self, table: QTableWidget, footer_row: int, day: int, total: int) -> None:
+        text = str(total) if total > 0 else ""
+        pit = table.item(footer_row, day)
+        if pit is None:
+            pit = QTableWidgetItem("")
+            pit.setTextAlignment(Qt.AlignCenter)
+            pit.setFlags(pit.flags() & ~Qt.ItemIsEditable)
+            table.setItem(footer_row, day, pit)
+        pit.setText(text)
+        pit.setBackground(team_footer_brush() if text else team_weekend_brush())
+
+    def _team_section_by_id(self, section_id: str) -> Optional[TeamSection]:
+        return next((s for s in self.team_store.sections if s.id == section_id), None)
+
+    def _refresh_team_cells(self, table: QTableWidget, section: TeamSection, cells: List[Tuple[int, int]]) -> None:
+        """Atualiza apenas as células editadas e os totais de linha/coluna afetados."""
+        year, month = self._selected_year_month()
+        rows = {row for row, _ in cells}
+        days = {day for _, day in cells}
+        table.blockSignals(True)
+        try:
+            for row, day in cells:
+                member = section.members[row]
+                value = member.entries.get(date(year, month, day).isoformat(), "")
+                self._style_team_day_item(self._team_item(table, row, day), value, date(year, month, day).weekday() >= 5)
+            for row in rows:
+                self._update_team_month_total(table, row, section.members[row], year, month)
+            for day in days:
+                self._update_team_day_footer(table, section, year, month, day)
+        finally:
+            table.blockSignals(False)
 
     def _create_team_section(self):
         year, month = self._selected_year_month()
@@ -2514,7 +2775,7 @@ class MainWindow(QMainWindow):
         except ValueError as e:
             QMessageBox.warning(self, "Time", str(e))
             return
-        self.refresh_team_control()
+        self._render_team_control()
 
     def _delete_team_section(self):
         year, month = self._selected_year_month()
@@ -2533,7 +2794,7 @@ class MainWindow(QMainWindow):
         if confirm != QMessageBox.Yes:
             return
         self.team_store.delete_section(section.id)
-        self.refresh_team_control()
+        self._render_team_control()
 
     def _open_add_team_member_dialog(self):
         year, month = self._selected_year_month()
@@ -2563,23 +2824,25 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            for member_name in names:
-                self.team_store.add_member(section.id, member_name)
+            with self.team_store.batch():
+                for member_name in names:
+                    self.team_store.add_member(section.id, member_name)
         except ValueError as e:
             QMessageBox.warning(self, "Adicionar funcionário", str(e))
             return
-        self.refresh_team_control()
+        self._render_team_control()
 
     def _bulk_fill_team_cells(self, table: QTableWidget, indexes, code: str) -> bool:
         if not indexes:
             return False
 
         footer_row = table.rowCount() - 1
+        month_part_col = table.columnCount() - 1
         targets: List[tuple[int, int]] = []
         for idx in indexes:
             row = idx.row()
             col = idx.column()
-            if row < 0 or col <= 0 or row >= footer_row:
+            if row < 0 or col <= 0 or row >= footer_row or col >= month_part_col:
                 continue
             member_item = table.item(row, 0)
             if not member_item or not str(member_item.data(Qt.UserRole) or ""):
@@ -2617,10 +2880,64 @@ class MainWindow(QMainWindow):
         if not updates:
             return False
 
-        for member_id, day, value in updates:
-            self.team_store.set_entry(section_id, member_id, date(year, month, day), value)
+        self.team_store.set_entries_bulk(
+            section_id,
+            ((member_id, date(year, month, day), value) for member_id, day, value in updates),
+        )
 
-        self.refresh_team_control()
+        section = self._team_section_by_id(section_id)
+        if section is None:
+            self._render_team_control()
+        else:
+            self._refresh_team_cells(table, section, targets)
+        return True
+
+    def _paste_team_cells(self, table: QTableWidget, text: str) -> bool:
+        """Cola um bloco copiado de planilha (linhas com \n, colunas com tab) a partir da célula atual."""
+        lines = (text or "").replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        if lines and lines[-1] == "":
+            lines.pop()
+        grid = [[cell.strip().upper() for cell in line.split("\t")] for line in lines]
+        if not grid:
+            return False
+
+        invalid = sorted({code for row in grid for code in row if code and code not in STATUS_COLORS})
+        if invalid:
+            QMessageBox.warning(
+                self,
+                "Legenda inválida",
+                f"Valores não reconhecidos: {', '.join(invalid)}.\nUse apenas: F, A, P, D, R, H, K.",
+            )
+            return True
+
+        year, month = self._selected_year_month()
+        self.team_store.set_period(year, month)
+        section_id = str(table.property("sectionId") or "")
+        section = self._team_section_by_id(section_id)
+        anchor = table.currentIndex()
+        if section is None or not anchor.isValid():
+            return False
+
+        total_days = month_days(year, month)
+        start_row, start_col = anchor.row(), max(anchor.column(), 1)
+        targets: List[Tuple[int, int]] = []
+        updates: List[Tuple[str, date, str]] = []
+        for i, row_codes in enumerate(grid):
+            row = start_row + i
+            if row >= len(section.members):
+                break
+            member_id = section.members[row].id
+            for j, code in enumerate(row_codes):
+                day = start_col + j
+                if day > total_days:
+                    break
+                targets.append((row, day))
+                updates.append((member_id, date(year, month, day), code))
+
+        if not updates:
+            return False
+        self.team_store.set_entries_bulk(section_id, updates)
+        self._refresh_team_cells(table, section, targets)
         return True
 
     def _on_team_table_item_changed(self, item: QTableWidgetItem):
@@ -2644,21 +2961,28 @@ class MainWindow(QMainWindow):
         if not member_id:
             return
 
+        section = self._team_section_by_id(section_id)
+        if section is None:
+            return
+        row = item.row()
+
         if item.column() == 0:
             try:
                 self.team_store.rename_member(section_id, member_id, item.text())
             except ValueError as e:
                 QMessageBox.warning(self, "Nome", str(e))
-            self.refresh_team_control()
+            table.blockSignals(True)
+            item.setText(section.members[row].name)
+            table.blockSignals(False)
             return
 
         day = item.column()
-        if day < 1:
+        if day < 1 or day > month_days(year, month):
             return
         code = (item.text() or "").strip().upper()
         if code and code not in STATUS_COLORS:
             QMessageBox.warning(self, "Legenda inválida", "Use apenas: F, A, P, D, R, H, K.")
-            self.refresh_team_control()
+            self._refresh_team_cells(table, section, [(row, day)])
             return
 
         if code != (item.text() or ""):
@@ -2671,7 +2995,7 @@ class MainWindow(QMainWindow):
         except ValueError as e:
             QMessageBox.warning(self, "Legenda", str(e))
             return
-        self.refresh_team_control()
+        self._refresh_team_cells(table, section, [(row, day)])
 
     def _open_member_context_menu(self, pos):
         table = self.sender()
@@ -2717,7 +3041,7 @@ class MainWindow(QMainWindow):
                     "Copiar Nome(s)",
                     f"{copied} nome(s) copiado(s) para o time '{payload['section_name']}'.",
                 )
-            self.refresh_team_control()
+            self._render_team_control()
             return
         if picked != delete_action:
             return
@@ -2749,6 +3073,10 @@ class MainWindow(QMainWindow):
         menu = QMenu(table)
         duplicate_action = menu.addAction("Duplicar demanda")
         delete_action = menu.addAction("Excluir demanda")
+        menu.addSeparator()
+        compact_action = menu.addAction("Linhas compactas")
+        compact_action.setCheckable(True)
+        compact_action.setChecked(self._row_mode == ROW_MODE_ELIDED)
         picked = menu.exec(table.viewport().mapToGlobal(pos))
         if picked is duplicate_action:
             self._duplicate_selected_demand(table)
@@ -2756,6 +3084,9 @@ class MainWindow(QMainWindow):
         if picked is delete_action:
             self._delete_selected_demands_from_table(table)
             return
+        if picked is compact_action:
+            self._set_row_mode(ROW_MODE_ELIDED if compact_action.isChecked() else ROW_MODE_WRAP)
+            return
 
     def _duplicate_selected_demand(self, table: QTableWidget):
         selected_rows = table.selectionModel().selectedRows()
@@ -2846,10 +3177,11 @@ class MainWindow(QMainWindow):
         if dlg.exec() != QDialog.Accepted:
             return False
 
-        for member_id in dlg.selected_member_ids():
-            self.team_store.remove_member(section_id, member_id)
+        with self.team_store.batch():
+            for member_id in dlg.selected_member_ids():
+                self.team_store.remove_member(section_id, member_id)
         dlg.reset_state()
-        self.refresh_team_control()
+        self._render_team_control()
         return True
 
     # Tabs
@@ -3100,7 +3432,6 @@ class MainWindow(QMainWindow):
                     )
                 )
             self.refresh_all()
-            self.deadline_scheduler.check_now()
 
     def export_team_control_csv(self):
         year, month = self._selected_year_month()
@@ -3125,6 +3456,23 @@ class MainWindow(QMainWindow):
 
         QMessageBox.information(self, "Relatório baixado", "Relatório CSV salvo com sucesso.")
 
+    def export_team_analytics_csv(self):
+        year, _month = self._selected_year_month()
+        default_name = f"controle_time_{year}.csv"
+        export_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Salvar relatório anual de controle de time",
+            os.path.join(self.store.base_dir, default_name),
+            "CSV (*.csv)",
+        )
+        if not export_path:
+            return
+        if not export_path.lower().endswith(".csv"):
+            export_path = f"{export_path}.csv"
+
+        write_team_analytics_csv(export_path, self.team_store, date(year, 1, 1), date(year, 12, 31))
+        QMessageBox.information(self, "Relatório baixado", "Relatório CSV salvo com sucesso.")
+
     def export_demands_csv(self):
         default_name = "demandas_export.csv"
         default_path = os.path.join(self.store.base_dir, default_name)
@@ -0,0 +1,74 @@
+"""Mede o tempo até o primeiro byte (TTFB) das gerações de IA num servidor local.
+
+Compara o comportamento anterior (um OpenAIWritingClient novo, com pool de conexões
+novo, a cada clique em "Gerar") com o WritingClientPool, que reaproveita o cliente e
+a conexão keep-alive. O servidor é o stub de tests/fake_openai_server.py, sem TLS:
+com a API real a diferença inclui ainda o handshake TLS de cada conexão nova.
+
+Uso: python benchmarks/bench_ai_client_reuse.py [gerações]
+"""
+from __future__ import annotations
+
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+from ai_writing.openai_client import OpenAIWritingClient, WritingClientPool
+from fake_openai_server import FakeOpenAIServer
+
+
+def _ttfb_hook(samples: list):
+    def on_response(response) -> None:
+        # Chamado ao receber os cabeçalhos, antes de ler o corpo.
+        samples.append(time.perf_counter() - response.request.extensions["bench_start"])
+
+    def on_request(request) -> None:
+        request.extensions["bench_start"] = time.perf_counter()
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+def _instrument(client: OpenAIWritingClient, samples: list) -> OpenAIWritingClient:
+    client.client._client.event_hooks = _ttfb_hook(samples)
+    return client
+
+
+def _run(server: FakeOpenAIServer, total: int, reuse: bool) -> tuple[list, list]:
+    ttfb: list = []
+    totals: list = []
+    pool = WritingClientPool(base_url=server.base_url, max_retries=1)
+    for _ in range(total):
+        start = time.perf_counter()
+        if reuse:
+            client = pool.get("gpt-5.2", 0.3)
+        else:
+            client = OpenAIWritingClient(base_url=server.base_url, max_retries=1)
+        _instrument(client, ttfb)
+        client.suggest("Texto da demanda", "Reescreva.", {"field": "Descrição"})
+        totals.append(time.perf_counter() - start)
+        if not reuse:
+            client.close()
+    pool.reset()
+    return ttfb, totals
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    os.environ.setdefault("OPENAI_API_KEY", "bench-key")
+    for label, reuse in (("cliente novo por geração", False), ("cliente reaproveitado", True)):
+        with FakeOpenAIServer("OK") as server:
+            ttfb, totals = _run(server, total, reuse)
+            connections = server.connections
+        print(
+            f"{label:<26} TTFB mediano {statistics.median(ttfb) * 1000:6.2f} ms | "
+            f"total mediano {statistics.median(totals) * 1000:6.2f} ms | conexões {connections}"
+        )
+
+
+if __name__ == "__main__":
+    main()
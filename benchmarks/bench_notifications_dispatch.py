@@ -0,0 +1,71 @@
+"""Mede dispatches por segundo do NotificationDispatcher.
+
+Compara a conexão SQLite persistente (WAL) com o comportamento anterior, que
+abria uma conexão nova a cada operação. O histórico criptografado é desligado
+nas duas rodadas para medir apenas o custo do banco.
+
+Uso: python benchmarks/bench_notifications_dispatch.py [quantidade]
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notifications.dispatcher import NotificationDispatcher
+from notifications.models import Notification, NotificationType
+from notifications.store import NotificationStore
+
+
+class _PerOperationConnectionStore(NotificationStore):
+    @contextmanager
+    def _connect(self):
+        con = sqlite3.connect(self.db_path)
+        con.row_factory = sqlite3.Row
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+
+class _Sink:
+    def notify(self, title, body):
+        pass
+
+
+def _run(store_cls, total: int) -> float:
+    with tempfile.TemporaryDirectory() as base_dir:
+        store = store_cls(base_dir)
+        store._record_history = lambda rows: None
+        dispatcher = NotificationDispatcher(store, _Sink(), _Sink(), is_app_focused=lambda: True)
+        start = time.perf_counter()
+        for i in range(total):
+            dispatcher.dispatch(
+                Notification(
+                    type=NotificationType.PRAZO_ESTOURADO,
+                    title=f"Demanda #{i} atrasada",
+                    body="Prazo vencido.",
+                    payload={"demand_id": str(i), "deadline_date": "2026-01-01", "event_code": "deadline_overdue"},
+                )
+            )
+        elapsed = time.perf_counter() - start
+        store.close()
+        return total / elapsed
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    before = _run(_PerOperationConnectionStore, total)
+    after = _run(NotificationStore, total)
+    print(f"conexão por operação:  {before:,.0f} dispatches/s")
+    print(f"conexão persistente:   {after:,.0f} dispatches/s ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Mede a busca textual da central de notificações.
+
+Preenche o banco com muitas notificações e compara a primeira página da busca
+FTS5 com a busca por LIKE usada quando o SQLite não tem FTS5.
+
+Uso: python benchmarks/bench_notifications_search.py [quantidade]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notifications.models import Notification, NotificationType
+from notifications.store import NotificationStore
+
+QUERIES = ["1234", "atrasada 4321", "nova demanda", "prazo 0101"]
+
+
+def _fill(store: NotificationStore, total: int) -> None:
+    batch = []
+    for i in range(total):
+        overdue = i % 3 == 0
+        batch.append(
+            Notification(
+                type=NotificationType.PRAZO_ESTOURADO if overdue else NotificationType.NOVA_DEMANDA,
+                title=f"Demanda #{i} atrasada" if overdue else "Nova demanda atribuída",
+                body=f"Prazo em {i % 28 + 1:02d}/01/2026." if overdue else f"Demanda #{i} criada com sucesso.",
+                payload={"demand_id": str(i), "deadline_date": "2026-01-01", "event_code": f"bench-{i}"},
+            )
+        )
+        if len(batch) == 5000:
+            store.insert_many(batch)
+            batch = []
+    if batch:
+        store.insert_many(batch)
+
+
+def _measure(store: NotificationStore, query: str, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        store.search_notifications(query)
+    return (time.perf_counter() - start) * 1000 / rounds
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as base_dir:
+        store = NotificationStore(base_dir)
+        store._record_history = lambda rows: None
+        _fill(store, total)
+        print(f"{total:,} notificações (ms por busca, primeira página)")
+        print(f"{'consulta':<16}{'LIKE':>10}{'FTS5':>10}")
+        for query in QUERIES:
+            store._fts_enabled = True
+            fts_ms = _measure(store, query, rounds=20)
+            store._fts_enabled = False
+            like_ms = _measure(store, query, rounds=3)
+            print(f"{query:<16}{like_ms:>10.2f}{fts_ms:>10.2f}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Mede células estilizadas por segundo com e sem o cache de estilos.
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_style_cache.py [linhas]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
+
+from ui_style_cache import priority_brush, status_brush, timing_brush
+from ui_theme import priority_text_color, status_color, timing_color
+
+STATUS = ["Em andamento", "Concluído", "Não iniciada", "Cancelado", "Bloqueado"]
+TIMING = ["No prazo", "Atrasado", "Concluído antes do prazo", "Sem prazo"]
+PRIORIDADES = ["Alta", "Média", "Baixa"]
+
+
+def _style_allocated(it: QTableWidgetItem, i: int) -> None:
+    it.setBackground(QColor(*status_color(STATUS[i % len(STATUS)])))
+    color = priority_text_color(PRIORIDADES[i % len(PRIORIDADES)])
+    if color:
+        it.setForeground(QColor(*color))
+    it.setBackground(QColor(*timing_color(TIMING[i % len(TIMING)])))
+
+
+def _style_cached(it: QTableWidgetItem, i: int) -> None:
+    it.setBackground(status_brush(STATUS[i % len(STATUS)]))
+    brush = priority_brush(PRIORIDADES[i % len(PRIORIDADES)])
+    if brush is not None:
+        it.setForeground(brush)
+    it.setBackground(timing_brush(TIMING[i % len(TIMING)]))
+
+
+def _run(rows: int, style) -> float:
+    table = QTableWidget(rows, 3)
+    start = time.perf_counter()
+    for r in range(rows):
+        for c in range(3):
+            it = QTableWidgetItem("x")
+            style(it, r + c)
+            table.setItem(r, c, it)
+    elapsed = time.perf_counter() - start
+    table.deleteLater()
+    return (rows * 3) / elapsed
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    app = QApplication.instance() or QApplication([])
+    allocated = _run(rows, _style_allocated)
+    cached = _run(rows, _style_cached)
+    print(f"alocando QColor por célula: {allocated:,.0f} células/s")
+    print(f"cache compartilhado:        {cached:,.0f} células/s ({cached / allocated:.2f}x)")
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
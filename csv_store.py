@@ -10,7 +10,7 @@ import os
 import uuid
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 
 from validation import validate_payload, normalize_prazo_text, ValidationError
 
@@ -18,6 +18,7 @@ CSV_NAME = "data.csv"
 DELIMITER = ";"
 ENC_MAGIC = b"MYDEMANDS_ENC_V1"
 KEY_FILE_NAME = ".demandas.key"
+CLOSED_STATUSES = ("Concluído", "Cancelado")
 
 DISPLAY_COLUMNS = [
     "ID",
@@ -233,12 +234,19 @@ class DemandRow:
     data: Dict[str, str]
 
 
+def is_open_demand(row: Dict[str, Any]) -> bool:
+    """Critério único de demanda em aberto (aba de pendências e agendador de prazos)."""
+    return (row.get("Status") or "").strip() not in CLOSED_STATUSES
+
+
 class CsvStore:
     def __init__(self, base_dir: str):
         self.base_dir = base_dir
         self.csv_path = os.path.join(base_dir, CSV_NAME)
         self.key_path = os.path.join(base_dir, KEY_FILE_NAME)
         self.rows: List[DemandRow] = []
+        # Chamados após cada alteração (inclusão, edição, exclusão, importação); não após load().
+        self.change_listeners: List[Callable[[], None]] = []
         self._crypto_key = self._load_or_create_key()
         self.load()
 
@@ -384,7 +392,7 @@ class CsvStore:
             normalized["_id"] = _id
             self.rows.append(DemandRow(_id=_id, data=normalized))
 
-        self.save()
+        self._write_rows()
 
     def _atomic_save(self):
         buf = io.StringIO()
@@ -394,11 +402,16 @@ class CsvStore:
             w.writerow({c: dr.data.get(c, "") for c in CSV_COLUMNS})
         self._write_csv_text(buf.getvalue())
 
-    def save(self):
+    def _write_rows(self):
         for dr in self.rows:
             dr.data["Prazo"] = normalize_prazo_text(dr.data.get("Prazo", ""))
         self._atomic_save()
 
+    def save(self):
+        self._write_rows()
+        for listener in list(self.change_listeners):
+            listener()
+
     def _next_numeric_id(self) -> str:
         used_ids = set()
         for dr in self.rows:
@@ -559,7 +572,7 @@ class CsvStore:
             if d not in (x.get("_prazos_dates") or []):
                 continue
             status = (x.get("Status") or "").strip()
-            if status in ("Concluído", "Cancelado"):
+            if status in CLOSED_STATUSES:
                 continue
             # adicional: se estiver "concluído-like", também sai
             if (x.get("Data Conclusão") or "").strip() and (x.get("% Conclusão") or "").strip() == "100%":
@@ -568,10 +581,7 @@ class CsvStore:
         return out
 
     def tab_pending_all(self) -> List[Dict[str, Any]]:
-        return [
-            x for x in self.build_view()
-            if (x.get("Status") or "").strip() not in ("Concluído", "Cancelado")
-        ]
+        return [x for x in self.build_view() if is_open_demand(x)]
 
     def tab_concluidas_between(self, start: date, end: date) -> List[Dict[str, Any]]:
         out = []
@@ -0,0 +1,57 @@
+"""Cifra local dos arquivos do app: keystream SHA-256 + HMAC-SHA256 sobre (magic, nonce, cifra).
+
+Cada store define só o seu cabeçalho (magic) e o formato em que guarda os registros.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import os
+
+KEY_SIZE = 32
+NONCE_SIZE = 16
+MAC_SIZE = 32
+
+
+def load_or_create_key(path: str) -> bytes:
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            key = f.read()
+        if len(key) >= KEY_SIZE:
+            return key[:KEY_SIZE]
+    key = os.urandom(KEY_SIZE)
+    with open(path, "wb") as f:
+        f.write(key)
+    try:
+        os.chmod(path, 0o600)
+    except Exception:
+        pass
+    return key
+
+
+def keystream_xor(key: bytes, nonce: bytes, data: bytes) -> bytes:
+    blocks = (len(data) + 31) // 32
+    stream = b"".join(
+        hashlib.sha256(key + nonce + counter.to_bytes(8, "big")).digest() for counter in range(blocks)
+    )[: len(data)]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(stream, "big")).to_bytes(len(data), "big")
+
+
+def seal(key: bytes, magic: bytes, plain: bytes) -> bytes:
+    """Devolve base64(nonce + cifra + HMAC), sem quebras de linha."""
+    nonce = os.urandom(NONCE_SIZE)
+    cipher = keystream_xor(key, nonce, plain)
+    mac = hmac.new(key, magic + nonce + cipher, hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(nonce + cipher + mac)
+
+
+def unseal(key: bytes, magic: bytes, record: bytes, integrity_message: str = "Falha de integridade no registro criptografado") -> bytes:
+    raw = base64.urlsafe_b64decode(record)
+    if len(raw) < NONCE_SIZE + MAC_SIZE:
+        raise ValueError("Registro criptografado inválido")
+    nonce, cipher, mac = raw[:NONCE_SIZE], raw[NONCE_SIZE:-MAC_SIZE], raw[-MAC_SIZE:]
+    expected = hmac.new(key, magic + nonce + cipher, hashlib.sha256).digest()
+    if not hmac.compare_digest(mac, expected):
+        raise ValueError(integrity_message)
+    return keystream_xor(key, nonce, cipher)
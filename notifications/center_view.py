@@ -1,20 +1,179 @@
 from __future__ import annotations
 
-from typing import Callable, Optional
+from collections import OrderedDict
+from typing import Callable, List, Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QComboBox,
     QDialog,
     QHBoxLayout,
+    QLineEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
 )
 
-from .models import Notification, NotificationType
-from .store import NotificationStore
+from .models import Notification, NotificationSummary, NotificationType
+from .store import NOTIFICATION_PAGE_SIZE, NotificationStore
+
+NOTIFICATION_HEADERS = ["Data", "Tipo", "Título", "Mensagem", "Status"]
+CACHED_PAGES = 8
+SEARCH_DEBOUNCE_MS = 250
+
+
+class NotificationTableModel(QAbstractTableModel):
+    """Modelo paginado da central: busca páginas sob demanda (canFetchMore/fetchMore).
+
+    Por página guarda só a âncora da consulta (último id da página anterior) e uma
+    assinatura dos ids; o conteúdo fica num cache LRU de poucas páginas. Uma página
+    descartada é relida pela âncora e, se não bater com a assinatura (exclusões ou
+    inserções no meio), o modelo é recarregado. Com texto de busca, as páginas vêm da
+    busca textual, em ordem de relevância e por offset.
+    """
+
+    def __init__(self, store: NotificationStore, page_size: int = NOTIFICATION_PAGE_SIZE, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.page_size = page_size
+        self.type_filter: Optional[NotificationType] = None
+        self.read_filter: Optional[bool] = None
+        self.search_text = ""
+        self._row_count = 0
+        self._anchors: List[Optional[int]] = []
+        self._signatures: List[int] = []
+        self._tail_id: Optional[int] = None
+        self._pages: "OrderedDict[int, List[NotificationSummary]]" = OrderedDict()
+        self._exhausted = False
+        self._reload_pending = False
+
+    def set_filters(self, type_filter: Optional[NotificationType], read_filter: Optional[bool], search_text: str = "") -> None:
+        self.type_filter = type_filter
+        self.read_filter = read_filter
+        self.search_text = search_text.strip()
+        self.reload()
+
+    def reload(self) -> None:
+        self.beginResetModel()
+        self._row_count = 0
+        self._anchors = []
+        self._signatures = []
+        self._tail_id = None
+        self._pages.clear()
+        self._exhausted = False
+        self._reload_pending = False
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(NOTIFICATION_HEADERS)
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid() or self._exhausted:
+            return
+        page_index = len(self._anchors)
+        anchor = self._tail_id
+        page = self._query_page(page_index, anchor)
+        if len(page) < self.page_size:
+            self._exhausted = True
+        if not page:
+            return
+        first = self._row_count
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._anchors.append(anchor)
+        self._signatures.append(_page_signature(page))
+        self._row_count += len(page)
+        self._tail_id = page[-1].id
+        self._remember_page(page_index, page)
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(NOTIFICATION_HEADERS):
+            return NOTIFICATION_HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role not in (Qt.DisplayRole, Qt.ToolTipRole, Qt.UserRole):
+            return None
+        item = self.summary(index.row())
+        if item is None:
+            return None
+        if role == Qt.UserRole:
+            return item.id
+        col = index.column()
+        if col == 0:
+            return item.timestamp_display()
+        if col == 1:
+            return item.type.value
+        if col == 2:
+            return item.title
+        if col == 3:
+            return item.body
+        return "Lida" if item.read else "Não lida"
+
+    def notification_id(self, row: int) -> Optional[int]:
+        item = self.summary(row)
+        return item.id if item is not None else None
+
+    def summary(self, row: int) -> Optional[NotificationSummary]:
+        if not 0 <= row < self._row_count:
+            return None
+        page_index = row // self.page_size
+        page = self._pages.get(page_index)
+        if page is None:
+            page = self._load_page(page_index)
+            if page is None:
+                return None
+        else:
+            self._pages.move_to_end(page_index)
+        offset = row - page_index * self.page_size
+        return page[offset] if offset < len(page) else None
+
+    def _load_page(self, page_index: int) -> Optional[List[NotificationSummary]]:
+        """Relê uma página descartada; se ela mudou desde a primeira leitura, agenda um reload."""
+        page = self._query_page(page_index, self._anchors[page_index])
+        if _page_signature(page) != self._signatures[page_index]:
+            if not self._reload_pending:
+                self._reload_pending = True
+                QTimer.singleShot(0, self.reload)
+            return None
+        self._remember_page(page_index, page)
+        return page
+
+    def _query_page(self, page_index: int, before_id: Optional[int]) -> List[NotificationSummary]:
+        if self.search_text:
+            return self.store.search_notifications(
+                self.search_text,
+                type_filter=self.type_filter,
+                read_filter=self.read_filter,
+                offset=page_index * self.page_size,
+                limit=self.page_size,
+            )
+        return self.store.list_notification_page(
+            type_filter=self.type_filter,
+            read_filter=self.read_filter,
+            before_id=before_id,
+            limit=self.page_size,
+        )
+
+    def _remember_page(self, page_index: int, page: List[NotificationSummary]) -> None:
+        self._pages[page_index] = page
+        self._pages.move_to_end(page_index)
+        while len(self._pages) > CACHED_PAGES:
+            self._pages.popitem(last=False)
+
+
+def _page_signature(page: List[NotificationSummary]) -> int:
+    return hash(tuple(item.id for item in page))
 
 
 class NotificationCenterDialog(QDialog):
@@ -42,14 +201,27 @@ class NotificationCenterDialog(QDialog):
         self.read_filter.addItem("Todas", None)
         self.read_filter.addItem("Não lidas", False)
         self.read_filter.addItem("Lidas", True)
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Buscar no título ou na mensagem")
+        self.search_edit.setClearButtonEnabled(True)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.refresh)
+        self.search_edit.textChanged.connect(self._schedule_search)
+        self.search_edit.returnPressed.connect(self.refresh)
 
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(["Data", "Tipo", "Título", "Mensagem", "Status"])
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.itemSelectionChanged.connect(self._update_mark_button_label)
-        self.table.itemDoubleClicked.connect(self._open_selected)
+        self.model = NotificationTableModel(store, parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.selectionModel().selectionChanged.connect(self._update_mark_button_label)
+        self.table.doubleClicked.connect(self._open_selected)
 
         filter_row = QHBoxLayout()
+        filter_row.addWidget(self.search_edit, 1)
         filter_row.addWidget(self.type_filter)
         filter_row.addWidget(self.read_filter)
         refresh_btn = QPushButton("Filtrar")
@@ -58,11 +230,14 @@ class NotificationCenterDialog(QDialog):
         update_pending_btn.clicked.connect(self.refresh_pending_notifications)
         self.mark_toggle_btn = QPushButton("Marcar como lida")
         self.mark_toggle_btn.clicked.connect(self.toggle_selected_read_status)
+        mark_all_btn = QPushButton("Marcar todas como lidas")
+        mark_all_btn.clicked.connect(self.mark_all_as_read)
         delete_btn = QPushButton("Excluir")
         delete_btn.clicked.connect(self.delete_selected_notifications)
         filter_row.addWidget(refresh_btn)
         filter_row.addWidget(update_pending_btn)
         filter_row.addWidget(self.mark_toggle_btn)
+        filter_row.addWidget(mark_all_btn)
         filter_row.addWidget(delete_btn)
 
         root = QVBoxLayout(self)
@@ -72,76 +247,63 @@ class NotificationCenterDialog(QDialog):
         self.refresh()
 
     def refresh(self) -> None:
-        type_filter = self.type_filter.currentData()
-        read_filter = self.read_filter.currentData()
-        rows = self.store.list_notifications(type_filter=type_filter, read_filter=read_filter)
-        self.table.setRowCount(len(rows))
-        for i, n in enumerate(rows):
-            self._set_row(i, n)
+        self._search_timer.stop()
+        self.model.set_filters(self.type_filter.currentData(), self.read_filter.currentData(), self.search_edit.text())
         self._update_mark_button_label()
 
-    def _set_row(self, row: int, n: Notification) -> None:
-        values = [
-            n.timestamp.strftime("%d/%m/%Y %H:%M"),
-            n.type.value,
-            n.title,
-            n.body,
-            "Lida" if n.read else "Não lida",
-        ]
-        for col, value in enumerate(values):
-            item = QTableWidgetItem(value)
-            item.setData(Qt.UserRole, n.id)
-            self.table.setItem(row, col, item)
+    def _schedule_search(self, _text: str = "") -> None:
+        self._search_timer.start()
 
     def _selected_notification_ids(self) -> list[int]:
         selected_ids: list[int] = []
         for idx in self.table.selectionModel().selectedRows():
-            item = self.table.item(idx.row(), 0)
-            if not item:
-                continue
-            notif_id = item.data(Qt.UserRole)
+            notif_id = self.model.notification_id(idx.row())
             if notif_id:
                 selected_ids.append(int(notif_id))
         return selected_ids
 
-    def _selected_notification(self) -> Notification | None:
+    def _selected_summary(self) -> NotificationSummary | None:
         idxs = self.table.selectionModel().selectedRows()
         if not idxs:
             return None
-        row = idxs[0].row()
-        item = self.table.item(row, 0)
-        if not item:
-            return None
-        notif_id = item.data(Qt.UserRole)
-        if not notif_id:
+        return self.model.summary(idxs[0].row())
+
+    def _selected_notification(self) -> Notification | None:
+        # O payload só é decodificado aqui, ao abrir a notificação.
+        summary = self._selected_summary()
+        if summary is None:
             return None
-        return self.store.get_notification_by_id(int(notif_id))
+        return self.store.get_notification_by_id(summary.id)
 
     def _update_mark_button_label(self) -> None:
-        notification = self._selected_notification()
+        notification = self._selected_summary()
         if notification and notification.read:
             self.mark_toggle_btn.setText("Marcar como não lida")
         else:
             self.mark_toggle_btn.setText("Marcar como lida")
 
     def toggle_selected_read_status(self) -> None:
-        selected = self._selected_notification()
+        selected = self._selected_summary()
         if selected is None:
             return
         ids = self._selected_notification_ids()
         if selected.read:
-            for notif_id in ids:
-                self.store.mark_as_unread(notif_id)
+            self.store.mark_many_unread(ids)
         else:
-            for notif_id in ids:
-                self.store.mark_as_read(notif_id)
+            self.store.mark_many_read(ids)
+        self.refresh()
+        self._notify_change()
+
+    def mark_all_as_read(self) -> None:
+        self.store.mark_all_read()
         self.refresh()
         self._notify_change()
 
     def delete_selected_notifications(self) -> None:
         ids = self._selected_notification_ids()
-        for notif_id in ids:
-            self.store.delete_notification(notif_id)
+        if not ids:
+            return
+        self.store.delete_many(ids)
         self.refresh()
         self._notify_change()
 
@@ -2,13 +2,35 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Callable
+from typing import Callable, Dict, Iterable, List
 
-from .models import Channel, Notification
+from .models import Channel, Notification, NotificationType, Preferences
 from .store import NotificationStore
 
 LOGGER = logging.getLogger(__name__)
 
+SUMMARY_LABELS: Dict[NotificationType, tuple[str, str]] = {
+    NotificationType.NOVA_DEMANDA: ("nova demanda", "novas demandas"),
+    NotificationType.ALTERACAO_STATUS: ("alteração de status", "alterações de status"),
+    NotificationType.PRAZO_PROXIMO: ("prazo para hoje", "prazos para hoje"),
+    NotificationType.PRAZO_ESTOURADO: ("demanda atrasada", "demandas atrasadas"),
+    NotificationType.MENSAGEM_GERAL_ERRO: ("mensagem de erro", "mensagens de erro"),
+}
+
+
+def summarize_notifications(notifications: List[Notification]) -> tuple[str, str]:
+    """Título e corpo de um único aviso que resume várias notificações (ex.: "37 demandas atrasadas")."""
+    counts: Dict[NotificationType, int] = {}
+    for notification in notifications:
+        counts[notification.type] = counts.get(notification.type, 0) + 1
+    parts = []
+    for notification_type, count in counts.items():
+        singular, plural = SUMMARY_LABELS.get(notification_type, ("notificação", "notificações"))
+        parts.append(f"{count} {singular if count == 1 else plural}")
+    if len(parts) == 1:
+        return parts[0], "Abra a Central de Notificações para ver os detalhes."
+    return f"{len(notifications)} novas notificações", ", ".join(parts)
+
 
 class NotificationDispatcher:
     def __init__(
@@ -36,15 +58,36 @@ class NotificationDispatcher:
             return None
 
         notification_id = self.store.insert(notification)
+        self._present(pref, notification.title, notification.body)
+        return notification_id
 
+    def dispatch_many(self, notifications: Iterable[Notification]) -> List[int]:
+        """Despacha um lote: uma leitura de preferências, uma transação e um único aviso."""
+        pref = self.store.load_preferences()
+        enabled = [n for n in notifications if pref.type_enabled(n.type)]
+        if not enabled:
+            return []
+
+        inserted = self.store.insert_many(enabled)
+        if not inserted:
+            LOGGER.info("Lote sem ocorrências novas (%d recebidas).", len(enabled))
+            return []
+
+        if len(inserted) == 1:
+            title, body = inserted[0][0].title, inserted[0][0].body
+        else:
+            title, body = summarize_notifications([n for n, _ in inserted])
+        self._present(pref, title, body)
+        return [notification_id for _, notification_id in inserted]
+
+    def _present(self, pref: Preferences, title: str, body: str) -> None:
         if pref.is_muted(time.time()):
-            return notification_id
+            return
 
         if self.is_app_focused() and pref.channel_enabled(Channel.IN_APP):
-            self.inapp_notifier.notify(notification.title, notification.body)
+            self.inapp_notifier.notify(title, body)
         elif pref.channel_enabled(Channel.SYSTEM):
-            self.system_notifier.notify(notification.title, notification.body)
+            self.system_notifier.notify(title, body)
 
         if pref.channel_enabled(Channel.SOUND) and self.play_sound:
             self.play_sound()
-        return notification_id
@@ -47,6 +47,24 @@ class Notification:
     id: int | None = None
 
 
+@dataclass(frozen=True)
+class NotificationSummary:
+    """Linha da central de notificações; sem payload e com o timestamp ainda em texto ISO."""
+
+    id: int
+    timestamp: str
+    type: NotificationType
+    title: str
+    body: str
+    read: bool
+
+    def timestamp_display(self) -> str:
+        try:
+            return datetime.fromisoformat(self.timestamp).strftime("%d/%m/%Y %H:%M")
+        except ValueError:
+            return self.timestamp
+
+
 @dataclass
 class Preferences:
     enabled_types: Dict[NotificationType, bool] = field(
@@ -61,6 +79,11 @@ class Preferences:
     )
     scheduler_interval_minutes: int = 15
     muted_until_epoch: float = 0.0
+    # Retenção: notificações lidas e ocorrências já reconhecidas (0 = sem limite).
+    retention_days: int = 180
+    retention_max_read: int = 5000
+    occurrence_retention_days: int = 365
+    occurrence_max_acknowledged: int = 20000
 
     def type_enabled(self, notification_type: NotificationType) -> bool:
         return bool(self.enabled_types.get(notification_type, True))
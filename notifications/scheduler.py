@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import heapq
+import itertools
+from bisect import bisect_left
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
-from typing import Iterable, Protocol, List
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Mapping, Optional, Protocol, Tuple
 
-from PySide6.QtCore import QObject, QTimer
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
 
 from csv_store import parse_prazos_list
 from .models import Notification, NotificationType
 
+# QTimer aceita no máximo ~24 dias; o intervalo configurado limita ainda mais o sono.
+MAX_TIMER_MS = 2**31 - 1
+
 
 class TimeProvider(Protocol):
     def now(self) -> datetime: ...
@@ -29,60 +35,332 @@ class DeadlineEvent:
     notification_type: NotificationType
 
 
+# (ID, texto do Prazo, datas já interpretadas ou None)
+DemandSnapshot = Tuple[Tuple[str, str, Optional[Tuple[date, ...]]], ...]
+IndexEntry = Tuple[str, Tuple[date, ...]]
+
+
+@dataclass(frozen=True)
+class ScanResult:
+    """Diferença entre o índice conhecido e um retrato das demandas abertas."""
+
+    full: bool
+    updates: Tuple[Tuple[str, str, Tuple[date, ...]], ...]
+    removed: Tuple[str, ...]
+    # Próxima mudança de estado de cada demanda atualizada (None quando não há mais nenhuma).
+    next_transitions: Tuple[Tuple[str, Optional[datetime]], ...]
+    pending: Tuple[Tuple[str, date, NotificationType], ...]
+
+
+def _deadline_state(deadline: date, today: date) -> Optional[NotificationType]:
+    delta = deadline - today
+    if delta < timedelta(days=0):
+        return NotificationType.PRAZO_ESTOURADO
+    if delta <= timedelta(days=1):
+        return NotificationType.PRAZO_PROXIMO
+    return None
+
+
+def _due_at(deadline: date) -> datetime:
+    return datetime.combine(deadline - timedelta(days=1), time.min)
+
+
+def _overdue_at(deadline: date) -> datetime:
+    return datetime.combine(deadline + timedelta(days=1), time.min)
+
+
+def _next_transition(deadlines: Tuple[date, ...], after: datetime) -> Optional[datetime]:
+    """Primeiro instante depois de `after` em que algum prazo (lista ordenada) muda de estado."""
+    # Prazos anteriores a after.date() já estão estourados; dos seguintes só os dois
+    # primeiros podem ter a próxima mudança (a de d+2 em diante começa em d+1).
+    i = bisect_left(deadlines, after.date())
+    candidates = [
+        when
+        for deadline in deadlines[i:i + 2]
+        for when in (_due_at(deadline), _overdue_at(deadline))
+        if when > after
+    ]
+    return min(candidates) if candidates else None
+
+
+def _changed_at(deadlines: Tuple[date, ...], when: datetime) -> List[date]:
+    """Prazos que mudam de estado exatamente em `when`."""
+    day = when.date()
+    return [deadline for deadline in (day - timedelta(days=1), day + timedelta(days=1)) if deadline in deadlines]
+
+
+def _current_states(deadlines: Tuple[date, ...], today: date) -> List[Tuple[date, NotificationType]]:
+    """Estado atual a anunciar: só o prazo estourado mais recente e os que vencem hoje/amanhã."""
+    i = bisect_left(deadlines, today)
+    states = []
+    if i > 0:
+        states.append((deadlines[i - 1], NotificationType.PRAZO_ESTOURADO))
+    for deadline in deadlines[i:i + 2]:
+        if _deadline_state(deadline, today) is not None:
+            states.append((deadline, NotificationType.PRAZO_PROXIMO))
+    return states
+
+
+def _build_notification(demand_id: str, deadline: date, notification_type: NotificationType) -> Notification:
+    if notification_type == NotificationType.PRAZO_ESTOURADO:
+        return Notification(
+            type=NotificationType.PRAZO_ESTOURADO,
+            title=f"Demanda #{demand_id} atrasada",
+            body=f"Prazo em {deadline.strftime('%d/%m/%Y')}.",
+            payload={
+                "demand_id": demand_id,
+                "route": "atrasadas",
+                "deadline_date": deadline.isoformat(),
+                "event_code": "deadline_overdue",
+            },
+        )
+    return Notification(
+        type=NotificationType.PRAZO_PROXIMO,
+        title=f"Prazo hoje: #{demand_id}",
+        body=f"Demanda vence em {deadline.strftime('%d/%m/%Y')}.",
+        payload={
+            "demand_id": demand_id,
+            "route": "demanda",
+            "deadline_date": deadline.isoformat(),
+            "event_code": "deadline_due",
+        },
+    )
+
+
+def _tracked_deadlines(deadlines: Iterable[date]) -> Tuple[date, ...]:
+    return tuple(sorted(set(deadlines)))
+
+
+def snapshot_demands(demands: Iterable[dict]) -> DemandSnapshot:
+    """Copia imutável do que o agendador precisa de cada demanda aberta."""
+    out = []
+    for demand in demands:
+        demand_id = str(demand.get("ID") or demand.get("_id") or "")
+        if not demand_id:
+            continue
+        dates = demand.get("_prazos_dates")
+        out.append((demand_id, str(demand.get("Prazo") or ""), tuple(dates) if dates is not None else None))
+    return tuple(out)
+
+
+def scan_demands(snapshot: DemandSnapshot, known: Mapping[str, IndexEntry], now: datetime, full: bool = False) -> ScanResult:
+    """Compara o retrato com o índice conhecido; não toca em Qt e pode rodar fora da thread da GUI."""
+    today = now.date()
+    seen = set()
+    updates = []
+    next_transitions = []
+    pending = []
+
+    for demand_id, signature, dates in snapshot:
+        seen.add(demand_id)
+        previous = known.get(demand_id)
+        if previous is not None and previous[0] == signature:
+            continue
+        if dates is None:
+            dates = parse_prazos_list(signature)
+        tracked = _tracked_deadlines(dates)
+        updates.append((demand_id, signature, tracked))
+        next_transitions.append((demand_id, _next_transition(tracked, now)))
+        previous_dates = previous[1] if previous is not None else ()
+        for deadline, state in _current_states(tracked, today):
+            if deadline not in previous_dates:
+                pending.append((demand_id, deadline, state))
+
+    removed = tuple(demand_id for demand_id in known if demand_id not in seen)
+    return ScanResult(full, tuple(updates), removed, tuple(next_transitions), tuple(pending))
+
+
+class _ScanSignals(QObject):
+    # (geração da varredura, ScanResult)
+    finished = Signal(object)
+
+
+class _ScanTask(QRunnable):
+    def __init__(
+        self,
+        generation: int,
+        snapshot: DemandSnapshot,
+        known: Dict[str, IndexEntry],
+        now: datetime,
+        full: bool,
+        signals: _ScanSignals,
+    ):
+        super().__init__()
+        self.generation = generation
+        self.snapshot = snapshot
+        self.known = known
+        self.now = now
+        self.full = full
+        self.signals = signals
+
+    def run(self) -> None:
+        self.signals.finished.emit((self.generation, scan_demands(self.snapshot, self.known, self.now, self.full)))
+
+
 class DeadlineScheduler(QObject):
-    def __init__(self, repo: DemandasRepository, emitter, time_provider: TimeProvider | None = None):
+    """Agenda os avisos de prazo por eventos.
+
+    Cada data de prazo é um evento próprio. O heap guarda só a próxima mudança de estado
+    (prazo próximo / estourado) de cada demanda e um único QTimer de disparo único fica
+    armado para a mais próxima; ao disparar, a demanda volta ao heap com a mudança
+    seguinte. Entre mudanças não há varredura; alterações nas demandas chegam por
+    request_sync(), que compara um retrato imutável com o índice numa thread de trabalho
+    e devolve o resultado por sinal. Cada varredura recebe uma geração crescente e
+    resultados mais antigos que o último aplicado são descartados.
+    """
+
+    # Emitido depois que uma varredura completa foi aplicada (e suas notificações emitidas).
+    full_scan_applied = Signal()
+
+    def __init__(self, repo: DemandasRepository, emitter, time_provider: TimeProvider | None = None, batch_emitter=None):
         super().__init__()
         self.repo = repo
         self.emitter = emitter
+        # Quando informado, recebe todas as notificações de uma varredura de uma só vez.
+        self.batch_emitter = batch_emitter
         self.time_provider = time_provider or SystemTimeProvider()
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self.check_now)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._on_timer)
+        self._max_sleep_ms = MAX_TIMER_MS
+        self._index: Dict[str, IndexEntry] = {}
+        self._next_at: Dict[str, datetime] = {}
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._seq = itertools.count()
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._scan_signals = _ScanSignals(self)
+        self._scan_signals.finished.connect(self._on_scan_finished)
+        self._scan_running = False
+        self._queued_scan: Optional[Tuple[DemandSnapshot, bool]] = None
+        self._generations = itertools.count(1)
+        self._applied_generation = 0
 
     def start(self, interval_minutes: int) -> None:
-        self.timer.start(max(1, interval_minutes) * 60_000)
+        """Dispara a primeira varredura; o intervalo limita quanto tempo o timer dorme."""
+        self._max_sleep_ms = min(MAX_TIMER_MS, max(1, interval_minutes) * 60_000)
+        self.request_sync(self.repo.list_open_demands(), full=True)
 
     def update_interval(self, interval_minutes: int) -> None:
-        self.start(interval_minutes)
+        self._max_sleep_ms = min(MAX_TIMER_MS, max(1, interval_minutes) * 60_000)
+        self._arm()
 
     def check_now(self) -> List[DeadlineEvent]:
+        """Reconstrói o índice a partir do repositório e emite o estado atual de todos os prazos."""
+        generation = next(self._generations)
+        snapshot = snapshot_demands(self.repo.list_open_demands())
+        return self._apply(generation, scan_demands(snapshot, {}, self.time_provider.now(), full=True))
+
+    def sync(self, demands: Iterable[dict]) -> List[DeadlineEvent]:
+        """Versão síncrona de request_sync(); só demandas novas ou alteradas são reprocessadas."""
+        generation = next(self._generations)
+        snapshot = snapshot_demands(demands)
+        return self._apply(generation, scan_demands(snapshot, self._index, self.time_provider.now()))
+
+    def request_sync(self, demands: Iterable[dict], full: bool = False) -> None:
+        """Agenda a comparação em segundo plano; pedidos feitos durante uma varredura são agrupados."""
+        snapshot = snapshot_demands(demands)
+        if self._scan_running:
+            queued_full = self._queued_scan[1] if self._queued_scan is not None else False
+            self._queued_scan = (snapshot, full or queued_full)
+            return
+        self._start_scan(snapshot, full)
+
+    def is_scanning(self) -> bool:
+        return self._scan_running
+
+    def _start_scan(self, snapshot: DemandSnapshot, full: bool) -> None:
+        self._scan_running = True
+        known = {} if full else dict(self._index)
+        generation = next(self._generations)
+        self._pool.start(_ScanTask(generation, snapshot, known, self.time_provider.now(), full, self._scan_signals))
+
+    def _on_scan_finished(self, outcome: Tuple[int, ScanResult]) -> None:
+        self._scan_running = False
+        generation, result = outcome
+        # Um sync()/check_now() feito durante a varredura já aplicou um estado mais novo.
+        if generation > self._applied_generation:
+            self._apply(generation, result)
+        if self._queued_scan is not None:
+            snapshot, full = self._queued_scan
+            self._queued_scan = None
+            self._start_scan(snapshot, full)
+
+    def _apply(self, generation: int, result: ScanResult) -> List[DeadlineEvent]:
+        self._applied_generation = generation
+        if result.full:
+            self._index.clear()
+            self._next_at.clear()
+            self._heap.clear()
+        for demand_id in result.removed:
+            self._index.pop(demand_id, None)
+            self._next_at.pop(demand_id, None)
+        for demand_id, signature, tracked in result.updates:
+            self._index[demand_id] = (signature, tracked)
+        for demand_id, when in result.next_transitions:
+            self._schedule(demand_id, when)
+        self._compact_heap()
+        events = self._emit(list(result.pending))
+        self._arm()
+        if result.full:
+            self.full_scan_applied.emit()
+        return events
+
+    def _schedule(self, demand_id: str, when: Optional[datetime]) -> None:
+        if when is None:
+            self._next_at.pop(demand_id, None)
+            return
+        self._next_at[demand_id] = when
+        heapq.heappush(self._heap, (when, next(self._seq), demand_id))
+
+    def _is_current(self, entry: Tuple[datetime, int, str]) -> bool:
+        return self._next_at.get(entry[2]) == entry[0]
+
+    def _on_timer(self) -> None:
         now = self.time_provider.now()
         today = now.date()
+        pending: List[Tuple[str, date, NotificationType]] = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if not self._is_current(entry):
+                continue
+            when, _seq, demand_id = entry
+            deadlines = self._index[demand_id][1]
+            for deadline in _changed_at(deadlines, when):
+                state = _deadline_state(deadline, today)
+                # Depois de uma suspensão, a mesma data pode aparecer em duas mudanças seguidas.
+                if state is not None and (demand_id, deadline, state) not in pending:
+                    pending.append((demand_id, deadline, state))
+            self._schedule(demand_id, _next_transition(deadlines, when))
+        self._emit(pending)
+        self._arm()
+
+    def _arm(self) -> None:
+        self.timer.stop()
+        if not self._heap:
+            return
+        delay = self._heap[0][0] - self.time_provider.now()
+        delay_ms = max(0, int(delay.total_seconds() * 1000))
+        self.timer.start(min(delay_ms, self._max_sleep_ms))
+
+    def _compact_heap(self) -> None:
+        if len(self._heap) <= 2 * len(self._next_at) + 64:
+            return
+        self._heap = [entry for entry in self._heap if self._is_current(entry)]
+        heapq.heapify(self._heap)
+
+    def _emit(self, pending: List[Tuple[str, date, NotificationType]]) -> List[DeadlineEvent]:
         events: List[DeadlineEvent] = []
+        notifications: List[Notification] = []
+        for demand_id, deadline, state in pending:
+            notifications.append(_build_notification(demand_id, deadline, state))
+            events.append(DeadlineEvent(demand_id, state))
 
-        for demand in self.repo.list_open_demands():
-            demand_id = str(demand.get("ID") or demand.get("_id") or "")
-            deadline_text = demand.get("Prazo") or ""
-            deadlines = parse_prazos_list(deadline_text)
-            if not deadlines:
-                continue
-            closest = min(deadlines)
-            delta = closest - today
-            if delta < timedelta(days=0):
-                evt = Notification(
-                    type=NotificationType.PRAZO_ESTOURADO,
-                    title=f"Demanda #{demand_id} atrasada",
-                    body=f"Prazo em {closest.strftime('%d/%m/%Y')}.",
-                    payload={
-                        "demand_id": demand_id,
-                        "route": "atrasadas",
-                        "deadline_date": closest.isoformat(),
-                        "event_code": "deadline_overdue",
-                    },
-                )
-                self.emitter(evt)
-                events.append(DeadlineEvent(demand_id, NotificationType.PRAZO_ESTOURADO))
-            elif delta <= timedelta(days=1):
-                evt = Notification(
-                    type=NotificationType.PRAZO_PROXIMO,
-                    title=f"Prazo hoje: #{demand_id}",
-                    body=f"Demanda vence em {closest.strftime('%d/%m/%Y')}.",
-                    payload={
-                        "demand_id": demand_id,
-                        "route": "demanda",
-                        "deadline_date": closest.isoformat(),
-                        "event_code": "deadline_due",
-                    },
-                )
+        if self.batch_emitter is not None:
+            if notifications:
+                self.batch_emitter(notifications)
+        else:
+            for evt in notifications:
                 self.emitter(evt)
-                events.append(DeadlineEvent(demand_id, NotificationType.PRAZO_PROXIMO))
         return events
@@ -5,6 +5,7 @@ from PySide6.QtWidgets import (
     QDialog,
     QFormLayout,
     QHBoxLayout,
+    QLabel,
     QPushButton,
     QSpinBox,
     QVBoxLayout,
@@ -42,6 +43,33 @@ class NotificationSettingsDialog(QDialog):
         self.interval_spin.setValue(self.pref.scheduler_interval_minutes)
         form.addRow("Intervalo do scheduler (min)", self.interval_spin)
 
+        self.retention_days_spin = QSpinBox()
+        self.retention_days_spin.setRange(0, 3650)
+        self.retention_days_spin.setSpecialValueText("Sem limite")
+        self.retention_days_spin.setValue(self.pref.retention_days)
+        form.addRow("Manter lidas por (dias)", self.retention_days_spin)
+
+        self.retention_max_spin = QSpinBox()
+        self.retention_max_spin.setRange(0, 1_000_000)
+        self.retention_max_spin.setSpecialValueText("Sem limite")
+        self.retention_max_spin.setValue(self.pref.retention_max_read)
+        form.addRow("Máximo de lidas", self.retention_max_spin)
+
+        self.occurrence_days_spin = QSpinBox()
+        self.occurrence_days_spin.setRange(0, 3650)
+        self.occurrence_days_spin.setSpecialValueText("Sem limite")
+        self.occurrence_days_spin.setValue(self.pref.occurrence_retention_days)
+        form.addRow("Manter ocorrências reconhecidas (dias)", self.occurrence_days_spin)
+
+        self.occurrence_max_spin = QSpinBox()
+        self.occurrence_max_spin.setRange(0, 1_000_000)
+        self.occurrence_max_spin.setSpecialValueText("Sem limite")
+        self.occurrence_max_spin.setValue(self.pref.occurrence_max_acknowledged)
+        form.addRow("Máximo de ocorrências reconhecidas", self.occurrence_max_spin)
+
+        self.db_size_label = QLabel(_format_size(self.store.database_size_bytes()))
+        form.addRow("Tamanho do banco", self.db_size_label)
+
         save_btn = QPushButton("Salvar")
         cancel_btn = QPushButton("Cancelar")
         save_btn.clicked.connect(self._save)
@@ -60,5 +88,16 @@ class NotificationSettingsDialog(QDialog):
         pref.enabled_channels = {ch: box.isChecked() for ch, box in self.channel_boxes.items()}
         pref.scheduler_interval_minutes = self.interval_spin.value()
         pref.muted_until_epoch = self.pref.muted_until_epoch
+        pref.retention_days = self.retention_days_spin.value()
+        pref.retention_max_read = self.retention_max_spin.value()
+        pref.occurrence_retention_days = self.occurrence_days_spin.value()
+        pref.occurrence_max_acknowledged = self.occurrence_max_spin.value()
         self.store.save_preferences(pref)
+        self.store.prune_in_background()
         self.accept()
+
+
+def _format_size(size: int) -> str:
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    return f"{size / 1024:.0f} KB"
@@ -1,22 +1,43 @@
 from __future__ import annotations
 
-import base64
+import binascii
 import csv
 import hashlib
-import hmac
 import io
 import json
 import os
+import re
 import sqlite3
+import threading
 import time
-from datetime import datetime
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import datetime, timedelta
 
 from .models import BRASILIA_TZ
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-from .models import Channel, Notification, NotificationType, Preferences
+from local_crypto import load_or_create_key, seal, unseal
+
+from .models import Channel, Notification, NotificationSummary, NotificationType, Preferences
 
 ENC_MAGIC = b"MYDEMANDS_NOTIF_ENC_V1"
+STATEMENT_CACHE_SIZE = 64
+HISTORY_COLUMNS = ["event", "id", "timestamp", "type", "title", "body", "payload_json", "read"]
+HISTORY_SNAPSHOT_LIMIT = 5000
+HISTORY_COMPACT_EVERY = 500
+VACUUM_BUSY_TIMEOUT_SECONDS = 30.0
+NOTIFICATION_PAGE_SIZE = 200
+# Ids por statement nas operações em lote (abaixo do limite de variáveis do SQLite).
+BULK_CHUNK_SIZE = 500
+SEARCH_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+# Quantas ocorrências (as mais recentes) são ordenadas por relevância numa busca.
+SEARCH_RANK_WINDOW = 2000
+
+
+def _escape_like(text: str) -> str:
+    """Escapa os curingas do LIKE para que a busca trate o texto literalmente."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
 class NotificationStore:
@@ -25,14 +46,47 @@ class NotificationStore:
         self.db_path = os.path.join(base_dir, "notifications.db")
         self.enc_csv_path = os.path.join(base_dir, "notifications_history.enc.csv")
         self.key_path = os.path.join(base_dir, ".notifications.key")
-        self._key = self._load_or_create_key()
+        self._key = load_or_create_key(self.key_path)
+        self._lock = threading.RLock()
+        self._con = self._open_connection()
+        self._fts_enabled = False
         self._ensure_schema()
+        # Contador de não lidas mantido em memória pelas operações de escrita.
+        with self._connect() as con:
+            row = con.execute("SELECT COUNT(1) AS total FROM notifications WHERE read = 0").fetchone()
+        self._unread_count = int(row["total"] if row else 0)
+        self._preferences_cache: Optional[Preferences] = None
+        self._history_lock = threading.Lock()
+        self._history_pending = 0
+        self._compaction_thread: Optional[threading.Thread] = None
+        if not self._history_is_valid():
+            self.compact_history()
 
-    def _connect(self) -> sqlite3.Connection:
-        con = sqlite3.connect(self.db_path)
+    def _open_connection(self) -> sqlite3.Connection:
+        # Conexão única e persistente: o cache de statements do sqlite3 só é
+        # aproveitado enquanto a conexão vive. O acesso é serializado por _lock.
+        con = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
         con.row_factory = sqlite3.Row
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")
+        con.execute("PRAGMA temp_store=MEMORY")
+        # Em banco novo o modo vale na hora; em banco existente só após um VACUUM completo,
+        # que fica para a primeira limpeza de retenção (em segundo plano), não para a abertura.
+        con.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._vacuum_pending = con.execute("PRAGMA auto_vacuum").fetchone()[0] != 2
         return con
 
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Usa a conexão persistente dentro de uma transação (commit ao sair, rollback em erro)."""
+        with self._lock:
+            with self._con:
+                yield self._con
+
+    def close(self) -> None:
+        with self._lock:
+            self._con.close()
+
     def _ensure_schema(self) -> None:
         with self._connect() as con:
             con.execute(
@@ -73,6 +127,59 @@ class NotificationStore:
                 )
                 """
             )
+            con.execute("CREATE INDEX IF NOT EXISTS idx_notifications_read_id ON notifications (read, id)")
+            con.execute("CREATE INDEX IF NOT EXISTS idx_notifications_type_read_id ON notifications (type, read, id)")
+            con.execute("CREATE INDEX IF NOT EXISTS idx_notifications_occurrence_key ON notifications (occurrence_key)")
+            con.execute(
+                "CREATE INDEX IF NOT EXISTS idx_occurrences_acknowledged_updated ON notified_occurrences (acknowledged, updated_at)"
+            )
+        self._fts_enabled = self._ensure_search_index()
+
+    def _ensure_search_index(self) -> bool:
+        """Cria o índice FTS5 sobre título e corpo, mantido por triggers; False se o SQLite não tiver FTS5."""
+        try:
+            with self._connect() as con:
+                exists = con.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'notifications_fts'"
+                ).fetchone()
+                con.execute(
+                    """
+                    CREATE VIRTUAL TABLE IF NOT EXISTS notifications_fts USING fts5(
+                        title, body, content='notifications', content_rowid='id',
+                        tokenize='unicode61 remove_diacritics 2'
+                    )
+                    """
+                )
+                con.execute(
+                    """
+                    CREATE TRIGGER IF NOT EXISTS notifications_fts_ai AFTER INSERT ON notifications BEGIN
+                        INSERT INTO notifications_fts (rowid, title, body) VALUES (new.id, new.title, new.body);
+                    END
+                    """
+                )
+                con.execute(
+                    """
+                    CREATE TRIGGER IF NOT EXISTS notifications_fts_ad AFTER DELETE ON notifications BEGIN
+                        INSERT INTO notifications_fts (notifications_fts, rowid, title, body)
+                        VALUES ('delete', old.id, old.title, old.body);
+                    END
+                    """
+                )
+                con.execute(
+                    """
+                    CREATE TRIGGER IF NOT EXISTS notifications_fts_au AFTER UPDATE OF title, body ON notifications BEGIN
+                        INSERT INTO notifications_fts (notifications_fts, rowid, title, body)
+                        VALUES ('delete', old.id, old.title, old.body);
+                        INSERT INTO notifications_fts (rowid, title, body) VALUES (new.id, new.title, new.body);
+                    END
+                    """
+                )
+                if not exists:
+                    # Bancos anteriores ao índice: indexa o que já existe uma única vez.
+                    con.execute("INSERT INTO notifications_fts (notifications_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError:
+            return False
+        return True
 
     def _notification_occurrence_key(self, notification: Notification) -> str:
         payload = notification.payload or {}
@@ -90,11 +197,16 @@ class NotificationStore:
     def should_dispatch(self, notification: Notification) -> bool:
         occurrence_key = self._notification_occurrence_key(notification)
         with self._connect() as con:
-            row = con.execute(
-                "SELECT 1 FROM notified_occurrences WHERE occurrence_key = ?",
-                (occurrence_key,),
-            ).fetchone()
-        return row is None
+            return not self._touch_occurrence(con, occurrence_key, datetime.now(BRASILIA_TZ).isoformat())
+
+    def _touch_occurrence(self, con: sqlite3.Connection, occurrence_key: str, now: str) -> bool:
+        """Renova updated_at de uma ocorrência já registrada; devolve se ela existia.
+
+        Ocorrências ainda anunciadas pelas varreduras continuam recentes e a retenção
+        por idade/quantidade não as apaga enquanto o prazo for atual.
+        """
+        cur = con.execute("UPDATE notified_occurrences SET updated_at = ? WHERE occurrence_key = ?", (now, occurrence_key))
+        return cur.rowcount > 0
 
     def _mark_occurrence_presented(self, occurrence_key: str, *, acknowledged: bool = False) -> None:
         now = datetime.now(BRASILIA_TZ).isoformat()
@@ -113,42 +225,12 @@ class NotificationStore:
                 (occurrence_key, 1 if acknowledged else 0, now),
             )
 
-    def _acknowledge_occurrence_from_notification(self, notification_id: int) -> None:
-        with self._connect() as con:
-            row = con.execute(
-                "SELECT occurrence_key FROM notifications WHERE id = ?",
-                (notification_id,),
-            ).fetchone()
-        if not row:
-            return
-        occurrence_key = str(row["occurrence_key"] or "").strip()
-        if occurrence_key:
-            self._mark_occurrence_presented(occurrence_key, acknowledged=True)
-
-    def _load_or_create_key(self) -> bytes:
-        if os.path.exists(self.key_path):
-            with open(self.key_path, "rb") as f:
-                key = f.read()
-            if len(key) >= 32:
-                return key[:32]
-        key = os.urandom(32)
-        with open(self.key_path, "wb") as f:
-            f.write(key)
-        return key
-
-    def _encrypt_bytes(self, plain: bytes) -> bytes:
-        nonce = os.urandom(16)
-        cipher = bytearray()
-        counter = 0
-        i = 0
-        while i < len(plain):
-            block = hashlib.sha256(self._key + nonce + counter.to_bytes(8, "big")).digest()
-            chunk = plain[i : i + len(block)]
-            cipher.extend(bytes(a ^ b for a, b in zip(chunk, block)))
-            i += len(block)
-            counter += 1
-        mac = hmac.new(self._key, ENC_MAGIC + nonce + bytes(cipher), hashlib.sha256).digest()
-        return ENC_MAGIC + b"\n" + base64.urlsafe_b64encode(nonce + bytes(cipher) + mac)
+    def _encrypt_record(self, plain: bytes) -> bytes:
+        """Um registro do histórico, sem quebras de linha."""
+        return seal(self._key, ENC_MAGIC, plain)
+
+    def _decrypt_record(self, record: bytes) -> bytes:
+        return unseal(self._key, ENC_MAGIC, record, "Falha de integridade no histórico de notificações")
 
     def insert(self, notification: Notification) -> int:
         occurrence_key = self._notification_occurrence_key(notification)
@@ -167,9 +249,51 @@ class NotificationStore:
                 ),
             )
             new_id = int(cur.lastrowid)
-        self._rewrite_encrypted_csv_snapshot()
+            if not notification.read:
+                self._unread_count += 1
+        self._record_history([self._history_row("upsert", notification, new_id)])
         return new_id
 
+    def insert_many(self, notifications: List[Notification]) -> List[tuple[Notification, int]]:
+        """Insere em uma única transação as notificações ainda não apresentadas.
+
+        Ocorrências repetidas (no lote ou já registradas) são ignoradas. Devolve os pares
+        (notificação, id) efetivamente inseridos, na ordem recebida.
+        """
+        now = datetime.now(BRASILIA_TZ).isoformat()
+        inserted: List[tuple[Notification, int]] = []
+        seen: set[str] = set()
+        with self._connect() as con:
+            for notification in notifications:
+                occurrence_key = self._notification_occurrence_key(notification)
+                if occurrence_key in seen:
+                    continue
+                seen.add(occurrence_key)
+                if self._touch_occurrence(con, occurrence_key, now):
+                    continue
+                con.execute(
+                    "INSERT INTO notified_occurrences (occurrence_key, acknowledged, updated_at) VALUES (?, 0, ?)",
+                    (occurrence_key, now),
+                )
+                cur = con.execute(
+                    "INSERT INTO notifications (timestamp, type, title, body, payload_json, occurrence_key, read) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        notification.timestamp.isoformat(),
+                        notification.type.value,
+                        notification.title,
+                        notification.body,
+                        json.dumps(notification.payload, ensure_ascii=False),
+                        occurrence_key,
+                        1 if notification.read else 0,
+                    ),
+                )
+                inserted.append((notification, int(cur.lastrowid)))
+                if not notification.read:
+                    self._unread_count += 1
+        if inserted:
+            self._record_history([self._history_row("upsert", n, notification_id) for n, notification_id in inserted])
+        return inserted
+
     def list_notifications(
         self,
         *,
@@ -177,14 +301,7 @@ class NotificationStore:
         read_filter: Optional[bool] = None,
         limit: int = 300,
     ) -> List[Notification]:
-        clauses = []
-        params: list = []
-        if type_filter is not None:
-            clauses.append("type = ?")
-            params.append(type_filter.value)
-        if read_filter is not None:
-            clauses.append("read = ?")
-            params.append(1 if read_filter else 0)
+        clauses, params = self._filter_clauses(type_filter, read_filter)
         where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
 
         with self._connect() as con:
@@ -210,22 +327,183 @@ class NotificationStore:
             )
         return out
 
-    def mark_as_read(self, notification_id: int) -> None:
-        self._acknowledge_occurrence_from_notification(notification_id)
+    def _filter_clauses(self, type_filter: Optional[NotificationType], read_filter: Optional[bool]) -> tuple[list, list]:
+        clauses = []
+        params: list = []
+        if type_filter is not None:
+            clauses.append("type = ?")
+            params.append(type_filter.value)
+        if read_filter is not None:
+            clauses.append("read = ?")
+            params.append(1 if read_filter else 0)
+        return clauses, params
+
+    def list_notification_page(
+        self,
+        *,
+        type_filter: Optional[NotificationType] = None,
+        read_filter: Optional[bool] = None,
+        before_id: Optional[int] = None,
+        limit: int = NOTIFICATION_PAGE_SIZE,
+    ) -> List[NotificationSummary]:
+        """Página da central (mais recentes primeiro), paginada por chave: só ids menores que before_id.
+
+        O payload não é lido; use get_notification_by_id ao abrir a notificação.
+        """
+        clauses, params = self._filter_clauses(type_filter, read_filter)
+        if before_id is not None:
+            clauses.append("id < ?")
+            params.append(int(before_id))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         with self._connect() as con:
-            con.execute("UPDATE notifications SET read = 1 WHERE id = ?", (notification_id,))
-        self._rewrite_encrypted_csv_snapshot()
+            rows = con.execute(
+                f"SELECT id, timestamp, type, title, body, read FROM notifications {where} ORDER BY id DESC LIMIT ?",
+                [*params, limit],
+            ).fetchall()
+        return [self._summary_from_row(r) for r in rows]
 
-    def mark_as_unread(self, notification_id: int) -> None:
+    def search_notifications(
+        self,
+        text: str,
+        *,
+        type_filter: Optional[NotificationType] = None,
+        read_filter: Optional[bool] = None,
+        offset: int = 0,
+        limit: int = NOTIFICATION_PAGE_SIZE,
+    ) -> List[NotificationSummary]:
+        """Busca textual em título e corpo; cada palavra digitada vale como prefixo e todas precisam aparecer.
+
+        As SEARCH_RANK_WINDOW ocorrências mais recentes vêm ordenadas por relevância (bm25)
+        e as mais antigas seguem por data; assim termos muito comuns não obrigam a pontuar o
+        banco inteiro. Sem FTS5, cai para LIKE ordenado pelas mais recentes, com cada termo
+        (separado por espaços) buscado literalmente, inclusive % e _.
+        """
+        tokens = SEARCH_TOKEN_RE.findall(text or "")
+        if not tokens:
+            return []
+        offset = max(0, int(offset))
+        clauses, params = self._filter_clauses(type_filter, read_filter)
+        clauses = [f"n.{clause}" for clause in clauses]
+        if not self._fts_enabled:
+            for term in (text or "").split():
+                pattern = f"%{_escape_like(term)}%"
+                clauses.append("(n.title LIKE ? ESCAPE '\\' OR n.body LIKE ? ESCAPE '\\')")
+                params.extend([pattern, pattern])
+            with self._connect() as con:
+                rows = con.execute(
+                    "SELECT n.id, n.timestamp, n.type, n.title, n.body, n.read FROM notifications n "
+                    f"WHERE {' AND '.join(clauses)} ORDER BY n.id DESC LIMIT ? OFFSET ?",
+                    [*params, limit, offset],
+                ).fetchall()
+            return [self._summary_from_row(r) for r in rows]
+
+        match = " ".join(f'"{token}"*' for token in tokens)
+        base = (
+            "FROM notifications_fts JOIN notifications n ON n.id = notifications_fts.rowid "
+            f"WHERE {' AND '.join(['notifications_fts MATCH ?', *clauses])}"
+        )
+        columns = "SELECT n.id, n.timestamp, n.type, n.title, n.body, n.read "
         with self._connect() as con:
-            con.execute("UPDATE notifications SET read = 0 WHERE id = ?", (notification_id,))
-        self._rewrite_encrypted_csv_snapshot()
+            row = con.execute(
+                "SELECT rowid FROM notifications_fts WHERE notifications_fts MATCH ? ORDER BY rowid DESC LIMIT 1 OFFSET ?",
+                (match, SEARCH_RANK_WINDOW - 1),
+            ).fetchone()
+            threshold = int(row[0]) if row else 0
+            rows = con.execute(
+                f"{columns}{base} AND notifications_fts.rowid >= ? "
+                "ORDER BY notifications_fts.rank, n.id DESC LIMIT ? OFFSET ?",
+                [match, *params, threshold, limit, offset],
+            ).fetchall()
+            if len(rows) < limit and threshold:
+                # A janela ranqueada acabou; o total só é contado quando a página começa depois dela.
+                if rows:
+                    ranked_total = offset + len(rows)
+                else:
+                    ranked_total = con.execute(
+                        f"SELECT COUNT(1) {base} AND notifications_fts.rowid >= ?", [match, *params, threshold]
+                    ).fetchone()[0]
+                rows += con.execute(
+                    f"{columns}{base} AND notifications_fts.rowid < ? ORDER BY notifications_fts.rowid DESC LIMIT ? OFFSET ?",
+                    [match, *params, threshold, limit - len(rows), max(0, offset - ranked_total)],
+                ).fetchall()
+        return [self._summary_from_row(r) for r in rows]
+
+    def _summary_from_row(self, row: sqlite3.Row) -> NotificationSummary:
+        return NotificationSummary(
+            id=int(row["id"]),
+            timestamp=row["timestamp"],
+            type=NotificationType(row["type"]),
+            title=row["title"],
+            body=row["body"],
+            read=bool(row["read"]),
+        )
+
+    def mark_as_read(self, notification_id: int) -> None:
+        self.mark_many_read([notification_id])
+
+    def mark_as_unread(self, notification_id: int) -> None:
+        self.mark_many_unread([notification_id])
 
     def delete_notification(self, notification_id: int) -> None:
-        self._acknowledge_occurrence_from_notification(notification_id)
+        self.delete_many([notification_id])
+
+    def _acknowledge_occurrences(self, con: sqlite3.Connection, where: str, params: list) -> None:
+        """Reconhece, dentro da transação corrente, as ocorrências das notificações selecionadas."""
+        con.execute(
+            f"""
+            INSERT INTO notified_occurrences (occurrence_key, acknowledged, updated_at)
+            SELECT occurrence_key, 1, ? FROM notifications
+            WHERE occurrence_key IS NOT NULL AND occurrence_key != '' AND {where}
+            ON CONFLICT(occurrence_key) DO UPDATE SET acknowledged = 1, updated_at = excluded.updated_at
+            """,
+            [datetime.now(BRASILIA_TZ).isoformat(), *params],
+        )
+
+    def _bulk_update(self, event: str, notification_ids: List[int]) -> int:
+        """Aplica `event` (read/unread/delete) a vários ids numa única transação e um único registro de histórico."""
+        ids = sorted({int(notification_id) for notification_id in notification_ids})
+        if not ids:
+            return 0
+        changed = 0
+        with self._connect() as con:
+            for start in range(0, len(ids), BULK_CHUNK_SIZE):
+                chunk = ids[start:start + BULK_CHUNK_SIZE]
+                marks = ",".join("?" * len(chunk))
+                if event != "unread":
+                    self._acknowledge_occurrences(con, f"id IN ({marks})", chunk)
+                if event == "read":
+                    cur = con.execute(f"UPDATE notifications SET read = 1 WHERE read = 0 AND id IN ({marks})", chunk)
+                    self._unread_count -= cur.rowcount
+                elif event == "unread":
+                    cur = con.execute(f"UPDATE notifications SET read = 0 WHERE read = 1 AND id IN ({marks})", chunk)
+                    self._unread_count += cur.rowcount
+                else:
+                    self._unread_count -= con.execute(
+                        f"SELECT COUNT(1) FROM notifications WHERE read = 0 AND id IN ({marks})", chunk
+                    ).fetchone()[0]
+                    cur = con.execute(f"DELETE FROM notifications WHERE id IN ({marks})", chunk)
+                changed += cur.rowcount
+        self._record_history([[event, str(notification_id)] for notification_id in ids])
+        return changed
+
+    def mark_many_read(self, notification_ids: List[int]) -> int:
+        return self._bulk_update("read", notification_ids)
+
+    def mark_many_unread(self, notification_ids: List[int]) -> int:
+        return self._bulk_update("unread", notification_ids)
+
+    def delete_many(self, notification_ids: List[int]) -> int:
+        return self._bulk_update("delete", notification_ids)
+
+    def mark_all_read(self) -> int:
+        """Marca todas como lidas com um único UPDATE; o histórico recebe um só evento."""
         with self._connect() as con:
-            con.execute("DELETE FROM notifications WHERE id = ?", (notification_id,))
-        self._rewrite_encrypted_csv_snapshot()
+            self._acknowledge_occurrences(con, "read = 0", [])
+            changed = con.execute("UPDATE notifications SET read = 1 WHERE read = 0").rowcount
+            self._unread_count = 0
+        if changed:
+            self._record_history([["read_all", "0"]])
+        return changed
 
     def get_notification_by_id(self, notification_id: int) -> Notification | None:
         with self._connect() as con:
@@ -249,9 +527,7 @@ class NotificationStore:
         )
 
     def count_unread(self) -> int:
-        with self._connect() as con:
-            row = con.execute("SELECT COUNT(1) AS total FROM notifications WHERE read = 0").fetchone()
-        return int(row["total"] if row else 0)
+        return self._unread_count
 
     def save_preferences(self, preferences: Preferences) -> None:
         payload = {
@@ -259,14 +535,27 @@ class NotificationStore:
             "enabled_channels": {k.value: v for k, v in preferences.enabled_channels.items()},
             "scheduler_interval_minutes": preferences.scheduler_interval_minutes,
             "muted_until_epoch": preferences.muted_until_epoch,
+            "retention_days": preferences.retention_days,
+            "retention_max_read": preferences.retention_max_read,
+            "occurrence_retention_days": preferences.occurrence_retention_days,
+            "occurrence_max_acknowledged": preferences.occurrence_max_acknowledged,
         }
         with self._connect() as con:
             con.execute(
                 "INSERT INTO preferences (id, payload_json) VALUES (1, ?) ON CONFLICT(id) DO UPDATE SET payload_json = excluded.payload_json",
                 (json.dumps(payload, ensure_ascii=False),),
             )
+            self._preferences_cache = None
 
     def load_preferences(self) -> Preferences:
+        """Preferências em cache; devolve uma cópia para que o chamador possa alterá-la livremente."""
+        with self._lock:
+            if self._preferences_cache is None:
+                self._preferences_cache = self._read_preferences()
+            cached = self._preferences_cache
+        return replace(cached, enabled_types=dict(cached.enabled_types), enabled_channels=dict(cached.enabled_channels))
+
+    def _read_preferences(self) -> Preferences:
         with self._connect() as con:
             row = con.execute("SELECT payload_json FROM preferences WHERE id = 1").fetchone()
         if not row:
@@ -281,28 +570,189 @@ class NotificationStore:
         }
         pref.scheduler_interval_minutes = int(payload.get("scheduler_interval_minutes", pref.scheduler_interval_minutes))
         pref.muted_until_epoch = float(payload.get("muted_until_epoch", 0.0) or 0.0)
+        pref.retention_days = int(payload.get("retention_days", pref.retention_days))
+        pref.retention_max_read = int(payload.get("retention_max_read", pref.retention_max_read))
+        pref.occurrence_retention_days = int(payload.get("occurrence_retention_days", pref.occurrence_retention_days))
+        pref.occurrence_max_acknowledged = int(payload.get("occurrence_max_acknowledged", pref.occurrence_max_acknowledged))
         return pref
 
     def mute_for_seconds(self, seconds: int) -> None:
-        pref = self.load_preferences()
-        pref.muted_until_epoch = time.time() + max(0, seconds)
-        self.save_preferences(pref)
+        with self._lock:
+            pref = self.load_preferences()
+            pref.muted_until_epoch = time.time() + max(0, seconds)
+            self.save_preferences(pref)
+
+    def prune(self, preferences: Optional[Preferences] = None, now: Optional[datetime] = None) -> int:
+        """Aplica a política de retenção e devolve quantas linhas foram removidas.
+
+        Só remove notificações lidas e ocorrências reconhecidas; as não lidas nunca expiram.
+        """
+        pref = preferences or self.load_preferences()
+        now = now or datetime.now(BRASILIA_TZ)
+        removed = 0
+        with self._connect() as con:
+            if pref.retention_days > 0:
+                cutoff = (now - timedelta(days=pref.retention_days)).isoformat()
+                removed += con.execute("DELETE FROM notifications WHERE read = 1 AND timestamp < ?", (cutoff,)).rowcount
+            if pref.retention_max_read > 0:
+                removed += con.execute(
+                    """
+                    DELETE FROM notifications WHERE read = 1 AND id NOT IN (
+                        SELECT id FROM notifications WHERE read = 1 ORDER BY id DESC LIMIT ?
+                    )
+                    """,
+                    (pref.retention_max_read,),
+                ).rowcount
+            pruned_notifications = removed
+            if pref.occurrence_retention_days > 0:
+                cutoff = (now - timedelta(days=pref.occurrence_retention_days)).isoformat()
+                removed += con.execute(
+                    "DELETE FROM notified_occurrences WHERE acknowledged = 1 AND updated_at < ?", (cutoff,)
+                ).rowcount
+            if pref.occurrence_max_acknowledged > 0:
+                removed += con.execute(
+                    """
+                    DELETE FROM notified_occurrences WHERE acknowledged = 1 AND occurrence_key NOT IN (
+                        SELECT occurrence_key FROM notified_occurrences WHERE acknowledged = 1
+                        ORDER BY updated_at DESC LIMIT ?
+                    )
+                    """,
+                    (pref.occurrence_max_acknowledged,),
+                ).rowcount
+        if self._vacuum_pending:
+            self._convert_to_incremental_vacuum()
+        elif removed:
+            with self._lock:
+                self._con.execute("PRAGMA incremental_vacuum").fetchall()
+        if pruned_notifications:
+            self._compact_in_background()
+        return removed
 
-    def _rewrite_encrypted_csv_snapshot(self) -> None:
-        notifications = self.list_notifications(limit=5000)
+    def _convert_to_incremental_vacuum(self) -> None:
+        """VACUUM único que ativa o auto_vacuum incremental num banco antigo.
+
+        Roda numa conexão própria, fora de _lock: com WAL a interface continua lendo
+        enquanto o banco é reconstruído (escritas esperam o busy timeout).
+        """
+        con = sqlite3.connect(self.db_path, timeout=VACUUM_BUSY_TIMEOUT_SECONDS)
+        try:
+            con.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            con.execute("VACUUM")
+        finally:
+            con.close()
+        # A conexão persistente guarda o modo antigo de auto_vacuum; reabri-la é rápido.
+        with self._lock:
+            self._con.close()
+            self._con = self._open_connection()
+
+    def prune_in_background(self) -> threading.Thread:
+        thread = threading.Thread(target=self.prune, name="notifications-retention", daemon=True)
+        thread.start()
+        return thread
+
+    def database_size_bytes(self) -> int:
+        return sum(
+            os.path.getsize(path)
+            for path in (self.db_path, self.db_path + "-wal")
+            if os.path.exists(path)
+        )
+
+    # Histórico criptografado: a primeira linha é ENC_MAGIC e cada linha seguinte
+    # é um registro com linhas CSV de eventos (upsert/read/unread/delete). As
+    # alterações só acrescentam um registro; de tempos em tempos o arquivo é
+    # compactado em um snapshot em uma thread de fundo.
+
+    def _history_row(self, event: str, notification: Notification, notification_id: int) -> List[str]:
+        return [
+            event,
+            str(notification_id),
+            notification.timestamp.isoformat(),
+            notification.type.value,
+            notification.title,
+            notification.body,
+            json.dumps(notification.payload, ensure_ascii=False),
+            "1" if notification.read else "0",
+        ]
+
+    def _history_is_valid(self) -> bool:
+        """Falso para arquivo ausente ou no formato antigo (um snapshot só, sem coluna event)."""
+        if not os.path.exists(self.enc_csv_path):
+            return False
+        with open(self.enc_csv_path, "rb") as f:
+            if f.readline().rstrip(b"\n") != ENC_MAGIC:
+                return False
+            first_record = f.readline()
+            if not first_record:
+                return True
+            # O formato antigo não termina em quebra de linha.
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                return False
+        try:
+            text = self._decrypt_record(first_record.strip()).decode("utf-8")
+        except (ValueError, binascii.Error):
+            return False
+        header = next(csv.reader(io.StringIO(text), delimiter=";"), [])
+        return header == HISTORY_COLUMNS
+
+    def _encode_rows(self, rows: List[List[str]]) -> bytes:
         out = io.StringIO()
         writer = csv.writer(out, delimiter=";")
-        writer.writerow(["id", "timestamp", "type", "title", "body", "payload_json", "read"])
-        for n in reversed(notifications):
-            writer.writerow([
-                n.id,
-                n.timestamp.isoformat(),
-                n.type.value,
-                n.title,
-                n.body,
-                json.dumps(n.payload, ensure_ascii=False),
-                "1" if n.read else "0",
-            ])
-        encrypted = self._encrypt_bytes(out.getvalue().encode("utf-8"))
-        with open(self.enc_csv_path, "wb") as f:
-            f.write(encrypted)
+        writer.writerows(rows)
+        return self._encrypt_record(out.getvalue().encode("utf-8"))
+
+    def _record_history(self, rows: List[List[str]]) -> None:
+        record = self._encode_rows(rows)
+        with self._history_lock:
+            with open(self.enc_csv_path, "ab+") as f:
+                if f.tell():
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        record = b"\n" + record
+                f.write(record + b"\n")
+            self._history_pending += len(rows)
+            should_compact = self._history_pending >= HISTORY_COMPACT_EVERY
+        if should_compact:
+            self._compact_in_background()
+
+    def _compact_in_background(self) -> None:
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+        self._compaction_thread = threading.Thread(target=self.compact_history, name="notifications-history-compaction", daemon=True)
+        self._compaction_thread.start()
+
+    def compact_history(self) -> None:
+        """Reescreve o histórico como um snapshot das notificações atuais."""
+        with self._history_lock:
+            notifications = self.list_notifications(limit=HISTORY_SNAPSHOT_LIMIT)
+            rows = [HISTORY_COLUMNS] + [self._history_row("upsert", n, int(n.id)) for n in reversed(notifications)]
+            tmp = self.enc_csv_path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(ENC_MAGIC + b"\n" + self._encode_rows(rows) + b"\n")
+            os.replace(tmp, self.enc_csv_path)
+            self._history_pending = 0
+
+    def read_history(self) -> List[List[str]]:
+        """Reaplica o histórico e devolve as notificações resultantes (colunas de HISTORY_COLUMNS, por id)."""
+        state: dict[int, List[str]] = {}
+        with self._history_lock:
+            with open(self.enc_csv_path, "rb") as f:
+                lines = f.read().split(b"\n")
+        for line in lines[1:]:
+            if not line.strip():
+                continue
+            text = self._decrypt_record(line.strip()).decode("utf-8")
+            for row in csv.reader(io.StringIO(text), delimiter=";"):
+                if not row or row == HISTORY_COLUMNS:
+                    continue
+                event, notification_id = row[0], int(row[1])
+                if event == "upsert":
+                    state[notification_id] = row
+                elif event == "delete":
+                    state.pop(notification_id, None)
+                elif event in ("read", "unread") and notification_id in state:
+                    state[notification_id][7] = "1" if event == "read" else "0"
+                elif event == "read_all":
+                    for item in state.values():
+                        item[7] = "1"
+        return [state[k] for k in sorted(state)]
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import csv
 import json
 import os
 import re
 import uuid
 from calendar import monthrange
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 TEAM_CONTROL_FILE = "team_control.json"
+TEAM_CONTROL_DIR = "team_control"
+PERIOD_FILE_RE = re.compile(r"^\d{4}-\d{2}\.json$")
+PERIOD_CACHE_SIZE = 6
 MAX_SECTIONS = 10
 MAX_MEMBERS_PER_SECTION = 20
 
@@ -30,15 +37,12 @@ def build_team_control_report_rows(sections: List[TeamSection], year: int, month
 
         for member in section.members:
             row = [member.name]
-            for d in range(1, total_days + 1):
-                row.append(member.entries.get(date(year, month, d).isoformat(), ""))
+            row.extend(member.entries.month_codes(year, month))
             row.append(str(monthly_k_count(member, year, month)))
             rows.append(row)
 
         footer = ["Participação"]
-        for d in range(1, total_days + 1):
-            curr = date(year, month, d)
-            total = participation_for_date([member.entries.get(curr.isoformat(), "") for member in section.members])
+        for total in daily_participation(section.members, year, month):
             footer.append(str(total) if total > 0 else "")
         footer.append("")
         rows.append(footer)
@@ -57,11 +61,144 @@ STATUS_COLORS: Dict[str, tuple[int, int, int, int, int, int]] = {
 }
 
 
+PARTICIPATION_CODES = "KP"
+EMPTY_DAY = "."
+
+
+class DayCodes(MutableMapping):
+    """Legendas de um funcionário indexadas por data ISO.
+
+    Cada mês é guardado como um bytearray de 31 posições (um byte por dia, 0 = vazio).
+    Chaves que não são datas ou valores com mais de um caractere ficam em um dict à parte.
+    """
+
+    __slots__ = ("_months", "_extra")
+
+    def __init__(self, entries: Optional[Mapping[str, str]] = None):
+        self._months: Dict[str, bytearray] = {}
+        self._extra: Dict[str, str] = {}
+        for key, value in (entries or {}).items():
+            self[str(key)] = str(value)
+
+    @staticmethod
+    def _split(key: str) -> Optional[Tuple[str, int]]:
+        if len(key) != 10 or key[4] != "-" or key[7] != "-":
+            return None
+        if not (key[:4].isdigit() and key[5:7].isdigit() and key[8:].isdigit()):
+            return None
+        day = int(key[8:])
+        if not 1 <= day <= 31:
+            return None
+        return key[:7], day
+
+    def __getitem__(self, key: str) -> str:
+        parts = self._split(key)
+        if parts:
+            buf = self._months.get(parts[0])
+            if buf is not None and buf[parts[1] - 1]:
+                return chr(buf[parts[1] - 1])
+        return self._extra[key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        parts = self._split(key)
+        if parts and len(value) == 1 and value.isascii() and value not in ("\0", EMPTY_DAY):
+            self._extra.pop(key, None)
+            buf = self._months.get(parts[0])
+            if buf is None:
+                buf = self._months[parts[0]] = bytearray(31)
+            buf[parts[1] - 1] = ord(value)
+            return
+        if parts:
+            self._clear_day(*parts)
+        self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        parts = self._split(key)
+        if parts and self._clear_day(*parts):
+            return
+        del self._extra[key]
+
+    def _clear_day(self, period: str, day: int) -> bool:
+        buf = self._months.get(period)
+        if buf is None or not buf[day - 1]:
+            return False
+        buf[day - 1] = 0
+        if not any(buf):
+            del self._months[period]
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        for period, buf in self._months.items():
+            for idx, code in enumerate(buf):
+                if code:
+                    yield f"{period}-{idx + 1:02d}"
+        yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(31 - buf.count(0) for buf in self._months.values()) + len(self._extra)
+
+    def __repr__(self) -> str:
+        return f"DayCodes({dict(self)!r})"
+
+    def month_codes(self, year: int, month: int) -> List[str]:
+        """Legenda de cada dia do mês ("" quando vazio), na posição dia - 1."""
+        total_days = month_days(year, month)
+        buf = self._months.get(f"{int(year):04d}-{int(month):02d}")
+        if buf is None:
+            return [""] * total_days
+        return [chr(code) if code else "" for code in buf[:total_days]]
+
+    def count_codes(self, year: int, month: int, codes: str) -> int:
+        buf = self._months.get(f"{int(year):04d}-{int(month):02d}")
+        if buf is None:
+            return 0
+        days = buf[: month_days(year, month)]
+        return sum(days.count(ord(c)) for c in set(codes.upper() + codes.lower()))
+
+    def code_counts(self, year: int, month: int, codes: str, first_day: int = 1, last_day: Optional[int] = None) -> Dict[str, int]:
+        """Quantidade de cada código nos dias [first_day, last_day] do mês."""
+        counts = dict.fromkeys(codes, 0)
+        buf = self._months.get(f"{int(year):04d}-{int(month):02d}")
+        if buf is None:
+            return counts
+        last_day = month_days(year, month) if last_day is None else last_day
+        days = buf[first_day - 1 : last_day]
+        for code in codes:
+            counts[code] = days.count(ord(code.upper())) + days.count(ord(code.lower()))
+        return counts
+
+    def to_json(self) -> Dict[str, Any]:
+        """Formato gravado: {"days": {"AAAA-MM": "K.P..A"}} e, se houver, "entries" com o restante."""
+        out: Dict[str, Any] = {
+            "days": {
+                period: "".join(chr(code) if code else EMPTY_DAY for code in buf).rstrip(EMPTY_DAY)
+                for period, buf in self._months.items()
+            }
+        }
+        if self._extra:
+            out["entries"] = dict(self._extra)
+        return out
+
+    @classmethod
+    def from_json(cls, raw: Mapping[str, Any]) -> "DayCodes":
+        """Lê tanto o formato compacto ("days") quanto o antigo ("entries": {data ISO: código})."""
+        codes = cls({str(k): str(v) for k, v in (raw.get("entries") or {}).items()})
+        for period, text in (raw.get("days") or {}).items():
+            for idx, char in enumerate(str(text)[:31]):
+                if char != EMPTY_DAY:
+                    codes[f"{period}-{idx + 1:02d}"] = char
+        return codes
+
+
 @dataclass
 class TeamMember:
     id: str
     name: str
-    entries: Dict[str, str]
+    entries: DayCodes
+
+    def __post_init__(self):
+        if not isinstance(self.entries, DayCodes):
+            self.entries = DayCodes(self.entries)
 
 
 @dataclass
@@ -72,33 +209,92 @@ class TeamSection:
 
 
 class TeamControlStore:
+    """Presenças por período, gravadas em um arquivo por mês (team_control/AAAA-MM.json).
+
+    Apenas o período ativo e alguns meses consultados recentemente ficam em memória.
+    """
+
     def __init__(self, base_dir: str):
         self.path = os.path.join(base_dir, TEAM_CONTROL_FILE)
+        self.dir = os.path.join(base_dir, TEAM_CONTROL_DIR)
         self.sections: List[TeamSection] = []
-        self._period_sections: Dict[str, List[TeamSection]] = {}
+        self._period_sections: "OrderedDict[str, List[TeamSection]]" = OrderedDict()
+        self._dirty_periods: set[str] = set()
         self._active_period = self._period_key(date.today().year, date.today().month)
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._rollups: Dict[str, MonthRollup] = {}
         self.load()
 
     def _period_key(self, year: int, month: int) -> str:
         return f"{int(year):04d}-{int(month):02d}"
 
+    def _period_path(self, period: str) -> str:
+        return os.path.join(self.dir, f"{period}.json")
+
     def set_period(self, year: int, month: int) -> None:
         self._active_period = self._period_key(year, month)
-        self.sections = self._period_sections.get(self._active_period, [])
+        self.sections = self._sections_for(self._active_period)
 
     def get_sections_for_period(self, year: int, month: int) -> List[TeamSection]:
-        key = self._period_key(year, month)
-        return self._period_sections.get(key, [])
+        return self._sections_for(self._period_key(year, month))
 
     def load(self) -> None:
+        """Grava o que está pendente, descarta o cache e relê o período ativo do disco."""
+        if self._dirty_periods:
+            # Dentro de um batch() as alterações ainda não foram gravadas; não podem se perder.
+            self._flush()
+        self._batch_dirty = False
+        self._migrate_legacy_file()
+        self._period_sections.clear()
+        self._rollups.clear()
+        self.sections = self._sections_for(self._active_period)
+
+    def _stored_periods(self) -> List[str]:
+        if not os.path.isdir(self.dir):
+            return []
+        return sorted(name[:-5] for name in os.listdir(self.dir) if PERIOD_FILE_RE.match(name))
+
+    def _read_period(self, period: str) -> Optional[List[TeamSection]]:
+        path = self._period_path(period)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        return self._parse_sections(raw.get("sections", []))
+
+    def _sections_for(self, period: str) -> List[TeamSection]:
+        cached = self._period_sections.get(period)
+        if cached is not None:
+            self._period_sections.move_to_end(period)
+            return cached
+        sections = self._read_period(period)
+        if sections is None:
+            return []
+        self._remember(period, sections)
+        return sections
+
+    def _remember(self, period: str, sections: List[TeamSection]) -> None:
+        self._period_sections[period] = sections
+        self._period_sections.move_to_end(period)
+        while len(self._period_sections) > PERIOD_CACHE_SIZE:
+            victim = next(
+                (p for p in self._period_sections if p != self._active_period and p not in self._dirty_periods),
+                None,
+            )
+            if victim is None:
+                break
+            del self._period_sections[victim]
+
+    def _migrate_legacy_file(self) -> None:
+        """Converte o team_control.json único (com ou sem "periods") em arquivos por mês."""
         if not os.path.exists(self.path):
-            self.sections = []
             return
         with open(self.path, "r", encoding="utf-8") as f:
             raw = json.load(f)
         periods_raw = raw.get("periods")
         if isinstance(periods_raw, dict):
-            self._period_sections = {
+            periods = {
                 str(period): self._parse_sections(data.get("sections", []))
                 for period, data in periods_raw.items()
                 if isinstance(data, dict)
@@ -106,11 +302,12 @@ class TeamControlStore:
         else:
             # Compatibilidade com formato legado.
             legacy_sections = self._parse_sections(raw.get("sections", []))
-            self._period_sections = {}
-            if legacy_sections:
-                self._period_sections[self._active_period] = legacy_sections
+            periods = {self._active_period: legacy_sections} if legacy_sections else {}
 
-        self.sections = self._period_sections.get(self._active_period, [])
+        os.makedirs(self.dir, exist_ok=True)
+        for period, sections in periods.items():
+            self._write_json(self._period_path(period), {"sections": self._sections_payload(sections)})
+        os.replace(self.path, self.path + ".migrated")
 
     def _parse_sections(self, raw_sections: List[dict]) -> List[TeamSection]:
         out: List[TeamSection] = []
@@ -121,7 +318,7 @@ class TeamControlStore:
                     TeamMember(
                         id=str(m.get("id") or uuid.uuid4().hex),
                         name=str(m.get("name") or "").strip(),
-                        entries={str(k): str(v) for k, v in (m.get("entries") or {}).items()},
+                        entries=DayCodes.from_json(m),
                     )
                 )
             out.append(
@@ -134,33 +331,96 @@ class TeamControlStore:
         return out
 
     def save(self) -> None:
-        self._period_sections[self._active_period] = self.sections
-        payload = self.to_payload()
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
-
-    def to_payload(self) -> Dict[str, Dict[str, Dict[str, List[dict]]]]:
-        payload = {"periods": {}}
-        for period, sections in self._period_sections.items():
-            payload["periods"][period] = {
-                "sections": [
+        self._remember(self._active_period, self.sections)
+        self._dirty_periods.add(self._active_period)
+        self._rollups.pop(self._active_period, None)
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        self._flush()
+
+    def _flush(self) -> None:
+        os.makedirs(self.dir, exist_ok=True)
+        for period in sorted(self._dirty_periods):
+            self._write_json(self._period_path(period), {"sections": self._sections_payload(self._period_sections[period])})
+        self._dirty_periods.clear()
+
+    def _write_json(self, path: str, payload: dict) -> None:
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Agrupa várias alterações em uma única gravação ao final do bloco."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self._flush()
+
+    def _sections_payload(self, sections: List[TeamSection]) -> List[dict]:
+        return [
+            {
+                "id": s.id,
+                "name": s.name,
+                "members": [
                     {
-                        "id": s.id,
-                        "name": s.name,
-                        "members": [
-                            {
-                                "id": m.id,
-                                "name": m.name,
-                                "entries": m.entries,
-                            }
-                            for m in s.members
-                        ],
+                        "id": m.id,
+                        "name": m.name,
+                        **m.entries.to_json(),
                     }
-                    for s in sections
-                ]
+                    for m in s.members
+                ],
             }
+            for s in sections
+        ]
+
+    def to_payload(self) -> Dict[str, Dict[str, Dict[str, List[dict]]]]:
+        """Todos os períodos (memória + disco), no formato do antigo team_control.json."""
+        payload = {"periods": {}}
+        for period in sorted(set(self._stored_periods()) | set(self._period_sections)):
+            sections = self._period_sections.get(period)
+            if sections is None:
+                sections = self._read_period(period) or []
+            payload["periods"][period] = {"sections": self._sections_payload(sections)}
         return payload
 
+    def restore_payload(self, payload: Dict[str, Any]) -> None:
+        """Substitui todos os períodos pelos de um payload gerado por to_payload()."""
+        periods = payload.get("periods") if isinstance(payload, dict) else None
+        if not isinstance(periods, dict):
+            periods = {}
+
+        for period in self._stored_periods():
+            os.remove(self._period_path(period))
+        self._period_sections.clear()
+        self._dirty_periods.clear()
+        self._rollups.clear()
+        os.makedirs(self.dir, exist_ok=True)
+        for period, entry in periods.items():
+            if isinstance(entry, dict) and PERIOD_FILE_RE.match(f"{period}.json"):
+                sections = self._parse_sections(entry.get("sections", []))
+                self._write_json(self._period_path(str(period)), {"sections": self._sections_payload(sections)})
+        self.sections = self._sections_for(self._active_period)
+
+    def monthly_rollup(self, year: int, month: int) -> MonthRollup:
+        """Totais do mês, calculados uma vez e descartados quando o período é alterado."""
+        period = self._period_key(year, month)
+        rollup = self._rollups.get(period)
+        if rollup is None:
+            sections = self._period_sections.get(period)
+            if sections is None:
+                sections = self._read_period(period) or []
+            rollup = self._rollups[period] = build_month_rollup(sections, year, month)
+        return rollup
+
     def create_section(self, name: str) -> TeamSection:
         cleaned = (name or "").strip()
         if not cleaned:
@@ -183,7 +443,7 @@ class TeamControlStore:
         section = self._get_section(section_id)
         if len(section.members) >= MAX_MEMBERS_PER_SECTION:
             raise ValueError("Limite de 20 funcionários por time atingido.")
-        member = TeamMember(id=uuid.uuid4().hex, name=cleaned, entries={})
+        member = TeamMember(id=uuid.uuid4().hex, name=cleaned, entries=DayCodes())
         section.members.append(member)
         self.save()
         return member
@@ -203,7 +463,7 @@ class TeamControlStore:
                 raise ValueError("Limite de 20 funcionários por time atingido.")
 
             for name in cleaned_names:
-                member = TeamMember(id=uuid.uuid4().hex, name=name, entries={})
+                member = TeamMember(id=uuid.uuid4().hex, name=name, entries=DayCodes())
                 section.members.append(member)
                 added += 1
 
@@ -211,7 +471,7 @@ class TeamControlStore:
             return added
         finally:
             self._active_period = original_period
-            self.sections = self._period_sections.get(original_period, [])
+            self.sections = self._sections_for(original_period)
 
     def remove_member(self, section_id: str, member_id: str) -> None:
         section = self._get_section(section_id)
@@ -236,6 +496,15 @@ class TeamControlStore:
             member.entries[key] = value
         self.save()
 
+    def set_entries_bulk(self, section_id: str, updates: Iterable[Tuple[str, date, str]]) -> int:
+        """Aplica várias legendas (member_id, data, código) de um time com uma única gravação."""
+        count = 0
+        with self.batch():
+            for member_id, when, code in updates:
+                self.set_entry(section_id, member_id, when, code)
+                count += 1
+        return count
+
     def _get_section(self, section_id: str) -> TeamSection:
         for s in self.sections:
             if s.id == section_id:
@@ -259,14 +528,142 @@ def participation_for_date(entries: List[str]) -> int:
 
 
 def monthly_k_count(member: TeamMember, year: int, month: int) -> int:
-    total_days = month_days(year, month)
-    count = 0
-    for d in range(1, total_days + 1):
-        key = date(year, month, d).isoformat()
-        if (member.entries.get(key) or "").strip().upper() in {"K", "P"}:
-            count += 1
-    return count
+    return member.entries.count_codes(year, month, PARTICIPATION_CODES)
+
+
+def daily_participation(members: List[TeamMember], year: int, month: int) -> List[int]:
+    """Participação (K/P) de cada dia do mês, na posição dia - 1."""
+    totals = [0] * month_days(year, month)
+    for member in members:
+        for idx, code in enumerate(member.entries.month_codes(year, month)):
+            if code and code.upper() in PARTICIPATION_CODES:
+                totals[idx] += 1
+    return totals
 
 
 def split_member_names(raw_names: str) -> List[str]:
     return [piece.strip() for piece in re.split(r"[,\n]+", raw_names or "") if piece.strip()]
+
+
+TEAM_CODES = "PAKFDHR"
+
+
+@dataclass
+class MemberCounts:
+    section: str
+    name: str
+    counts: Dict[str, int]
+
+
+@dataclass
+class MonthRollup:
+    period: str
+    members: List[MemberCounts]
+    daily_participation: Dict[str, List[int]]
+
+
+@dataclass
+class TeamAnalytics:
+    start: date
+    end: date
+    members: Dict[Tuple[str, str], Dict[str, int]]
+    sections: Dict[str, Dict[str, int]]
+    daily_participation: Dict[str, Dict[date, int]]
+
+
+def build_month_rollup(sections: List[TeamSection], year: int, month: int, first_day: int = 1, last_day: Optional[int] = None) -> MonthRollup:
+    """Contagem de cada legenda por funcionário e participação diária por time, nos dias [first_day, last_day]."""
+    last_day = month_days(year, month) if last_day is None else last_day
+    members: List[MemberCounts] = []
+    daily: Dict[str, List[int]] = {}
+    for section in sections:
+        per_day = daily.setdefault(section.name, [0] * month_days(year, month))
+        for member in section.members:
+            members.append(MemberCounts(section.name, member.name, member.entries.code_counts(year, month, TEAM_CODES, first_day, last_day)))
+            codes = member.entries.month_codes(year, month)
+            for idx in range(first_day - 1, last_day):
+                if codes[idx] and codes[idx].upper() in PARTICIPATION_CODES:
+                    per_day[idx] += 1
+    return MonthRollup(period=f"{int(year):04d}-{int(month):02d}", members=members, daily_participation=daily)
+
+
+def _months_in_range(start: date, end: date) -> Iterator[Tuple[int, int, int, int]]:
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        first_day = start.day if (year, month) == (start.year, start.month) else 1
+        last_day = end.day if (year, month) == (end.year, end.month) else month_days(year, month)
+        yield year, month, first_day, last_day
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def _range_rollups(store: TeamControlStore, start: date, end: date) -> Iterator[Tuple[int, int, MonthRollup]]:
+    for year, month, first_day, last_day in _months_in_range(start, end):
+        if first_day == 1 and last_day == month_days(year, month):
+            rollup = store.monthly_rollup(year, month)
+        else:
+            rollup = build_month_rollup(store.get_sections_for_period(year, month), year, month, first_day, last_day)
+        yield year, month, rollup
+
+
+def team_analytics(store: TeamControlStore, start: date, end: date) -> TeamAnalytics:
+    """Totais por funcionário/time e participação diária entre start e end (inclusive)."""
+    if end < start:
+        raise ValueError("Data final anterior à data inicial.")
+    members: Dict[Tuple[str, str], Dict[str, int]] = {}
+    sections: Dict[str, Dict[str, int]] = {}
+    daily: Dict[str, Dict[date, int]] = {}
+    for year, month, rollup in _range_rollups(store, start, end):
+        for item in rollup.members:
+            member_totals = members.setdefault((item.section, item.name), dict.fromkeys(TEAM_CODES, 0))
+            section_totals = sections.setdefault(item.section, dict.fromkeys(TEAM_CODES, 0))
+            for code, count in item.counts.items():
+                member_totals[code] += count
+                section_totals[code] += count
+        for section_name, per_day in rollup.daily_participation.items():
+            section_daily = daily.setdefault(section_name, {})
+            for idx, total in enumerate(per_day):
+                if total:
+                    section_daily[date(year, month, idx + 1)] = total
+    return TeamAnalytics(start=start, end=end, members=members, sections=sections, daily_participation=daily)
+
+
+def yearly_team_analytics(store: TeamControlStore, year: int) -> TeamAnalytics:
+    return team_analytics(store, date(year, 1, 1), date(year, 12, 31))
+
+
+def iter_team_analytics_report_rows(store: TeamControlStore, start: date, end: date) -> Iterator[List[str]]:
+    """Linhas do relatório de vários meses, geradas mês a mês (sem montar o relatório inteiro em memória)."""
+    code_headers = list(TEAM_CODES)
+    yield ["Período", start.strftime("%d/%m/%Y"), "a", end.strftime("%d/%m/%Y")]
+    yield ["Use", "P - Presente", "A - Ausente", "K - Com demanda", "F - Férias", "D - Day-off", "H - Feriado", "R - Recesso"]
+    yield []
+    yield ["Mês", "Time", "Nome"] + code_headers + ["Participação"]
+
+    member_totals: Dict[Tuple[str, str], Dict[str, int]] = {}
+    section_totals: Dict[str, Dict[str, int]] = {}
+    for year, month, rollup in _range_rollups(store, start, end):
+        label = f"{month:02d}/{year}"
+        for item in rollup.members:
+            totals = member_totals.setdefault((item.section, item.name), dict.fromkeys(TEAM_CODES, 0))
+            sec = section_totals.setdefault(item.section, dict.fromkeys(TEAM_CODES, 0))
+            for code, count in item.counts.items():
+                totals[code] += count
+                sec[code] += count
+            participation = sum(item.counts[c] for c in PARTICIPATION_CODES)
+            yield [label, item.section, item.name] + [str(item.counts[c]) for c in TEAM_CODES] + [str(participation)]
+
+    yield []
+    yield ["Total", "Time", "Nome"] + code_headers + ["Participação"]
+    for (section_name, name), totals in member_totals.items():
+        participation = sum(totals[c] for c in PARTICIPATION_CODES)
+        yield ["", section_name, name] + [str(totals[c]) for c in TEAM_CODES] + [str(participation)]
+    for section_name, totals in section_totals.items():
+        participation = sum(totals[c] for c in PARTICIPATION_CODES)
+        yield ["", section_name, "Total do time"] + [str(totals[c]) for c in TEAM_CODES] + [str(participation)]
+
+
+def write_team_analytics_csv(path: str, store: TeamControlStore, start: date, end: date) -> None:
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f, delimiter=";")
+        for row in iter_team_analytics_report_rows(store, start, end):
+            writer.writerow(row)
@@ -0,0 +1,163 @@
+"""Servidor HTTP local que imita o endpoint /v1/responses da OpenAI nos testes e benchmarks.
+
+Com "stream": true no corpo, responde em SSE (chunked), um evento de delta por pedaço do texto,
+encerrado pelo evento final configurado (response.completed por padrão).
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+
+def response_payload(text: str, model: str = "fake-model") -> dict:
+    return {
+        "id": "resp_fake",
+        "object": "response",
+        "created_at": int(time.time()),
+        "model": model,
+        "status": "completed",
+        "parallel_tool_calls": False,
+        "tool_choice": "auto",
+        "tools": [],
+        "output": [
+            {
+                "type": "message",
+                "id": "msg_fake",
+                "status": "completed",
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Cabeçalhos e corpo saem em escritas separadas; sem isso o Nagle soma ~40 ms por resposta.
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def setup(self) -> None:
+        super().setup()
+        # Uma instância do handler por conexão TCP; keep-alive reaproveita a mesma.
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        with self.server.lock:
+            self.server.requests.append(body)
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        if body.get("stream"):
+            self._stream(body.get("model", "fake-model"))
+            return
+        data = json.dumps(response_payload(self.server.text, body.get("model", "fake-model"))).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+    def _stream(self, model: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        text = self.server.text
+        size = self.server.chunk_size
+        events = [("response.created", {"response": {**response_payload("", model), "status": "in_progress", "output": []}})]
+        for seq, start in enumerate(range(0, len(text), size), start=1):
+            events.append(
+                (
+                    "response.output_text.delta",
+                    {"item_id": "msg_fake", "output_index": 0, "content_index": 0, "delta": text[start:start + size], "logprobs": [], "sequence_number": seq},
+                )
+            )
+        terminal = self.server.terminal_event
+        if terminal == "error":
+            events.append(("error", {"code": "server_error", "message": "falha simulada", "param": None, "sequence_number": len(events)}))
+        else:
+            status = {"response.completed": "completed", "response.failed": "failed", "response.incomplete": "incomplete"}[terminal]
+            events.append((terminal, {"response": {**response_payload(text, model), "status": status}}))
+        try:
+            for index, (event, data) in enumerate(events):
+                if index and self.server.chunk_delay:
+                    time.sleep(self.server.chunk_delay)
+                payload = json.dumps({"type": event, **data})
+                self._write_chunk(f"event: {event}\ndata: {payload}\n\n".encode("utf-8"))
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # O cliente cancelou a geração e fechou a conexão.
+            with self.server.lock:
+                self.server.aborted_streams += 1
+            self.close_connection = True
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, text: str, delay: float, chunk_size: int, chunk_delay: float, terminal_event: str):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.terminal_event = terminal_event
+        self.text = text
+        self.delay = delay
+        self.chunk_size = max(1, chunk_size)
+        self.chunk_delay = chunk_delay
+        self.aborted_streams = 0
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests: List[dict] = []
+
+
+class FakeOpenAIServer:
+    """Uso: `with FakeOpenAIServer("texto") as server: OpenAIWritingClient(base_url=server.base_url)`."""
+
+    def __init__(
+        self,
+        text: str = "Texto sugerido",
+        delay: float = 0.0,
+        chunk_size: int = 4,
+        chunk_delay: float = 0.0,
+        terminal_event: str = "response.completed",
+    ):
+        self._server = _Server(text, delay, chunk_size, chunk_delay, terminal_event)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def connections(self) -> int:
+        return self._server.connections
+
+    @property
+    def requests(self) -> List[dict]:
+        return self._server.requests
+
+    @property
+    def aborted_streams(self) -> int:
+        return self._server.aborted_streams
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,55 @@
+import sqlite3
+
+from ai_writing.cache import SuggestionCache
+
+
+def _key(cache, text="Texto da demanda", instruction="Resuma.", context=None):
+    return cache.key_for("gpt-5.2", 0.3, instruction, text, context or {"field": "Descrição", "demand_id": "7"})
+
+
+def test_key_covers_every_input_and_ignores_sanitized_differences():
+    cache = SuggestionCache()
+    base = _key(cache)
+    assert _key(cache, text="Texto da demanda\x00") == base
+    assert _key(cache, text="Outro texto") != base
+    assert _key(cache, text="  Texto da demanda  ") == base
+    assert _key(cache, instruction="Formal.") != base
+    assert _key(cache, context={"field": "Comentário", "demand_id": "7"}) != base
+    assert cache.key_for("gpt-4.1-mini", 0.3, "Resuma.", "Texto da demanda", {"field": "Descrição", "demand_id": "7"}) != base
+
+
+def test_memory_tier_is_lru_with_ttl(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr("ai_writing.cache.time.time", lambda: clock["now"])
+    cache = SuggestionCache(max_entries=2, ttl_seconds=60)
+
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.get("a") == "A"
+    cache.put("c", "C")
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+
+    clock["now"] += 61
+    assert cache.get("a") is None
+
+
+def test_persistent_tier_is_encrypted_and_privacy_mode_keeps_only_hashes(tmp_path):
+    text = "Cliente ACME pediu relatório confidencial"
+    cache = SuggestionCache(str(tmp_path), persistent=True, privacy_mode=True)
+    key = _key(cache, text=text)
+    cache.put(key, "Sugestão secreta", text)
+    cache.close()
+
+    with sqlite3.connect(str(tmp_path / "ai_writing_cache.sqlite3")) as con:
+        rows = con.execute("SELECT key_hash, input_text, suggestion FROM suggestions").fetchall()
+    assert rows[0][0] == key and rows[0][1] is None
+    assert "secreta" not in rows[0][2] and "ACME" not in rows[0][0]
+
+    reopened = SuggestionCache(str(tmp_path), persistent=True, privacy_mode=False)
+    assert _key(reopened, text=text) == key
+    assert reopened.get(key) == "Sugestão secreta"
+    reopened.put(key, "Outra variação", text)
+    with sqlite3.connect(str(tmp_path / "ai_writing_cache.sqlite3")) as con:
+        assert con.execute("SELECT input_text FROM suggestions").fetchone()[0] is not None
+    reopened.close()
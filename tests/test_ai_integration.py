@@ -69,3 +69,23 @@ def test_no_selection_replaces_entire_text_and_undo(monkeypatch):
     assert widget.toPlainText() == "novo"
     binding.undo_last()
     assert widget.toPlainText() == "texto original"
+
+
+def test_panel_options_are_read_when_panel_opens(monkeypatch):
+    widget = FakeTextWidget("texto")
+    settings = {"prefetch": False}
+    binding = AIFieldBinding(widget, lambda: {}, lambda **kwargs: "novo", lambda: dict(settings))
+    received = []
+
+    class FakePanel:
+        Accepted = 1
+        def __init__(self, source, handler, context, parent=None, **options):
+            received.append(options)
+        def exec(self):
+            return 0
+
+    monkeypatch.setattr("ai_writing.integration.PANEL_CLASS", FakePanel)
+    binding.open_panel()
+    settings["prefetch"] = True
+    binding.open_panel()
+    assert received == [{"prefetch": False}, {"prefetch": True}]
@@ -1,8 +1,9 @@
+import threading
 from types import SimpleNamespace
 
 import pytest
 
-from ai_writing.openai_client import MissingAPIKeyError, OpenAIWritingClient
+from ai_writing.openai_client import AIWritingCancelled, AIWritingError, MissingAPIKeyError, OpenAIWritingClient, WritingClientPool
 
 
 class FakeRateLimitError(Exception):
@@ -73,3 +74,104 @@ def test_missing_openai_dependency_raises_specific_error(monkeypatch):
     client = OpenAIWritingClient()
     with pytest.raises(MissingOpenAIDependencyError):
         client.suggest("abc", "i", {})
+
+
+def test_client_pool_reuses_one_client_per_configuration_until_reset(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    created = []
+
+    class CountingOpenAI(FakeOpenAI):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.closed = False
+            created.append(self)
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr("ai_writing.openai_client.OpenAI", CountingOpenAI)
+    pool = WritingClientPool()
+
+    first = pool.get("gpt-5.2", 0.3)
+    assert pool.get("gpt-5.2", 0.3) is first
+    other = pool.get("gpt-4.1-mini", 0.3)
+    assert other is not first and other.model == "gpt-4.1-mini"
+    assert len(created) == 2
+
+    pool.reset()
+    assert all(client.closed for client in created)
+    assert pool.get("gpt-5.2", 0.3) is not first
+
+
+def test_reused_client_keeps_connection_alive_against_local_server(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    from fake_openai_server import FakeOpenAIServer
+
+    with FakeOpenAIServer("Texto do servidor") as server:
+        pool = WritingClientPool(base_url=server.base_url, max_retries=1)
+        for _ in range(3):
+            assert pool.get("gpt-5.2", 0.3).suggest("Texto", "Instrução", {"field": "Descrição"}) == "Texto do servidor"
+        pool.reset()
+
+    assert len(server.requests) == 3
+    assert server.requests[0]["model"] == "gpt-5.2"
+    assert server.connections == 1
+
+
+def test_suggest_stream_delivers_deltas_in_order(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    from fake_openai_server import FakeOpenAIServer
+
+    deltas, finals = [], []
+    with FakeOpenAIServer("Texto reescrito em partes", chunk_size=5) as server:
+        client = OpenAIWritingClient(base_url=server.base_url, max_retries=1)
+        result = client.suggest_stream("Texto", "Instrução", {}, on_delta=deltas.append, on_final=finals.append)
+        client.close()
+
+    assert result == "Texto reescrito em partes"
+    assert len(deltas) == 5 and "".join(deltas) == result
+    assert finals == [result]
+    assert server.requests[0]["stream"] is True
+
+
+def test_suggest_stream_cancel_closes_connection(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    from fake_openai_server import FakeOpenAIServer
+
+    cancel = threading.Event()
+    deltas, finals = [], []
+
+    def on_delta(delta):
+        deltas.append(delta)
+        cancel.set()
+
+    with FakeOpenAIServer("x" * 400, chunk_size=4, chunk_delay=0.01) as server:
+        client = OpenAIWritingClient(base_url=server.base_url, max_retries=1)
+        with pytest.raises(AIWritingCancelled):
+            client.suggest_stream("Texto", "Instrução", {}, on_delta=on_delta, on_final=finals.append, cancel_event=cancel)
+        client.close()
+        for _ in range(100):
+            if server.aborted_streams:
+                break
+            threading.Event().wait(0.02)
+
+    assert deltas == ["xxxx"]
+    assert finals == []
+    assert server.aborted_streams == 1
+
+
+@pytest.mark.parametrize("terminal_event", ["response.failed", "response.incomplete", "error"])
+def test_suggest_stream_rejects_truncated_responses(monkeypatch, terminal_event):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    from fake_openai_server import FakeOpenAIServer
+
+    deltas, finals = [], []
+    with FakeOpenAIServer("Texto cortado", terminal_event=terminal_event) as server:
+        client = OpenAIWritingClient(base_url=server.base_url, max_retries=1)
+        with pytest.raises(AIWritingError) as excinfo:
+            client.suggest_stream("Texto", "Instrução", {}, on_delta=deltas.append, on_final=finals.append)
+        client.close()
+
+    assert not isinstance(excinfo.value, AIWritingCancelled)
+    assert "".join(deltas) == "Texto cortado"
+    assert finals == []
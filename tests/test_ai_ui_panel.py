@@ -0,0 +1,131 @@
+import threading
+import time
+
+import pytest
+
+qtwidgets = pytest.importorskip("PySide6.QtWidgets", reason="PySide6 indisponível no ambiente de teste", exc_type=ImportError)
+
+from ai_writing.openai_client import AIWritingCancelled
+from ai_writing import ui_panel
+from ai_writing.prompts import ACTIONS
+from ai_writing.ui_panel import PREFETCH_WORKERS, AIWritingPanel
+
+QApplication = qtwidgets.QApplication
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _wait_until(app, predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    app.processEvents()
+    return predicate()
+
+
+def test_panel_shows_streamed_text_before_completion():
+    app = _get_app()
+    release = threading.Event()
+    seen = []
+
+    def handler(on_delta, cancel_event, **kwargs):
+        on_delta("Texto ")
+        on_delta("parcial")
+        release.wait(2)
+        return "Texto parcial completo"
+
+    panel = AIWritingPanel("origem", handler, {"field": "Descrição"})
+    panel.generate()
+
+    assert _wait_until(app, lambda: panel.after.toPlainText() == "Texto parcial")
+    seen.append(panel.status.text())
+    release.set()
+    assert _wait_until(app, lambda: panel.status.text() == "success")
+
+    assert seen == ["streaming"]
+    assert panel.after.toPlainText() == "Texto parcial completo"
+    panel.done(0)
+
+
+def test_closing_panel_cancels_generation_in_progress():
+    app = _get_app()
+    started = threading.Event()
+    cancelled = threading.Event()
+
+    def handler(on_delta, cancel_event, **kwargs):
+        on_delta("início")
+        started.set()
+        cancel_event.wait(2)
+        cancelled.set()
+        raise AIWritingCancelled("Geração cancelada.")
+
+    panel = AIWritingPanel("origem", handler, {})
+    panel.generate()
+    assert started.wait(2)
+
+    panel.done(0)
+
+    assert cancelled.wait(2)
+    assert _wait_until(app, lambda: not ui_panel._DETACHED_THREADS)
+    assert panel.status.text() != "error"
+
+
+def test_prefetch_generates_every_action_with_bounded_concurrency():
+    app = _get_app()
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+    calls = []
+
+    def handler(input_text, instruction, context, on_delta, cancel_event, **kwargs):
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            calls.append(instruction)
+        time.sleep(0.02)
+        with lock:
+            running["now"] -= 1
+        return f"sugestão {len(instruction)}"
+
+    panel = AIWritingPanel("origem", handler, {}, show_chips=True, prefetch=True)
+    assert len(panel.chips.buttons()) == len(ACTIONS)
+    assert _wait_until(app, lambda: len(panel._prefetched) == len(ACTIONS))
+
+    assert len(calls) == len(ACTIONS)
+    assert running["peak"] <= PREFETCH_WORKERS
+    assert panel.status.text() == "success"
+
+    panel.chips.button(3).click()
+    assert panel.action_combo.currentIndex() == 3
+    assert panel.status.text() == "success"
+    assert panel.after.toPlainText() == panel._prefetched[panel.action_combo.currentData()]
+    panel.generate()
+    assert len(calls) == len(ACTIONS)
+    panel.done(0)
+
+
+def test_closing_panel_cancels_pending_prefetch():
+    app = _get_app()
+    started = []
+    cancelled = []
+
+    def handler(instruction, on_delta, cancel_event, **kwargs):
+        started.append(instruction)
+        cancel_event.wait(2)
+        cancelled.append(instruction)
+        raise AIWritingCancelled("Geração cancelada.")
+
+    panel = AIWritingPanel("origem", handler, {}, show_chips=True, prefetch=True)
+    assert _wait_until(app, lambda: len(started) == PREFETCH_WORKERS)
+
+    panel.done(0)
+
+    assert _wait_until(app, lambda: len(cancelled) == PREFETCH_WORKERS)
+    time.sleep(0.05)
+    assert len(started) == PREFETCH_WORKERS
+    assert not panel._prefetch_tasks and not panel._prefetched
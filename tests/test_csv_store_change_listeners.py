@@ -0,0 +1,42 @@
+from csv_store import CsvStore, is_open_demand
+
+
+def _payload(status="Não iniciada"):
+    return {
+        "É Urgente?": "Não",
+        "Status": status,
+        "Prioridade": "Média",
+        "Data de Registro": "01/01/2025",
+        "Prazo": "10/01/2025",
+        "Data Conclusão": "",
+        "Projeto": "Projeto",
+        "Descrição": "Descrição",
+        "ID Azure": "AZ-1",
+        "% Conclusão": "0",
+        "Responsável": "Equipe",
+        "Reportar?": "Não",
+        "Nome": "Fulano",
+        "Time/Função": "Dev",
+    }
+
+
+def test_listeners_fire_on_mutations_but_not_on_load(tmp_path):
+    store = CsvStore(str(tmp_path))
+    calls = []
+    store.change_listeners.append(lambda: calls.append("change"))
+
+    _id = store.add(_payload())
+    store.update(_id, {"Prioridade": "Alta"})
+    store.load()
+    store.delete_by_id(_id)
+
+    assert calls == ["change", "change", "change"]
+
+
+def test_pending_tab_and_open_demands_share_the_same_filter(tmp_path):
+    store = CsvStore(str(tmp_path))
+    store.add(_payload())
+    store.add(_payload("Cancelado"))
+
+    assert [x["ID"] for x in store.tab_pending_all()] == [dr.data["ID"] for dr in store.rows if is_open_demand(dr.data)]
+    assert len(store.tab_pending_all()) == 1
@@ -0,0 +1,96 @@
+import pytest
+
+qtcore = pytest.importorskip("PySide6.QtCore", reason="PySide6 indisponível no ambiente de teste", exc_type=ImportError)
+qtwidgets = pytest.importorskip("PySide6.QtWidgets", reason="PySide6 indisponível no ambiente de teste", exc_type=ImportError)
+
+from app import MainWindow, VISIBLE_COLUMNS, SORT_KEY_COLUMN, _row_sort_keys
+from csv_store import CsvStore
+
+QApplication = qtwidgets.QApplication
+QMessageBox = qtwidgets.QMessageBox
+Qt = qtcore.Qt
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _close_window(win, monkeypatch):
+    # closeEvent pede confirmação em um QMessageBox modal.
+    monkeypatch.setattr(QMessageBox, "exec", lambda dialog: QMessageBox.Yes)
+    win.close()
+
+
+def _build_store(tmp_path):
+    store = CsvStore(str(tmp_path))
+    for registro in ["05/03/2026", "10/01/2026", "20/02/2025"]:
+        store.add(
+            {
+                "Projeto": f"Projeto {registro}",
+                "Descrição": "Demanda",
+                "Prioridade": "Alta",
+                "Prazo": registro,
+                "Data de Registro": registro,
+                "Status": "Em andamento",
+                "Responsável": "Ana",
+                "% Conclusão": "0.5",
+            }
+        )
+    return store
+
+
+def _column_texts(table, col_name):
+    col = VISIBLE_COLUMNS.index(col_name)
+    return [table.item(row, col).text() for row in range(table.rowCount())]
+
+
+def test_row_sort_keys_use_parsed_fields_and_push_empty_values_last():
+    row = {
+        "ID": "10",
+        "Prazo": "01/02/2026*,\n03/02/2026*",
+        "_prazos_dates": [],
+        "Projeto": "Alfa",
+    }
+    keys = _row_sort_keys(row)
+
+    assert keys[VISIBLE_COLUMNS.index("ID")] == 10.0
+    assert keys[VISIBLE_COLUMNS.index("Prazo")] == float("inf")
+    assert keys[VISIBLE_COLUMNS.index("Projeto")] == "alfa"
+    assert keys[VISIBLE_COLUMNS.index("Comentário")] > "zzz"
+
+
+def test_header_sort_orders_dates_chronologically_and_survives_refresh(tmp_path, monkeypatch):
+    _get_app()
+    store = _build_store(tmp_path)
+    win = MainWindow(store)
+    col = VISIBLE_COLUMNS.index("Data de Registro")
+
+    assert win.t3_table.isColumnHidden(SORT_KEY_COLUMN)
+
+    win._on_header_sort_requested(win.t3_table, col, Qt.AscendingOrder)
+    assert _column_texts(win.t3_table, "Data de Registro") == ["20/02/2025", "10/01/2026", "05/03/2026"]
+    assert win.t3_table.horizontalHeader().sortIndicatorSection() == col
+
+    win._on_header_sort_requested(win.t3_table, col, Qt.DescendingOrder)
+    win.refresh_tab3()
+    assert _column_texts(win.t3_table, "Data de Registro") == ["05/03/2026", "10/01/2026", "20/02/2025"]
+
+    _close_window(win, monkeypatch)
+
+
+def test_header_sort_orders_ids_numerically(tmp_path, monkeypatch):
+    _get_app()
+    store = _build_store(tmp_path)
+    for _ in range(8):
+        store.add({"Projeto": "Extra", "Descrição": "Demanda", "Prioridade": "Baixa", "Prazo": "01/01/2026", "Data de Registro": "01/01/2026", "Status": "Em andamento", "Responsável": "Ana"})
+    win = MainWindow(store)
+
+    win._on_header_sort_requested(win.t3_table, VISIBLE_COLUMNS.index("ID"), Qt.DescendingOrder)
+    ids = [int(text) for text in _column_texts(win.t3_table, "ID")]
+    assert ids == sorted(ids, reverse=True)
+    assert ids[0] == 11
+
+    _close_window(win, monkeypatch)
@@ -0,0 +1,113 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from datetime import datetime
+
+import pytest
+
+qtwidgets = pytest.importorskip("PySide6.QtWidgets", reason="PySide6 indisponível no ambiente de teste", exc_type=ImportError)
+
+from notifications.center_view import NotificationCenterDialog, NotificationTableModel
+from notifications.models import Notification, NotificationType
+from notifications.store import NotificationStore
+
+QApplication = qtwidgets.QApplication
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _fill_store(tmp_path, total):
+    store = NotificationStore(str(tmp_path))
+    store.insert_many(
+        [
+            Notification(
+                type=NotificationType.NOVA_DEMANDA,
+                title=f"Demanda #{i}",
+                body="Criada.",
+                payload={"demand_id": str(i)},
+                timestamp=datetime(2026, 1, 1, 8, 0),
+            )
+            for i in range(total)
+        ]
+    )
+    return store
+
+
+def test_model_fetches_pages_on_demand_and_reloads_evicted_pages(tmp_path):
+    _get_app()
+    store = _fill_store(tmp_path, 25)
+    model = NotificationTableModel(store, page_size=4)
+    model.reload()
+
+    assert model.rowCount() == 4
+    assert model.canFetchMore()
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.rowCount() == 25
+    # Só as páginas mais recentes ficam em memória; as demais são relidas por id.
+    assert len(model._pages) <= 8
+    assert model.data(model.index(0, 2)) == "Demanda #24"
+    assert model.data(model.index(24, 2)) == "Demanda #0"
+
+
+def test_center_dialog_decodes_payload_only_when_opening(tmp_path):
+    _get_app()
+    store = _fill_store(tmp_path, 3)
+    opened = []
+    dialog = NotificationCenterDialog(store, opened.append)
+
+    assert dialog.model.rowCount() == 3
+    dialog.table.selectRow(1)
+    assert dialog.mark_toggle_btn.text() == "Marcar como lida"
+    dialog._open_selected()
+
+    assert opened[0].payload == {"demand_id": "1"}
+    assert store.count_unread() == 2
+    dialog.close()
+
+
+def test_center_dialog_search_box_filters_with_full_text_index(tmp_path):
+    _get_app()
+    store = _fill_store(tmp_path, 30)
+    dialog = NotificationCenterDialog(store, lambda n: None)
+
+    dialog.search_edit.setText("#17")
+    dialog.refresh()
+    assert dialog.model.rowCount() == 1
+    assert dialog.model.data(dialog.model.index(0, 2)) == "Demanda #17"
+
+    dialog.search_edit.clear()
+    dialog.refresh()
+    assert dialog.model.rowCount() == 30
+    dialog.close()
+
+
+def test_model_keeps_only_page_anchors_and_reloads_after_deletes(tmp_path):
+    app = _get_app()
+    store = _fill_store(tmp_path, 60)
+    model = NotificationTableModel(store, page_size=4)
+    model.reload()
+    while model.canFetchMore():
+        model.fetchMore()
+
+    assert model.rowCount() == 60
+    assert len(model._anchors) == 15
+    assert 0 not in model._pages
+
+    # Exclusões numa página já descartada deslocam o conteúdo dela ao ser relida.
+    store.delete_many([item.id for item in store.list_notification_page(limit=3)[1:3]])
+    assert model.data(model.index(1, 2)) is None
+    app.processEvents()
+
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.rowCount() == 58
+    assert [model.data(model.index(r, 2)) for r in range(3)] == ["Demanda #59", "Demanda #56", "Demanda #55"]
+    assert model.data(model.index(57, 2)) == "Demanda #0"
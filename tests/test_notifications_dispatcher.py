@@ -89,3 +89,38 @@ def test_dispatcher_ignores_already_notified_occurrence():
     assert len(store.saved) == 0
     assert len(system.calls) == 0
     assert len(inapp.calls) == 0
+
+
+def test_dispatch_many_inserts_once_and_shows_single_summary(tmp_path):
+    from notifications.store import NotificationStore
+
+    store = NotificationStore(str(tmp_path))
+    loads = []
+    original_load = store.load_preferences
+    store.load_preferences = lambda: (loads.append(True), original_load())[1]
+    history_writes = []
+    original_record = store._record_history
+    store._record_history = lambda rows: (history_writes.append(len(rows)), original_record(rows))
+    system = Sink()
+    inapp = Sink()
+    dispatcher = NotificationDispatcher(store=store, system_notifier=system, inapp_notifier=inapp, is_app_focused=lambda: True)
+
+    def overdue(demand_id):
+        return Notification(
+            type=NotificationType.PRAZO_ESTOURADO,
+            title=f"Demanda #{demand_id} atrasada",
+            body="Prazo vencido.",
+            payload={"demand_id": demand_id, "deadline_date": "2026-01-01", "event_code": "deadline_overdue"},
+        )
+
+    batch = [overdue(str(i)) for i in range(37)] + [overdue("0")]
+    ids = dispatcher.dispatch_many(batch)
+
+    assert len(ids) == 37
+    assert loads == [True]
+    assert history_writes == [37]
+    assert inapp.calls == [("37 demandas atrasadas", "Abra a Central de Notificações para ver os detalhes.")]
+    assert store.count_unread() == 37
+
+    assert dispatcher.dispatch_many(batch) == []
+    assert len(inapp.calls) == 1
@@ -3,9 +3,14 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 
+import pytest
+
+qtcore = pytest.importorskip("PySide6.QtCore", reason="PySide6 indisponível no ambiente de teste", exc_type=ImportError)
+
 from notifications.models import NotificationType
 from notifications.scheduler import DeadlineScheduler
 
@@ -49,3 +54,157 @@ def test_scheduler_generates_proximo_and_estourado_events():
     overdue_payload = next(n.payload for n in captured if n.payload.get("demand_id") == "333")
     assert overdue_payload.get("deadline_date") == "2026-01-09"
     assert overdue_payload.get("event_code") == "deadline_overdue"
+
+
+def test_scheduler_arms_timer_for_next_transition_and_syncs_incrementally():
+    qtcore.QCoreApplication.instance() or qtcore.QCoreApplication([])
+    captured = []
+    clock = FixedTimeProvider(datetime(2026, 1, 10, 8, 0, 0))
+    scheduler = DeadlineScheduler(
+        repo=Repo(),
+        emitter=lambda n: captured.append(n),
+        time_provider=clock,
+    )
+    scheduler.check_now()
+
+    # Próxima mudança: 123 vence em 11/01 e fica atrasado à meia-noite de 12/01,
+    # mas 222 (10/01) já estoura à meia-noite de 11/01.
+    assert scheduler._heap[0][0] == datetime(2026, 1, 11, 0, 0, 0)
+    assert scheduler.timer.isActive()
+    assert scheduler.timer.remainingTime() <= 16 * 3600 * 1000 + 1000
+
+    captured.clear()
+    demands = Repo().list_open_demands()
+    assert scheduler.sync(demands) == []
+    assert captured == []
+
+    demands[3] = {"ID": "444", "Prazo": "10/01/2026"}
+    events = scheduler.sync(demands[1:])
+    assert [(evt.demand_id, evt.notification_type) for evt in events] == [("444", NotificationType.PRAZO_PROXIMO)]
+    assert "123" not in scheduler._index
+
+    captured.clear()
+    clock.current = datetime(2026, 1, 11, 0, 0, 1)
+    scheduler._on_timer()
+    assert sorted(n.payload["demand_id"] for n in captured) == ["222", "444"]
+    assert all(n.type == NotificationType.PRAZO_ESTOURADO for n in captured)
+
+
+def test_request_sync_scans_in_worker_and_coalesces_overlapping_requests(monkeypatch):
+    app = qtcore.QCoreApplication.instance() or qtcore.QCoreApplication([])
+    import notifications.scheduler as scheduler_module
+
+    scan_threads = []
+    original_scan = scheduler_module.scan_demands
+
+    def tracking_scan(*args, **kwargs):
+        scan_threads.append(threading.get_ident())
+        return original_scan(*args, **kwargs)
+
+    monkeypatch.setattr(scheduler_module, "scan_demands", tracking_scan)
+
+    batches = []
+    scheduler = DeadlineScheduler(
+        repo=Repo(),
+        emitter=lambda n: None,
+        batch_emitter=lambda notifications: batches.append((threading.get_ident(), list(notifications))),
+        time_provider=FixedTimeProvider(datetime(2026, 1, 10, 8, 0, 0)),
+    )
+
+    started = []
+    original_start = scheduler._start_scan
+    scheduler._start_scan = lambda snapshot, full: (started.append(len(snapshot)), original_start(snapshot, full))
+
+    demands = Repo().list_open_demands()
+    scheduler.request_sync(demands, full=True)
+    scheduler.request_sync(demands[:2])
+    scheduler.request_sync(demands)
+
+    deadline = qtcore.QDeadlineTimer(5000)
+    while scheduler.is_scanning() and not deadline.hasExpired():
+        app.processEvents(qtcore.QEventLoop.AllEvents, 50)
+
+    assert not scheduler.is_scanning()
+    # Os dois pedidos feitos durante a primeira varredura viram uma só.
+    assert started == [4, 4]
+    assert scan_threads and threading.get_ident() not in scan_threads
+    assert all(thread_id == threading.get_ident() for thread_id, _ in batches)
+    assert sorted(n.payload["demand_id"] for _, notifications in batches for n in notifications) == ["123", "222", "333"]
+    assert set(scheduler._index) == {"123", "222", "333", "444"}
+
+
+def test_stale_background_scan_is_dropped_after_synchronous_check():
+    app = qtcore.QCoreApplication.instance() or qtcore.QCoreApplication([])
+    captured = []
+    scheduler = DeadlineScheduler(
+        repo=Repo(),
+        emitter=lambda n: captured.append(n),
+        time_provider=FixedTimeProvider(datetime(2026, 1, 10, 8, 0, 0)),
+    )
+
+    scheduler.request_sync(Repo().list_open_demands()[:1], full=True)
+    scheduler.check_now()
+    emitted = len(captured)
+
+    deadline = qtcore.QDeadlineTimer(5000)
+    while scheduler.is_scanning() and not deadline.hasExpired():
+        app.processEvents(qtcore.QEventLoop.AllEvents, 50)
+
+    assert not scheduler.is_scanning()
+    assert len(captured) == emitted
+    assert set(scheduler._index) == {"123", "222", "333", "444"}
+
+
+def test_multi_date_prazo_announces_each_milestone_with_one_heap_entry():
+    qtcore.QCoreApplication.instance() or qtcore.QCoreApplication([])
+    captured = []
+    clock = FixedTimeProvider(datetime(2026, 1, 10, 8, 0, 0))
+    scheduler = DeadlineScheduler(repo=Repo(), emitter=lambda n: captured.append(n), time_provider=clock)
+
+    scheduler.sync([{"ID": "7", "Prazo": "09/01/2026, 12/01/2026, 20/01/2026"}])
+    assert [(n.type, n.payload["deadline_date"]) for n in captured] == [(NotificationType.PRAZO_ESTOURADO, "2026-01-09")]
+    assert len(scheduler._heap) == 1
+
+    fired = []
+    for moment in (datetime(2026, 1, 11, 0, 0), datetime(2026, 1, 13, 0, 0), datetime(2026, 1, 19, 0, 0), datetime(2026, 1, 21, 0, 0)):
+        assert scheduler._heap[0][0] == moment
+        captured.clear()
+        clock.current = moment
+        scheduler._on_timer()
+        fired.extend((n.type, n.payload["deadline_date"]) for n in captured)
+
+    assert fired == [
+        (NotificationType.PRAZO_PROXIMO, "2026-01-12"),
+        (NotificationType.PRAZO_ESTOURADO, "2026-01-12"),
+        (NotificationType.PRAZO_PROXIMO, "2026-01-20"),
+        (NotificationType.PRAZO_ESTOURADO, "2026-01-20"),
+    ]
+    assert scheduler._heap == []
+
+
+def test_pruned_retention_does_not_reannounce_current_deadlines(tmp_path):
+    qtcore.QCoreApplication.instance() or qtcore.QCoreApplication([])
+    from notifications.models import Preferences
+    from notifications.store import NotificationStore
+
+    store = NotificationStore(str(tmp_path))
+    sent = []
+
+    def batch_emitter(notifications):
+        sent.extend(n for n, _ in store.insert_many(list(notifications)))
+
+    now = datetime(2026, 1, 10, 8, 0, 0)
+    scheduler = DeadlineScheduler(repo=Repo(), emitter=lambda n: None, batch_emitter=batch_emitter, time_provider=FixedTimeProvider(now))
+    scheduler.check_now()
+    assert len(sent) == 3
+    store.mark_all_read()
+    with store._connect() as con:
+        con.execute("UPDATE notified_occurrences SET updated_at = '2020-01-01T00:00:00-03:00'")
+
+    # A varredura completa renova as ocorrências ainda atuais antes da retenção.
+    scheduler.check_now()
+    pref = Preferences(retention_days=0, retention_max_read=0, occurrence_retention_days=365, occurrence_max_acknowledged=0)
+    store.prune(pref)
+    scheduler.check_now()
+
+    assert len(sent) == 3
@@ -67,3 +67,281 @@ def test_store_marks_occurrence_as_already_notified_after_read_or_delete(tmp_pat
 
     store.delete_notification(notif_id)
     assert store.should_dispatch(notif) is False
+
+
+def test_store_reuses_one_wal_connection(tmp_path):
+    store = NotificationStore(str(tmp_path))
+    with store._connect() as con:
+        first = con
+        assert con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    store.insert(Notification(type=NotificationType.NOVA_DEMANDA, title="t", body="b"))
+    with store._connect() as con:
+        assert con is first
+    assert store.count_unread() == 1
+    store.close()
+
+
+def test_history_log_appends_events_and_compacts_to_same_state(tmp_path):
+    store = NotificationStore(str(tmp_path))
+    ids = [
+        store.insert(Notification(type=NotificationType.NOVA_DEMANDA, title=f"Demanda {i}", body="b", timestamp=datetime(2026, 1, 1, 10, i)))
+        for i in range(3)
+    ]
+    size_before = os.path.getsize(store.enc_csv_path)
+    store.mark_as_read(ids[0])
+    store.delete_notification(ids[1])
+    assert os.path.getsize(store.enc_csv_path) > size_before
+
+    with open(store.enc_csv_path, "rb") as f:
+        assert b"Demanda" not in f.read()
+
+    expected = [(ids[0], "Demanda 0", "1"), (ids[2], "Demanda 2", "0")]
+    assert [(int(r[1]), r[4], r[7]) for r in store.read_history()] == expected
+
+    store.compact_history()
+    with open(store.enc_csv_path, "rb") as f:
+        assert len([line for line in f.read().split(b"\n") if line]) == 2
+    assert [(int(r[1]), r[4], r[7]) for r in store.read_history()] == expected
+
+
+def test_legacy_history_snapshot_is_rewritten_before_first_append(tmp_path):
+    from notifications.store import ENC_MAGIC
+
+    store = NotificationStore(str(tmp_path))
+    old_id = store.insert(Notification(type=NotificationType.NOVA_DEMANDA, title="Antiga", body="b", timestamp=datetime(2026, 1, 1, 9, 0)))
+    # Formato anterior: um único snapshot separado por vírgulas, sem coluna event e sem quebra de linha final.
+    legacy_csv = f"id,timestamp,type,title,body,payload_json,read\r\n{old_id},2026-01-01T09:00:00,nova_demanda,Antiga,b,{{}},0\r\n"
+    with open(store.enc_csv_path, "wb") as f:
+        f.write(ENC_MAGIC + b"\n" + store._encrypt_record(legacy_csv.encode("utf-8")))
+    store.close()
+
+    store = NotificationStore(str(tmp_path))
+    new_id = store.insert(Notification(type=NotificationType.NOVA_DEMANDA, title="Nova", body="b", timestamp=datetime(2026, 1, 1, 10, 0)))
+
+    assert [(int(r[1]), r[4]) for r in store.read_history()] == [(old_id, "Antiga"), (new_id, "Nova")]
+
+
+def test_history_append_starts_on_a_new_line(tmp_path):
+    store = NotificationStore(str(tmp_path))
+    first = store.insert(Notification(type=NotificationType.NOVA_DEMANDA, title="Um", body="b", timestamp=datetime(2026, 1, 1, 9, 0)))
+    with open(store.enc_csv_path, "rb+") as f:
+        f.seek(-1, os.SEEK_END)
+        f.truncate()
+    second = store.insert(Notification(type=NotificationType.NOVA_DEMANDA, title="Dois", body="b", timestamp=datetime(2026, 1, 1, 10, 0)))
+
+    assert [int(r[1]) for r in store.read_history()] == [first, second]
+
+
+def test_unread_counter_tracks_writes_and_indexes_exist(tmp_path):
+    store = NotificationStore(str(tmp_path))
+    ids = [store.insert(Notification(type=NotificationType.NOVA_DEMANDA, title=f"t{i}", body="b")) for i in range(3)]
+    store.insert(Notification(type=NotificationType.NOVA_DEMANDA, title="lida", body="b", read=True))
+    assert store.count_unread() == 3
+
+    store.mark_as_read(ids[0])
+    store.mark_as_read(ids[0])
+    store.delete_notification(ids[1])
+    store.delete_notification(ids[0])
+    assert store.count_unread() == 1
+    store.mark_as_unread(ids[2])
+    assert store.count_unread() == 1
+
+    reopened = NotificationStore(str(tmp_path))
+    assert reopened.count_unread() == 1
+    with reopened._connect() as con:
+        indexes = {row["name"] for row in con.execute("PRAGMA index_list(notifications)")}
+        plan = " ".join(str(row[-1]) for row in con.execute("EXPLAIN QUERY PLAN SELECT id FROM notifications WHERE type = ? AND read = ? ORDER BY id DESC", ("NOVA_DEMANDA", 0)))
+    assert {"idx_notifications_read_id", "idx_notifications_type_read_id", "idx_notifications_occurrence_key"} <= indexes
+    assert "idx_notifications_type_read_id" in plan
+
+
+def test_prune_removes_old_and_excess_read_items_only(tmp_path):
+    from notifications.models import Preferences
+
+    store = NotificationStore(str(tmp_path))
+    old_read = store.insert(Notification(type=NotificationType.NOVA_DEMANDA, title="velha", body="b", timestamp=datetime(2020, 1, 1, 8, 0)))
+    old_unread = store.insert(Notification(type=NotificationType.NOVA_DEMANDA, title="velha não lida", body="b", timestamp=datetime(2020, 1, 1, 9, 0)))
+    recent = [
+        store.insert(Notification(type=NotificationType.NOVA_DEMANDA, title=f"r{i}", body="b", timestamp=datetime(2026, 1, 1, 8, i)))
+        for i in range(3)
+    ]
+    for notification_id in [old_read, *recent]:
+        store.mark_as_read(notification_id)
+
+    pref = Preferences(retention_days=30, retention_max_read=2, occurrence_retention_days=0, occurrence_max_acknowledged=0)
+    removed = store.prune(pref, now=datetime(2026, 1, 10, 8, 0))
+
+    assert removed == 2
+    assert {n.id for n in store.list_notifications()} == {old_unread, recent[1], recent[2]}
+    assert store.count_unread() == 1
+    with store._connect() as con:
+        assert con.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+    pref = Preferences(retention_days=0, retention_max_read=0, occurrence_retention_days=0, occurrence_max_acknowledged=1)
+    assert store.prune(pref) == 3
+    assert store.database_size_bytes() > 0
+
+
+def test_existing_database_switches_to_incremental_vacuum_on_first_prune(tmp_path):
+    import sqlite3
+
+    con = sqlite3.connect(str(tmp_path / "notifications.db"))
+    con.execute("CREATE TABLE legado (id INTEGER)")
+    con.commit()
+    con.close()
+
+    store = NotificationStore(str(tmp_path))
+    with store._connect() as con:
+        assert con.execute("PRAGMA auto_vacuum").fetchone()[0] != 2
+    assert store._vacuum_pending
+
+    # O VACUUM roda fora do lock compartilhado com a interface; só a reabertura espera.
+    import threading
+
+    with store._lock:
+        worker = threading.Thread(target=store._convert_to_incremental_vacuum)
+        worker.start()
+        for _ in range(200):
+            check = sqlite3.connect(str(tmp_path / "notifications.db"))
+            mode = check.execute("PRAGMA auto_vacuum").fetchone()[0]
+            check.close()
+            if mode == 2:
+                break
+            worker.join(0.01)
+        assert mode == 2
+    worker.join(5)
+    with store._connect() as con:
+        assert con.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    assert not store._vacuum_pending
+
+
+def test_preferences_are_cached_until_saved_or_muted(tmp_path):
+    store = NotificationStore(str(tmp_path))
+    first = store.load_preferences()
+
+    reads = []
+    original_read = store._read_preferences
+    store._read_preferences = lambda: (reads.append(True), original_read())[1]
+
+    first.scheduler_interval_minutes = 99
+    assert store.load_preferences().scheduler_interval_minutes == 15
+    assert reads == []
+
+    first.scheduler_interval_minutes = 30
+    store.save_preferences(first)
+    assert store.load_preferences().scheduler_interval_minutes == 30
+    assert store.load_preferences().scheduler_interval_minutes == 30
+    assert reads == [True]
+
+    store.mute_for_seconds(60)
+    assert store.load_preferences().is_muted(0)
+    assert store.load_preferences().scheduler_interval_minutes == 30
+    assert len(reads) == 2
+
+
+def test_notification_pages_use_keyset_pagination_without_payload(tmp_path):
+    store = NotificationStore(str(tmp_path))
+    ids = [
+        store.insert(
+            Notification(
+                type=NotificationType.NOVA_DEMANDA if i % 2 else NotificationType.PRAZO_PROXIMO,
+                title=f"Aviso {i}",
+                body="Corpo",
+                payload={"demand_id": str(i)},
+                timestamp=datetime(2026, 1, 1, 10, i),
+            )
+        )
+        for i in range(7)
+    ]
+
+    first = store.list_notification_page(limit=3)
+    second = store.list_notification_page(before_id=first[-1].id, limit=3)
+    third = store.list_notification_page(before_id=second[-1].id, limit=3)
+    assert [n.id for n in first + second + third] == list(reversed(ids))
+    assert not hasattr(first[0], "payload")
+    assert first[0].timestamp_display() == "01/01/2026 10:06"
+
+    novas = store.list_notification_page(type_filter=NotificationType.NOVA_DEMANDA, before_id=ids[5], limit=10)
+    assert [n.id for n in novas] == [ids[3], ids[1]]
+
+
+def test_bulk_updates_run_in_one_transaction_with_one_history_record(tmp_path):
+    store = NotificationStore(str(tmp_path))
+    inserted = store.insert_many(
+        [
+            Notification(
+                type=NotificationType.PRAZO_PROXIMO,
+                title=f"Prazo #{i}",
+                body="Vence hoje.",
+                payload={"demand_id": str(i), "deadline_date": "2026-01-10", "event_code": "deadline_due"},
+            )
+            for i in range(6)
+        ]
+    )
+    ids = [notification_id for _, notification_id in inserted]
+    history_calls = []
+    original_record = store._record_history
+    store._record_history = lambda rows: (history_calls.append(len(rows)), original_record(rows))
+
+    assert store.mark_many_read(ids[:4]) == 4
+    assert store.count_unread() == 2
+    assert store.mark_many_unread(ids[:2]) == 2
+    assert store.count_unread() == 4
+    assert store.delete_many([ids[0], ids[5]]) == 2
+    assert store.count_unread() == 2
+    assert history_calls == [4, 2, 2]
+
+    with store._connect() as con:
+        acknowledged = con.execute("SELECT COUNT(1) FROM notified_occurrences WHERE acknowledged = 1").fetchone()[0]
+    assert acknowledged == 5
+
+    assert store.mark_all_read() == 2
+    assert store.count_unread() == 0
+    assert {row[1]: row[7] for row in store.read_history()} == {str(i): "1" for i in ids[1:5]}
+
+
+def test_full_text_search_ranks_matches_and_follows_deletes(tmp_path):
+    store = NotificationStore(str(tmp_path))
+    overdue = store.insert(Notification(type=NotificationType.PRAZO_ESTOURADO, title="Demanda #1234 atrasada", body="Prazo em 09/01/2026."))
+    store.insert(Notification(type=NotificationType.NOVA_DEMANDA, title="Nova demanda atribuída", body="Demanda #1234 criada com sucesso."))
+    other = store.insert(Notification(type=NotificationType.PRAZO_ESTOURADO, title="Demanda #77 atrasada", body="Prazo em 01/01/2026."))
+
+    assert {n.id for n in store.search_notifications("1234")} == {overdue, overdue + 1}
+    assert [n.id for n in store.search_notifications("atras 1234")] == [overdue]
+    assert [n.id for n in store.search_notifications("ATRASADA", type_filter=NotificationType.PRAZO_ESTOURADO, limit=1, offset=1)] in ([overdue], [other])
+    assert store.search_notifications("atribuida")[0].title == "Nova demanda atribuída"
+
+    store.delete_many([overdue])
+    assert [n.id for n in store.search_notifications("atrasada")] == [other]
+    assert store.search_notifications("  ") == []
+
+
+def test_search_pages_cover_ranked_window_and_older_matches_once(tmp_path, monkeypatch):
+    import notifications.store as store_module
+
+    monkeypatch.setattr(store_module, "SEARCH_RANK_WINDOW", 4)
+    store = NotificationStore(str(tmp_path))
+    ids = [
+        store.insert(Notification(type=NotificationType.NOVA_DEMANDA, title=f"Demanda {i}", body="Criada." + " criada" * (i % 3)))
+        for i in range(11)
+    ]
+
+    pages = [store.search_notifications("criada", offset=offset, limit=3) for offset in range(0, 12, 3)]
+    found = [n.id for page in pages for n in page]
+    assert sorted(found) == ids
+    # Fora da janela ranqueada, as mais antigas seguem por data.
+    assert found[4:] == sorted(ids[:7], reverse=True)
+
+
+def test_like_fallback_treats_wildcards_literally(tmp_path):
+    store = NotificationStore(str(tmp_path))
+    store._fts_enabled = False
+    titles = ["Meta 100% atingida", "Meta 1000 atingida", "campo a_b alterado", "campo axb alterado", "pasta c:\\temp"]
+    for i, title in enumerate(titles):
+        store.insert(Notification(type=NotificationType.NOVA_DEMANDA, title=title, body="b", timestamp=datetime(2026, 1, 1, 8, i)))
+
+    assert [n.title for n in store.search_notifications("100%")] == ["Meta 100% atingida"]
+    assert [n.title for n in store.search_notifications("a_b")] == ["campo a_b alterado"]
+    assert [n.title for n in store.search_notifications("c:\\temp")] == ["pasta c:\\temp"]
+    assert len(store.search_notifications("atingida")) == 2
@@ -0,0 +1,117 @@
+from datetime import date
+
+import pytest
+
+qtwidgets = pytest.importorskip("PySide6.QtWidgets", reason="PySide6 indisponível no ambiente de teste", exc_type=ImportError)
+
+from app import MainWindow, VISIBLE_COLUMNS, ROW_MODE_ELIDED, ROW_MODE_WRAP
+from csv_store import CsvStore
+
+QApplication = qtwidgets.QApplication
+QMessageBox = qtwidgets.QMessageBox
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _close_window(win, monkeypatch):
+    # closeEvent pede confirmação em um QMessageBox modal.
+    monkeypatch.setattr(QMessageBox, "exec", lambda dialog: QMessageBox.Yes)
+    win.close()
+
+
+def _build_store(tmp_path, total: int = 3):
+    store = CsvStore(str(tmp_path))
+    today = date.today().strftime("%d/%m/%Y")
+    for i in range(total):
+        store.add(
+            {
+                "Projeto": f"Projeto {i}",
+                "Descrição": f"Descrição longa da demanda {i} " * 6,
+                "Prioridade": "Alta",
+                "Prazo": today,
+                "Data de Registro": today,
+                "Status": "Em andamento",
+                "Responsável": "Ana",
+                "% Conclusão": "0.5",
+            }
+        )
+    return store
+
+
+def test_wrap_mode_only_remeasures_changed_rows(tmp_path, monkeypatch):
+    _get_app()
+    store = _build_store(tmp_path)
+    win = MainWindow(store)
+    table = win.t3_table
+
+    measured = []
+    original = table.resizeRowToContents
+    table.resizeRowToContents = lambda row: (measured.append(row), original(row))
+
+    win.refresh_tab3()
+    assert measured == []
+
+    changed = store.rows[0]
+    store.update(changed._id, {"Descrição": "Texto curto"})
+    win.refresh_tab3()
+    assert len(measured) == 1
+
+    measured.clear()
+    table.setColumnWidth(VISIBLE_COLUMNS.index("Projeto"), table.columnWidth(VISIBLE_COLUMNS.index("Projeto")) + 40)
+    win.refresh_tab3()
+    assert len(measured) == table.rowCount()
+    _close_window(win, monkeypatch)
+
+
+def test_elided_mode_uses_fixed_rows_and_tooltips(tmp_path, monkeypatch):
+    _get_app()
+    store = _build_store(tmp_path, total=1)
+    win = MainWindow(store)
+
+    win._set_row_mode(ROW_MODE_ELIDED)
+    table = win.t3_table
+    desc_item = table.item(0, VISIBLE_COLUMNS.index("Descrição"))
+
+    assert table.wordWrap() is False
+    assert desc_item.toolTip() == desc_item.text()
+    assert table.rowHeight(0) == table.verticalHeader().defaultSectionSize()
+
+    win._set_row_mode(ROW_MODE_WRAP)
+    assert win.t3_table.wordWrap() is True
+    assert win.t3_table.item(0, VISIBLE_COLUMNS.index("Descrição")).toolTip() == ""
+    _close_window(win, monkeypatch)
+
+
+def test_row_mode_switch_refreshes_tab1_table(tmp_path, monkeypatch):
+    _get_app()
+    store = _build_store(tmp_path, total=1)
+    win = MainWindow(store)
+    win._fill(win.t1_table, store.build_view())
+    table = win.t1_table
+    desc_col = VISIBLE_COLUMNS.index("Descrição")
+
+    win._set_row_mode(ROW_MODE_ELIDED)
+    assert table.item(0, desc_col).toolTip() == table.item(0, desc_col).text()
+    assert table.rowHeight(0) == table.verticalHeader().defaultSectionSize()
+
+    win._set_row_mode(ROW_MODE_WRAP)
+    assert table.item(0, desc_col).toolTip() == ""
+    _close_window(win, monkeypatch)
+
+
+def test_row_height_cache_drops_deleted_demands(tmp_path, monkeypatch):
+    _get_app()
+    store = _build_store(tmp_path)
+    win = MainWindow(store)
+    win.refresh_tab3()
+    assert len(win._row_height_cache["t3"]) == 3
+
+    store.delete_by_id(store.rows[0]._id)
+    win.refresh_tab3()
+    assert set(win._row_height_cache["t3"]) == {dr._id for dr in store.rows}
+    _close_window(win, monkeypatch)
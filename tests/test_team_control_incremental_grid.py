@@ -0,0 +1,128 @@
+from datetime import date
+
+import pytest
+
+qtwidgets = pytest.importorskip("PySide6.QtWidgets", reason="PySide6 indisponível no ambiente de teste", exc_type=ImportError)
+
+from app import MainWindow
+from csv_store import CsvStore
+from team_control import TeamControlStore
+
+QApplication = qtwidgets.QApplication
+QMessageBox = qtwidgets.QMessageBox
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _build_window(tmp_path):
+    today = date.today()
+    team = TeamControlStore(str(tmp_path))
+    team.set_period(today.year, today.month)
+    section = team.create_section("Time Azul")
+    team.add_member(section.id, "Ana")
+    team.add_member(section.id, "Bia")
+    win = MainWindow(CsvStore(str(tmp_path)))
+    return win, today
+
+
+def _section_table(win):
+    return win._team_section_pool[0][1]
+
+
+def _close_window(win, monkeypatch):
+    # closeEvent pede confirmação em um QMessageBox modal.
+    monkeypatch.setattr(QMessageBox, "exec", lambda dialog: QMessageBox.Yes)
+    win.close()
+
+
+def test_cell_edit_updates_totals_in_place_without_reloading(tmp_path, monkeypatch):
+    _get_app()
+    win, today = _build_window(tmp_path)
+    table = _section_table(win)
+    month_part_col = table.columnCount() - 1
+    footer_row = table.rowCount() - 1
+
+    loads = []
+    monkeypatch.setattr(win.team_store, "load", lambda: loads.append(True))
+    rebuilds = []
+    monkeypatch.setattr(table, "fit_height_to_rows", lambda: rebuilds.append(True))
+
+    table.item(0, 1).setText("k")
+    table.item(1, 1).setText("P")
+
+    assert table.item(0, 1).text() == "K"
+    assert table.item(0, month_part_col).text() == "1"
+    assert table.item(footer_row, 1).text() == "2"
+    assert win._team_section_pool[0][1] is table
+    assert loads == [] and rebuilds == []
+
+    table.item(0, 1).setText("")
+    assert table.item(0, month_part_col).text() == "0"
+    assert table.item(footer_row, 1).text() == "1"
+
+    reloaded = TeamControlStore(str(tmp_path))
+    reloaded.set_period(today.year, today.month)
+    assert reloaded.sections[0].members[1].entries == {date(today.year, today.month, 1).isoformat(): "P"}
+    _close_window(win, monkeypatch)
+
+
+def test_period_switch_reuses_pooled_tables(tmp_path, monkeypatch):
+    _get_app()
+    win, today = _build_window(tmp_path)
+    table = _section_table(win)
+
+    other_month = 1 if today.month != 1 else 2
+    win.tc_month.setCurrentText(f"{other_month:02d}")
+    win.refresh_team_control()
+    assert win._team_section_pool[0][0].isHidden()
+    assert not win._team_empty_label.isHidden()
+
+    win.tc_month.setCurrentText(f"{today.month:02d}")
+    win.refresh_team_control()
+    assert win._team_section_pool[0][1] is table
+    assert not win._team_section_pool[0][0].isHidden()
+    assert table.rowCount() == 3
+    assert table.item(1, 0).text() == "Bia"
+    _close_window(win, monkeypatch)
+
+
+def test_clipboard_paste_applies_block_in_one_write(tmp_path, monkeypatch):
+    _get_app()
+    win, today = _build_window(tmp_path)
+    table = _section_table(win)
+    footer_row = table.rowCount() - 1
+    month_part_col = table.columnCount() - 1
+
+    writes = []
+    original_write = win.team_store._write_json
+    monkeypatch.setattr(win.team_store, "_write_json", lambda path, payload: (writes.append(path), original_write(path, payload)))
+
+    table.setCurrentCell(0, 2)
+    assert win._paste_team_cells(table, "K\tp\t\r\nA\tK\tK\r\n")
+
+    assert [table.item(0, c).text() for c in (2, 3, 4)] == ["K", "P", ""]
+    assert [table.item(1, c).text() for c in (2, 3, 4)] == ["A", "K", "K"]
+    assert table.item(0, month_part_col).text() == "2"
+    assert table.item(footer_row, 3).text() == "2"
+    assert len(writes) == 1
+    _close_window(win, monkeypatch)
+
+
+def test_clipboard_paste_rejects_unknown_codes_before_writing(tmp_path, monkeypatch):
+    _get_app()
+    win, today = _build_window(tmp_path)
+    table = _section_table(win)
+    warnings = []
+    monkeypatch.setattr(QMessageBox, "warning", lambda *args, **kwargs: warnings.append(args[1:3]))
+
+    table.setCurrentCell(0, 1)
+    assert win._paste_team_cells(table, "K\tX\n")
+    assert len(warnings) == 1
+    assert table.item(0, 1).text() == ""
+    assert dict(win.team_store.sections[0].members[0].entries) == {}
+    _close_window(win, monkeypatch)
@@ -1,6 +1,6 @@
 from datetime import date
 
-from team_control import TeamControlStore, participation_for_date, build_team_control_report_rows, monthly_k_count, split_member_names
+from team_control import DayCodes, TeamControlStore, daily_participation, participation_for_date, build_team_control_report_rows, monthly_k_count, split_member_names
 
 
 def test_create_section_member_and_entries(tmp_path):
@@ -171,3 +171,193 @@ def test_to_payload_returns_json_serializable_structure(tmp_path):
     period_key = store._period_key(date.today().year, date.today().month)
     assert payload["periods"][period_key]["sections"][0]["name"] == "Time Serial"
 
+
+
+def test_set_entries_bulk_writes_file_once_and_compact(tmp_path, monkeypatch):
+    import json
+
+    store = TeamControlStore(str(tmp_path))
+    section = store.create_section("Time Lote")
+    members = [store.add_member(section.id, f"Pessoa {i}") for i in range(20)]
+
+    writes = []
+    original_write = store._write_json
+    monkeypatch.setattr(store, "_write_json", lambda path, payload: (writes.append(path), original_write(path, payload)))
+
+    updates = [(m.id, date(2026, 2, d), "K") for m in members for d in range(1, 29)]
+    assert store.set_entries_bulk(section.id, updates) == len(updates)
+    assert len(writes) == 1
+
+    with open(store._period_path(store._active_period), "r", encoding="utf-8") as f:
+        text = f.read()
+    assert "\n" not in text
+    assert json.loads(text)["sections"]
+
+    reloaded = TeamControlStore(str(tmp_path))
+    assert monthly_k_count(reloaded.sections[0].members[19], 2026, 2) == 28
+
+
+def test_batch_persists_changes_even_when_block_fails(tmp_path):
+    store = TeamControlStore(str(tmp_path))
+    section = store.create_section("Time Lote")
+
+    try:
+        with store.batch():
+            store.add_member(section.id, "Alice")
+            store.add_member(section.id, "")
+    except ValueError:
+        pass
+
+    reloaded = TeamControlStore(str(tmp_path))
+    assert [m.name for m in reloaded.sections[0].members] == ["Alice"]
+
+
+def test_load_inside_batch_keeps_pending_changes(tmp_path):
+    store = TeamControlStore(str(tmp_path))
+    section = store.create_section("Time Lote")
+
+    with store.batch():
+        store.add_member(section.id, "Alice")
+        store.load()
+        assert [m.name for m in store.sections[0].members] == ["Alice"]
+        store.add_member(section.id, "Bruno")
+
+    reloaded = TeamControlStore(str(tmp_path))
+    assert [m.name for m in reloaded.sections[0].members] == ["Alice", "Bruno"]
+
+
+def test_legacy_single_file_is_migrated_to_period_files(tmp_path):
+    import json
+    import os
+
+    legacy = {
+        "periods": {
+            "2025-12": {"sections": [{"id": "s1", "name": "Time Antigo", "members": [{"id": "m1", "name": "Ana", "entries": {"2025-12-01": "K"}}]}]},
+            "2026-01": {"sections": [{"id": "s2", "name": "Time Novo", "members": []}]},
+        }
+    }
+    with open(os.path.join(tmp_path, "team_control.json"), "w", encoding="utf-8") as f:
+        json.dump(legacy, f)
+
+    store = TeamControlStore(str(tmp_path))
+
+    assert sorted(os.listdir(os.path.join(tmp_path, "team_control"))) == ["2025-12.json", "2026-01.json"]
+    assert not os.path.exists(os.path.join(tmp_path, "team_control.json"))
+    store.set_period(2025, 12)
+    assert store.sections[0].members[0].entries == {"2025-12-01": "K"}
+    payload = store.to_payload()
+    assert list(payload["periods"]) == ["2025-12", "2026-01"]
+    assert payload["periods"]["2025-12"]["sections"][0]["members"][0]["days"] == {"2025-12": "K"}
+
+
+def test_only_recent_periods_stay_in_memory(tmp_path):
+    from team_control import PERIOD_CACHE_SIZE
+
+    store = TeamControlStore(str(tmp_path))
+    for month in range(1, 13):
+        store.set_period(2025, month)
+        store.create_section(f"Time {month:02d}")
+
+    assert len(store._period_sections) <= PERIOD_CACHE_SIZE
+    assert len(store.to_payload()["periods"]) == 12
+
+    store.set_period(2025, 1)
+    assert [s.name for s in store.sections] == ["Time 01"]
+
+
+def test_restore_payload_replaces_all_periods(tmp_path):
+    store = TeamControlStore(str(tmp_path))
+    store.set_period(2025, 5)
+    store.create_section("Será removido")
+
+    store.restore_payload({"periods": {"2025-06": {"sections": [{"id": "x", "name": "Restaurado", "members": []}]}}})
+
+    reloaded = TeamControlStore(str(tmp_path))
+    assert list(reloaded.to_payload()["periods"]) == ["2025-06"]
+    assert [s.name for s in reloaded.get_sections_for_period(2025, 6)] == ["Restaurado"]
+
+
+def test_day_codes_keep_dict_semantics_and_compact_json():
+    codes = DayCodes({"2026-02-02": "K", "2026-02-03": "P", "2026-03-01": "A", "obs": "texto"})
+
+    assert codes["2026-02-02"] == "K"
+    assert codes.get("2026-02-04", "") == ""
+    assert "obs" in codes and len(codes) == 4
+    assert codes.month_codes(2026, 2)[:4] == ["", "K", "P", ""]
+    assert len(codes.month_codes(2026, 2)) == 28
+    assert codes.count_codes(2026, 2, "KP") == 2
+
+    codes.pop("2026-03-01")
+    assert codes.to_json() == {"days": {"2026-02": ".KP"}, "entries": {"obs": "texto"}}
+    assert DayCodes.from_json(codes.to_json()) == codes
+
+
+def test_members_read_legacy_entries_and_count_daily_participation(tmp_path):
+    store = TeamControlStore(str(tmp_path))
+    section = store.create_section("Time Legado")
+    alice = store.add_member(section.id, "Alice")
+    bob = store.add_member(section.id, "Bruno")
+    legacy_sections = [
+        {"id": section.id, "name": section.name, "members": [
+            {"id": alice.id, "name": "Alice", "entries": {"2026-02-02": "K", "2026-02-03": "A"}},
+            {"id": bob.id, "name": "Bruno", "entries": {"2026-02-02": "P"}},
+        ]}
+    ]
+    members = store._parse_sections(legacy_sections)[0].members
+
+    assert daily_participation(members, 2026, 2)[:3] == [0, 2, 0]
+    assert monthly_k_count(members[0], 2026, 2) == 1
+
+
+def test_range_analytics_aggregate_months_and_reuse_cached_rollups(tmp_path, monkeypatch):
+    import team_control
+    from team_control import team_analytics, yearly_team_analytics
+
+    store = TeamControlStore(str(tmp_path))
+    for month, codes in [(1, {2: "K", 3: "A"}), (2, {2: "P", 3: "F"})]:
+        store.set_period(2026, month)
+        section = store.create_section("Time Azul")
+        member = store.add_member(section.id, "Alice")
+        for day, code in codes.items():
+            store.set_entry(section.id, member.id, date(2026, month, day), code)
+
+    yearly = yearly_team_analytics(store, 2026)
+    assert yearly.members[("Time Azul", "Alice")] == {"P": 1, "A": 1, "K": 1, "F": 1, "D": 0, "H": 0, "R": 0}
+    assert yearly.sections["Time Azul"]["K"] == 1
+    assert yearly.daily_participation["Time Azul"] == {date(2026, 1, 2): 1, date(2026, 2, 2): 1}
+
+    partial = team_analytics(store, date(2026, 1, 3), date(2026, 2, 2))
+    assert partial.members[("Time Azul", "Alice")]["A"] == 1
+    assert partial.members[("Time Azul", "Alice")]["K"] == 0
+    assert partial.members[("Time Azul", "Alice")]["P"] == 1
+
+    built = []
+    original = team_control.build_month_rollup
+    monkeypatch.setattr(team_control, "build_month_rollup", lambda *a, **k: (built.append(a[1:3]), original(*a, **k))[1])
+    yearly_team_analytics(store, 2026)
+    assert built == []
+
+    store.set_period(2026, 2)
+    store.set_entry(store.sections[0].id, store.sections[0].members[0].id, date(2026, 2, 4), "K")
+    assert yearly_team_analytics(store, 2026).members[("Time Azul", "Alice")]["K"] == 2
+    assert built == [(2026, 2)]
+
+
+def test_streaming_analytics_csv_has_monthly_and_total_rows(tmp_path):
+    import csv
+
+    from team_control import write_team_analytics_csv
+
+    store = TeamControlStore(str(tmp_path))
+    store.set_period(2026, 3)
+    section = store.create_section("Time Verde")
+    member = store.add_member(section.id, "Bruna")
+    store.set_entry(section.id, member.id, date(2026, 3, 2), "K")
+
+    out = tmp_path / "anual.csv"
+    write_team_analytics_csv(str(out), store, date(2026, 1, 1), date(2026, 12, 31))
+
+    with open(out, newline="", encoding="utf-8-sig") as f:
+        rows = list(csv.reader(f, delimiter=";"))
+    assert ["03/2026", "Time Verde", "Bruna", "0", "0", "1", "0", "0", "0", "0", "1"] in rows
+    assert ["", "Time Verde", "Total do time", "0", "0", "1", "0", "0", "0", "0", "1"] in rows
@@ -0,0 +1,27 @@
+import pytest
+
+pytest.importorskip("PySide6.QtGui", reason="PySide6 indisponível no ambiente de teste", exc_type=ImportError)
+
+from team_control import STATUS_COLORS
+from ui_style_cache import bold_font, priority_brush, progress_fill_color, status_brush, team_code_brushes
+from ui_theme import PROGRESS_FILL_COLOR, status_color
+
+
+def test_brushes_are_shared_and_match_theme():
+    brush = status_brush("Em andamento")
+    assert status_brush("Em andamento") is brush
+    assert brush.color().getRgb()[:3] == status_color("Em andamento")
+
+    assert priority_brush("Alta") is priority_brush("Alta")
+    assert priority_brush("Sem prioridade") is None
+
+    assert progress_fill_color().getRgb() == (*PROGRESS_FILL_COLOR, 190)
+    assert bold_font(12) is bold_font(12)
+    assert bold_font(12).bold()
+
+
+def test_team_code_brushes_follow_status_colors():
+    bg, fg = team_code_brushes("P")
+    assert bg.color().getRgb()[:3] == STATUS_COLORS["P"][:3]
+    assert fg.color().getRgb()[:3] == STATUS_COLORS["P"][3:]
+    assert team_code_brushes("?") is None
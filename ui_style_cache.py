@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from PySide6.QtGui import QBrush, QColor, QFont
+
+from team_control import STATUS_COLORS
+from ui_theme import (
+    PRAZO_TODAY_BG,
+    PROGRESS_FILL_COLOR,
+    TEAM_FOOTER_BG,
+    TEAM_PARTICIPATION_BG,
+    TEAM_TODAY_HEADER_BG,
+    TEAM_TOTAL_FG,
+    TEAM_WEEKEND_BG,
+    priority_text_color,
+    status_color,
+    timing_color,
+)
+
+# Cache de cores/pincéis/fontes compartilhado pelo processo inteiro.
+# Os objetos devolvidos são compartilhados: use-os apenas para leitura
+# (setBackground/setForeground/setFont copiam o valor).
+
+
+@lru_cache(maxsize=None)
+def rgb_color(rr: int, gg: int, bb: int, alpha: int = 255) -> QColor:
+    return QColor(rr, gg, bb, alpha)
+
+
+@lru_cache(maxsize=None)
+def rgb_brush(rr: int, gg: int, bb: int, alpha: int = 255) -> QBrush:
+    return QBrush(rgb_color(rr, gg, bb, alpha))
+
+
+@lru_cache(maxsize=256)
+def status_brush(status: str) -> QBrush:
+    return rgb_brush(*status_color(status))
+
+
+@lru_cache(maxsize=256)
+def timing_brush(timing: str) -> QBrush:
+    return rgb_brush(*timing_color(timing))
+
+
+@lru_cache(maxsize=64)
+def priority_brush(prioridade: str) -> Optional[QBrush]:
+    color = priority_text_color(prioridade)
+    return rgb_brush(*color) if color else None
+
+
+@lru_cache(maxsize=None)
+def team_code_brushes(code: str) -> Optional[Tuple[QBrush, QBrush]]:
+    """(fundo, texto) de uma legenda da grade de presenças, ou None se a legenda não existir."""
+    colors = STATUS_COLORS.get(code)
+    if not colors:
+        return None
+    br, bg, bb, fr, fg, fb = colors
+    return rgb_brush(br, bg, bb), rgb_brush(fr, fg, fb)
+
+
+def prazo_today_brush() -> QBrush:
+    return rgb_brush(*PRAZO_TODAY_BG)
+
+
+def progress_fill_color() -> QColor:
+    return rgb_color(*PROGRESS_FILL_COLOR, 190)
+
+
+def team_weekend_brush() -> QBrush:
+    return rgb_brush(*TEAM_WEEKEND_BG)
+
+
+def team_today_header_brush() -> QBrush:
+    return rgb_brush(*TEAM_TODAY_HEADER_BG)
+
+
+def team_participation_brush() -> QBrush:
+    return rgb_brush(*TEAM_PARTICIPATION_BG)
+
+
+def team_footer_brush() -> QBrush:
+    return rgb_brush(*TEAM_FOOTER_BG)
+
+
+def team_total_fg_brush() -> QBrush:
+    return rgb_brush(*TEAM_TOTAL_FG)
+
+
+@lru_cache(maxsize=32)
+def bold_font(pixel_size: int) -> QFont:
+    font = QFont()
+    font.setBold(True)
+    font.setPixelSize(pixel_size)
+    return font
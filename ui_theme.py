@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
 APP_STYLESHEET = """
 QWidget {
@@ -162,6 +162,27 @@ QCalendarWidget QToolButton::menu-indicator {
 """
 
 
+PRIORIDADE_TEXT_COLORS: Dict[str, Tuple[int, int, int]] = {
+    "alta": (220, 38, 38),   # vermelho
+    "média": (202, 138, 4),  # amarelo
+    "media": (202, 138, 4),  # fallback sem acento
+    "baixa": (22, 163, 74),  # verde
+}
+PRAZO_TODAY_BG = (255, 249, 196)  # amarelo claro
+PROGRESS_FILL_COLOR = (3, 141, 220)
+
+# Grade de presenças do time
+TEAM_TODAY_HEADER_BG = (220, 38, 38)
+TEAM_WEEKEND_BG = (229, 231, 235)
+TEAM_PARTICIPATION_BG = (229, 231, 235)
+TEAM_FOOTER_BG = (255, 255, 255)
+TEAM_TOTAL_FG = (0, 0, 0)
+
+
+def priority_text_color(prioridade: str) -> Optional[Tuple[int, int, int]]:
+    return PRIORIDADE_TEXT_COLORS.get((prioridade or "").strip().lower())
+
+
 def status_color(status: str) -> Tuple[int, int, int]:
     s = (status or "").strip().lower()
     if s == "concluído" or s == "concluido":